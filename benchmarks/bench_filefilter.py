@@ -0,0 +1,126 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+"""Benchmark for matching many file paths against configurations
+with many `files` and `ignores` patterns.
+
+Compares the compiled `FileFilter.accept()` with matching the
+patterns one by one, as it was done before, and measures
+`Config.compute_config_object()` for a configuration
+comprising many configuration objects, compared with
+matching the file filter of every configuration object.
+
+Usage:
+
+    python benchmarks/bench_filefilter.py [NUM_PATHS] [NUM_CONFIG_OBJECTS]
+"""
+
+import sys
+import timeit
+
+from xrlint.config import Config, ConfigObject
+from xrlint.util.filefilter import FileFilter
+
+NUM_REPEATS = 3
+
+EXTENSIONS = ("zarr", "nc", "h5", "levels", "json", "yaml", "txt", "md")
+
+
+def make_paths(num_paths: int) -> list[str]:
+    return [
+        f"s3://bucket/project-{i % 97}/region-{i % 13}"
+        f"/{'temp/' if i % 7 == 0 else ''}cube-{i}.{EXTENSIONS[i % len(EXTENSIONS)]}"
+        for i in range(num_paths)
+    ]
+
+
+def make_config(num_config_objects: int) -> Config:
+    objects = []
+    for i in range(num_config_objects):
+        ext = EXTENSIONS[i % len(EXTENSIONS)]
+        objects.append(
+            ConfigObject(
+                files=[f"**/project-{i}/**/*.{ext}", f"**/region-{i % 13}/*.{ext}"],
+                ignores=[f"**/temp/*.{ext}", f"!**/temp/cube-{i}.{ext}"],
+                settings={f"s{i}": i},
+            )
+        )
+    return Config(objects=objects)
+
+
+def accept_sequentially(file_filter: FileFilter, file_path: str) -> bool:
+    """The former implementation of `FileFilter.accept()`."""
+    if file_filter.files:
+        if not any(p.match(file_path) for p in file_filter.files):
+            return False
+    excluded = False
+    for p in file_filter.ignores:
+        if not p.negate:
+            if excluded:
+                return False
+            excluded = p.match(file_path)
+        elif excluded and p.match(file_path):
+            excluded = False
+    return not excluded
+
+
+def bench_file_filter(paths: list[str], config: Config):
+    file_filter = FileFilter()
+    for co in config.objects:
+        file_filter = file_filter.merge(co.file_filter)
+    num_patterns = len(file_filter.files) + len(file_filter.ignores)
+
+    def sequential():
+        return [accept_sequentially(file_filter, p) for p in paths]
+
+    def compiled():
+        return [file_filter.accept(p) for p in paths]
+
+    assert sequential() == compiled()
+    for name, func in (("sequential", sequential), ("compiled", compiled)):
+        t = min(timeit.repeat(func, number=1, repeat=NUM_REPEATS))
+        print(
+            f"{name:>16}: {1e3 * t:8.1f} ms for {len(paths)} paths"
+            f" and {num_patterns} patterns, {1e6 * t / len(paths):.2f} µs per path"
+        )
+
+
+def signature_per_object(config: Config, file_path: str) -> int:
+    """The former computation of the signature of matching
+    configuration objects, which matched every object's filter."""
+    signature = 0
+    for i, co in enumerate(config.objects):
+        if co.file_filter.empty or co.file_filter.accept(file_path):
+            signature |= 1 << i
+    return signature
+
+
+def bench_compute_config_object(paths: list[str], config: Config):
+    def per_object():
+        for p in paths:
+            signature_per_object(config, p)
+
+    def compute():
+        for p in paths:
+            config.compute_config_object(p)
+
+    assert [signature_per_object(config, p) for p in paths] == [
+        config._file_filter_set.accept(p) for p in paths
+    ]
+    for name, func in (("per object", per_object), ("compute config", compute)):
+        t = min(timeit.repeat(func, number=1, repeat=NUM_REPEATS))
+        print(
+            f"{name:>16}: {1e3 * t:8.1f} ms for {len(paths)} paths"
+            f" and {len(config.objects)} config objects,"
+            f" {1e6 * t / len(paths):.2f} µs per path"
+        )
+
+
+if __name__ == "__main__":
+    _num_paths = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    _num_config_objects = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    _paths = make_paths(_num_paths)
+    _config = make_config(_num_config_objects)
+    bench_file_filter(_paths, _config)
+    bench_compute_config_object(_paths, _config)
@@ -0,0 +1,76 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+"""Benchmark for the time it takes to load the builtin plugins
+and to validate a dataset using a small configuration.
+
+Every measurement runs in a fresh Python interpreter, so that
+module imports are included. Compares lazily loaded rules with
+importing all rule modules up front, as it was done before.
+
+Usage:
+
+    python benchmarks/bench_import.py [NUM_REPEATS]
+"""
+
+import subprocess
+import sys
+
+SETUP = """
+import time
+t0 = time.perf_counter()
+import xarray as xr
+import xrlint.plugin
+t1 = time.perf_counter()
+"""
+
+EXPORT_PLUGINS = """
+import xrlint.plugins.core, xrlint.plugins.xcube
+core = xrlint.plugins.core.export_plugin()
+xcube = xrlint.plugins.xcube.export_plugin()
+"""
+
+IMPORT_ALL_RULES = """
+from xrlint.util.importutil import import_submodules
+import_submodules("xrlint.plugins.core.rules")
+import_submodules("xrlint.plugins.xcube.rules")
+"""
+
+VALIDATE = """
+from xrlint.linter import new_linter
+linter = new_linter({"rules": {"var-units": "error"}})
+linter.validate(xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")}))
+"""
+
+REPORT = """
+print(time.perf_counter() - t1)
+"""
+
+CASES = {
+    "lazy": EXPORT_PLUGINS + VALIDATE,
+    "eager": EXPORT_PLUGINS + IMPORT_ALL_RULES + VALIDATE,
+}
+
+
+def run(code: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", SETUP + code + REPORT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output)
+
+
+def bench_import(num_repeats: int):
+    for name, code in CASES.items():
+        t = min(run(code) for _ in range(num_repeats))
+        print(
+            f"{name:>8}: {1e3 * t:8.1f} ms to load plugins and validate"
+            f" a dataset, excluding the import of xarray"
+        )
+
+
+if __name__ == "__main__":
+    bench_import(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
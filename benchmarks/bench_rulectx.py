@@ -0,0 +1,79 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+"""Micro-benchmark for the per-node overhead of switching the
+rule context state during dataset traversal.
+
+Compares `RuleContextImpl.use_state()`, which was used for every
+node before, with `RuleContextImpl.enter_node()`/`leave_node()`
+and measures the time for linting a dataset with many attributes.
+
+Usage:
+
+    python benchmarks/bench_rulectx.py [NUM_VARS] [NUM_ATTRS]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import xarray as xr
+
+# noinspection PyProtectedMember
+from xrlint._linter.rulectx import RuleContextImpl
+from xrlint.config import ConfigObject
+from xrlint.linter import new_linter
+from xrlint.node import AttrNode
+
+NUM_REPEATS = 5
+
+
+def bench_state_switching(num_nodes: int = 100_000):
+    ctx = RuleContextImpl(ConfigObject(), xr.Dataset(), "bench.zarr", None, None)
+    node = AttrNode(parent=None, name="title", value="")
+
+    def use_state():
+        for _ in range(num_nodes):
+            with ctx.use_state(node=node):
+                pass
+
+    def enter_leave():
+        for _ in range(num_nodes):
+            ctx.enter_node(node)
+            try:
+                pass
+            finally:
+                ctx.leave_node()
+
+    for name, func in (("use_state()", use_state), ("enter/leave", enter_leave)):
+        t = min(timeit.repeat(func, number=1, repeat=NUM_REPEATS))
+        print(f"{name:>16}: {1e9 * t / num_nodes:8.1f} ns per node")
+
+
+def bench_linter(num_vars: int, num_attrs: int):
+    dataset = xr.Dataset(
+        attrs={f"attr_{j}": j for j in range(num_attrs)},
+        data_vars={
+            f"var_{i}": xr.DataArray(
+                np.zeros(2),
+                dims="x",
+                attrs={f"attr_{j}": j for j in range(num_attrs)},
+            )
+            for i in range(num_vars)
+        },
+    )
+    linter = new_linter("recommended")
+    t = min(timeit.repeat(lambda: linter.validate(dataset), number=1, repeat=3))
+    num_nodes = 1 + (num_vars + 1) * (1 + num_attrs)
+    print(
+        f"{'recommended':>16}: {1e3 * t:8.1f} ms for {num_nodes} nodes,"
+        f" {1e6 * t / num_nodes:.2f} µs per node"
+    )
+
+
+if __name__ == "__main__":
+    _num_vars = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    _num_attrs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    bench_state_switching()
+    bench_linter(_num_vars, _num_attrs)
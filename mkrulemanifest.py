@@ -0,0 +1,66 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import dataclasses
+import subprocess
+
+from xrlint.plugin import Plugin
+from xrlint.rule import RuleMeta
+from xrlint.util.importutil import import_submodules
+
+MANIFESTS = {
+    "xrlint/plugins/core/manifest.py": (
+        "xrlint.plugins.core.plugin",
+        "xrlint.plugins.core.rules",
+    ),
+    "xrlint/plugins/xcube/manifest.py": (
+        "xrlint.plugins.xcube.plugin",
+        "xrlint.plugins.xcube.rules",
+    ),
+}
+
+
+def write_rule_manifests():
+    for file_path, (plugin_module_name, rules_package_name) in MANIFESTS.items():
+        plugin_module = __import__(plugin_module_name, fromlist=["plugin"])
+        import_submodules(rules_package_name)
+        with open(file_path, "w") as stream:
+            write_rule_manifest(stream, plugin_module.plugin)
+    # Generated code should pass the code style checks
+    subprocess.run(["ruff", "format", *MANIFESTS.keys()], check=False)
+
+
+def write_rule_manifest(stream, plugin: Plugin):
+    stream.write(
+        "#  Copyright © 2025 Brockmann Consult GmbH.\n"
+        "#  This software is distributed under the terms and conditions of the\n"
+        "#  MIT license (https://mit-license.org/).\n"
+        "\n"
+        "# This module is auto-generated by `python -m mkrulemanifest`,\n"
+        "# do not edit. Recreate it after changing or adding a rule.\n"
+        "\n"
+        "from typing import Final\n"
+        "\n"
+        "from xrlint.rule import RuleMeta\n"
+        "\n"
+        "RULE_MANIFEST: Final[dict[str, tuple[str, RuleMeta]]] = {\n"
+    )
+    # Keep the order in which the rules have been defined, as configs
+    # such as "all" and hence reported messages follow this order
+    for rule_name, rule in plugin.rules.items():
+        stream.write(f"    {rule_name!r}: (\n")
+        stream.write(f"        {rule.op_class.__module__!r},\n")
+        stream.write("        RuleMeta(\n")
+        for f in dataclasses.fields(RuleMeta):
+            value = getattr(rule.meta, f.name)
+            if f.name == "ref" or value == f.default:
+                continue
+            stream.write(f"            {f.name}={value!r},\n")
+        stream.write("        ),\n")
+        stream.write("    ),\n")
+    stream.write("}\n")
+
+
+if __name__ == "__main__":
+    write_rule_manifests()
@@ -54,6 +54,11 @@ def write_plugin_rules(stream, plugin: Plugin):
         if rule_meta.docs_url:
             stream.write(f"\n[More...]({rule_meta.docs_url})")
         stream.write("\n\n")
+        if rule_meta.needs_data:
+            stream.write(
+                "Reads data values, therefore not applied"
+                " if linter option `metadata_only` is set.\n\n"
+            )
         # List the predefined configurations that contain the rule
         stream.write("Contained in: ")
         for config_id in sorted(config_rules.keys()):
@@ -0,0 +1,202 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import xarray as xr
+
+# noinspection PyProtectedMember
+from xrlint._linter.apply import RuleOpCache, apply_rules, get_rule_op_hooks
+
+# noinspection PyProtectedMember
+from xrlint._linter.rulectx import RuleContextImpl
+from xrlint.config import ConfigObject
+from xrlint.node import AttrNode, AttrsNode, VariableNode
+from xrlint.plugin import new_plugin
+from xrlint.rule import RuleConfig, RuleContext, RuleExit, RuleOp
+from xrlint.util.timing import TimingProfile, use_timing_profile
+
+
+class ApplyRulesTest(TestCase):
+    def setUp(self):
+        plugin = new_plugin(name="test")
+
+        @plugin.define_rule("first-var-only")
+        class FirstVarOnly(RuleOp):
+            def validate_variable(self, ctx: RuleContext, node: VariableNode):
+                ctx.report(f"Visited {node.name!r}.")
+                raise RuleExit
+
+        @plugin.define_rule("all-attrs")
+        class AllAttrs(RuleOp):
+            def validate_attr(self, ctx: RuleContext, node: AttrNode):
+                ctx.report(f"Visited {node.name!r}.")
+
+        self.config_obj = ConfigObject(plugins={"test": plugin})
+        self.dataset = xr.Dataset(
+            attrs={"title": "Test"},
+            data_vars={
+                "a": xr.DataArray([1, 2], dims="x", attrs={"units": "m"}),
+                "b": xr.DataArray([1, 2], dims="x", attrs={"units": "s"}),
+            },
+        )
+
+    def apply(self, rule_configs: dict[str, RuleConfig]):
+        ctx = RuleContextImpl(self.config_obj, self.dataset, "test.zarr", None, None)
+        apply_rules(ctx, rule_configs)
+        return [(m.rule_id, m.node_path, m.message) for m in ctx.messages]
+
+    def test_validation_methods_are_timed(self):
+        timing_profile = TimingProfile()
+        with use_timing_profile(timing_profile):
+            self.apply(
+                {
+                    "test/all-attrs": RuleConfig(2),
+                    "test/first-var-only": RuleConfig(1),
+                }
+            )
+        rules = timing_profile.rules
+        self.assertEqual({"test/all-attrs", "test/first-var-only"}, set(rules))
+        self.assertEqual(["attr"], list(rules["test/all-attrs"]))
+        self.assertEqual(3, rules["test/all-attrs"]["attr"].count)
+        # The rule exits after the first variable
+        self.assertEqual(1, rules["test/first-var-only"]["variable"].count)
+        self.assertEqual({}, timing_profile.phases)
+
+    def test_messages_are_ordered_by_rule(self):
+        self.assertEqual(
+            [
+                ("test/all-attrs", "ds.attrs['title']", "Visited 'title'."),
+                (
+                    "test/all-attrs",
+                    "ds.data_vars['a'].attrs['units']",
+                    "Visited 'units'.",
+                ),
+                (
+                    "test/all-attrs",
+                    "ds.data_vars['b'].attrs['units']",
+                    "Visited 'units'.",
+                ),
+                ("test/unknown", "ds", "unknown rule 'test/unknown'"),
+                ("test/first-var-only", "ds.data_vars['a']", "Visited 'a'."),
+            ],
+            self.apply(
+                {
+                    "test/all-attrs": RuleConfig(2),
+                    "test/unknown": RuleConfig(2),
+                    "test/first-var-only": RuleConfig(1),
+                }
+            ),
+        )
+
+    def test_unused_subtrees_are_skipped(self):
+        with (
+            patch("xrlint._linter.apply.AttrsNode", wraps=AttrsNode) as attrs_node,
+            patch("xrlint._linter.apply.AttrNode", wraps=AttrNode) as attr_node,
+        ):
+            self.apply({"test/first-var-only": RuleConfig(2)})
+            self.assertEqual(0, attrs_node.call_count)
+            self.assertEqual(0, attr_node.call_count)
+
+            self.apply({"test/all-attrs": RuleConfig(2)})
+            self.assertEqual(3, attrs_node.call_count)
+            self.assertEqual(3, attr_node.call_count)
+
+    def test_rules_off(self):
+        self.assertEqual(
+            [],
+            self.apply(
+                {
+                    "test/all-attrs": RuleConfig(0),
+                    "test/first-var-only": RuleConfig(0),
+                }
+            ),
+        )
+
+
+class RuleOpCacheTest(TestCase):
+    def setUp(self):
+        plugin = new_plugin(name="test")
+        self.instances: list[RuleOp] = []
+        instances = self.instances
+
+        class CountingOp(RuleOp):
+            def __init__(self, *args, **kwargs):
+                instances.append(self)
+
+            def validate_dataset(self, ctx: RuleContext, node):
+                pass
+
+        @plugin.define_rule("stateless")
+        class StatelessOp(CountingOp):
+            pass
+
+        @plugin.define_rule("stateful", stateful=True)
+        class StatefulOp(CountingOp):
+            pass
+
+        self.config_obj = ConfigObject(plugins={"test": plugin})
+        self.dataset = xr.Dataset()
+
+    def apply(self, rule_configs: dict[str, RuleConfig], cache: RuleOpCache | None):
+        ctx = RuleContextImpl(self.config_obj, self.dataset, "test.zarr", None, None)
+        apply_rules(ctx, rule_configs, cache)
+
+    def test_stateless_ops_are_reused(self):
+        cache: RuleOpCache = {}
+        for severity in (1, 2, 2):
+            self.apply({"test/stateless": RuleConfig(severity)}, cache)
+        self.assertEqual(1, len(self.instances))
+        self.assertEqual(1, len(cache))
+
+    def test_ops_are_distinguished_by_options(self):
+        cache: RuleOpCache = {}
+        self.apply({"test/stateless": RuleConfig(2, kwargs={"a": [1, 2]})}, cache)
+        self.apply({"test/stateless": RuleConfig(2, kwargs={"a": [1, 2]})}, cache)
+        self.apply({"test/stateless": RuleConfig(2, kwargs={"a": [1, 3]})}, cache)
+        self.apply({"test/stateless": RuleConfig(2, kwargs={"a": True})}, cache)
+        self.apply({"test/stateless": RuleConfig(2, kwargs={"a": 1})}, cache)
+        self.assertEqual(4, len(self.instances))
+
+    def test_unhashable_options_are_not_cached(self):
+        cache: RuleOpCache = {}
+        for _ in range(2):
+            self.apply({"test/stateless": RuleConfig(2, args=(bytearray(),))}, cache)
+        self.assertEqual(2, len(self.instances))
+        self.assertEqual({}, cache)
+
+    def test_stateful_ops_are_not_cached(self):
+        cache: RuleOpCache = {}
+        for _ in range(2):
+            self.apply({"test/stateful": RuleConfig(2)}, cache)
+        self.assertEqual(2, len(self.instances))
+        self.assertEqual({}, cache)
+
+    def test_without_cache(self):
+        for _ in range(2):
+            self.apply({"test/stateless": RuleConfig(2)}, None)
+        self.assertEqual(2, len(self.instances))
+
+
+class GetRuleOpHooksTest(TestCase):
+    def test_core_rules(self):
+        from xrlint.plugins.core.rules.content_desc import ContentDesc
+        from xrlint.plugins.core.rules.no_empty_attrs import NoEmptyAttrs
+
+        self.assertEqual({"validate_attrs"}, get_rule_op_hooks(NoEmptyAttrs))
+        self.assertEqual(
+            {"validate_dataset", "validate_variable"}, get_rule_op_hooks(ContentDesc)
+        )
+
+    def test_inherited_hooks(self):
+        class BaseOp(RuleOp):
+            def validate_attr(self, ctx: RuleContext, node: AttrNode):
+                pass
+
+        class DerivedOp(BaseOp):
+            pass
+
+        self.assertEqual(frozenset(), get_rule_op_hooks(RuleOp))
+        self.assertEqual({"validate_attr"}, get_rule_op_hooks(DerivedOp))
@@ -10,6 +10,7 @@ import xarray as xr
 from xrlint._linter.rulectx import RuleContextImpl
 from xrlint.config import ConfigObject
 from xrlint.constants import DATASET_ROOT_NAME
+from xrlint.node import AttrsNode, DatasetNode
 from xrlint.result import Message, Suggestion
 
 
@@ -57,3 +58,21 @@ class RuleContextImplTest(TestCase):
             ],
             context.messages,
         )
+
+    def test_enter_leave_node(self):
+        dataset = xr.Dataset()
+        context = RuleContextImpl(ConfigObject(), dataset, "./ds.zarr", None, None)
+        ds_node = DatasetNode(parent=None, name="ds", dataset=xr.Dataset())
+        attrs_node = AttrsNode(parent=ds_node, attrs={})
+
+        context.enter_dataset_node(ds_node)
+        self.assertIs(ds_node, context.node)
+        self.assertIs(ds_node.dataset, context.dataset)
+        context.enter_node(attrs_node)
+        self.assertIs(attrs_node, context.node)
+        self.assertIs(ds_node.dataset, context.dataset)
+        context.leave_node()
+        self.assertIs(ds_node, context.node)
+        context.leave_dataset_node()
+        self.assertIs(None, context.node)
+        self.assertIs(dataset, context.dataset)
@@ -0,0 +1,222 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import xarray as xr
+from fsspec.implementations.local import LocalFileSystem
+
+# noinspection PyProtectedMember
+from xrlint._linter.sniff import (
+    HDF5,
+    NETCDF3,
+    DatasetFormat,
+    is_engine_compatible,
+    sniff_dataset_format,
+    sniff_dataset_formats,
+)
+
+# noinspection PyProtectedMember
+from xrlint._linter.validate import _open_dataset, open_datasets
+from xrlint.config import ConfigObject
+
+
+class SniffDatasetFormatTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp(prefix="xrlint-")
+        dataset = xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")})
+        datatree = xr.DataTree.from_dict({"/": dataset, "/group": dataset})
+        dataset.to_zarr(cls.path("v3.zarr"), zarr_format=3, consolidated=True)
+        dataset.to_zarr(cls.path("v3-raw.zarr"), zarr_format=3, consolidated=False)
+        dataset.to_zarr(cls.path("v2.zarr"), zarr_format=2, consolidated=True)
+        dataset.to_zarr(cls.path("v2-raw.zarr"), zarr_format=2, consolidated=False)
+        dataset.to_zarr(cls.path("v3-no-ext"), zarr_format=3, consolidated=True)
+        datatree.to_zarr(cls.path("tree-v3.zarr"), zarr_format=3, consolidated=True)
+        datatree.to_zarr(cls.path("tree-v2.zarr"), zarr_format=2, consolidated=True)
+        datatree.to_zarr(
+            cls.path("tree-v3-raw.zarr"), zarr_format=3, consolidated=False
+        )
+        datatree.to_zarr(
+            cls.path("tree-v2-raw.zarr"), zarr_format=2, consolidated=False
+        )
+        dataset.to_netcdf(cls.path("nc4.nc"), format="NETCDF4")
+        dataset.to_netcdf(cls.path("nc3.nc"), format="NETCDF3_CLASSIC")
+        with open(cls.path("text.txt"), "w") as f:
+            f.write("Hello!")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    @classmethod
+    def path(cls, name: str) -> str:
+        return os.path.join(cls.temp_dir, name)
+
+    def test_zarr(self):
+        # Expected values for: groups, consolidated
+        expected = {
+            "v3.zarr": (False, True),
+            "v3-raw.zarr": (False, False),
+            "v2.zarr": (False, True),
+            "v2-raw.zarr": (False, False),
+            "v3-no-ext": (False, True),
+            "tree-v3.zarr": (True, True),
+            "tree-v2.zarr": (True, True),
+            "tree-v3-raw.zarr": (True, False),
+            "tree-v2-raw.zarr": (True, False),
+        }
+        for name, (groups, consolidated) in expected.items():
+            self.assertEqual(
+                DatasetFormat("zarr", ("zarr",), groups, consolidated),
+                sniff_dataset_format(self.path(name)),
+                msg=name,
+            )
+        ds_format = sniff_dataset_format(self.path("v3.zarr"))
+        self.assertEqual("zarr", ds_format.engine)
+        self.assertEqual({"consolidated": True}, ds_format.opener_options)
+
+    def test_netcdf(self):
+        self.assertEqual(HDF5, sniff_dataset_format(self.path("nc4.nc")))
+        self.assertEqual(NETCDF3, sniff_dataset_format(self.path("nc3.nc")))
+        self.assertEqual(None, HDF5.engine)
+
+    def test_unknown(self):
+        self.assertEqual(None, sniff_dataset_format(self.path("text.txt")))
+        self.assertEqual(None, sniff_dataset_format(self.path("missing.nc")))
+        self.assertEqual(None, sniff_dataset_format(self.temp_dir))
+        self.assertEqual(None, sniff_dataset_format(xr.Dataset()))
+
+    def test_batch(self):
+        names = [
+            "v3.zarr",
+            "v2.zarr",
+            "tree-v2.zarr",
+            "v2-raw.zarr",
+            "tree-v3-raw.zarr",
+            "nc4.nc",
+            "nc3.nc",
+            "text.txt",
+            "missing.zarr",
+            "v3-no-ext",
+        ]
+        sources = [(self.path(name), None) for name in names]
+        with (
+            patch.object(
+                LocalFileSystem, "cat", autospec=True, side_effect=LocalFileSystem.cat
+            ) as cat,
+            patch.object(
+                LocalFileSystem,
+                "cat_ranges",
+                autospec=True,
+                side_effect=LocalFileSystem.cat_ranges,
+            ) as cat_ranges,
+        ):
+            formats = sniff_dataset_formats(sources)
+        # Metadata and signatures are fetched with one call each,
+        # plus one call for the children of stores without
+        # consolidated metadata
+        self.assertEqual(2, cat.call_count)
+        self.assertEqual(1, cat_ranges.call_count)
+        for name, ds_format in zip(names, formats):
+            if name in ("missing.zarr", "text.txt", "v3-no-ext"):
+                # Not detected in batches, but possibly individually
+                self.assertIsNone(ds_format, msg=name)
+            else:
+                self.assertEqual(
+                    sniff_dataset_format(self.path(name)), ds_format, msg=name
+                )
+        self.assertEqual([None], sniff_dataset_formats([(xr.Dataset(), None)]))
+
+    zarr_format = DatasetFormat("zarr", ("zarr",), groups=False)
+
+    def test_is_engine_compatible(self):
+        self.assertEqual(True, is_engine_compatible(self.zarr_format, None))
+        self.assertEqual(True, is_engine_compatible(self.zarr_format, "zarr"))
+        self.assertEqual(False, is_engine_compatible(self.zarr_format, "netcdf4"))
+        self.assertEqual(True, is_engine_compatible(HDF5, "h5netcdf"))
+        self.assertEqual(False, is_engine_compatible(NETCDF3, "rasterio"))
+
+    def test_datasets_are_opened_once(self):
+        for name, expected_type in (
+            ("v3.zarr", xr.Dataset),
+            ("tree-v3.zarr", xr.DataTree),
+            ("nc3.nc", xr.Dataset),
+            ("nc4.nc", xr.DataTree),
+        ):
+            with (
+                patch.object(xr, "open_datatree", wraps=xr.open_datatree) as odt,
+                patch.object(xr, "open_dataset", wraps=xr.open_dataset) as ods,
+            ):
+                path = self.path(name)
+                dataset, access_latency, _ = _open_dataset(path, {}, path)
+                dataset.close()
+            self.assertIsInstance(dataset, expected_type)
+            self.assertEqual(1, odt.call_count + ods.call_count, msg=name)
+            self.assertIsInstance(access_latency, float)
+
+    def test_sniffed_documents_are_not_fetched_again(self):
+        config_obj = ConfigObject(opener_options={"create_default_indexes": False})
+        for name in ("v3.zarr", "v2.zarr", "tree-v3.zarr", "tree-v2.zarr"):
+            path = self.path(name)
+            (ds_format,) = sniff_dataset_formats([(path, None)])
+            self.assertIsNotNone(ds_format.documents, msg=name)
+            opened = open_datasets(config_obj, path, path, ds_format)
+            for dataset, _ in opened.datasets:
+                dataset.close()
+            self.assertIsNone(opened.error, msg=name)
+            self.assertEqual(0, opened.io_stats.request_count, msg=name)
+            # The documents are fetched if not given
+            ds_format = DatasetFormat(
+                ds_format.name, ds_format.engines, ds_format.groups, True
+            )
+            opened = open_datasets(config_obj, path, path, ds_format)
+            for dataset, _ in opened.datasets:
+                dataset.close()
+            self.assertGreater(opened.io_stats.get_count, 0, msg=name)
+
+    def test_raw_v2_is_sniffed_in_batch(self):
+        path = self.path("v2-raw.zarr")
+        with patch.object(
+            LocalFileSystem, "exists", autospec=True, side_effect=LocalFileSystem.exists
+        ) as exists:
+            self.assertEqual(
+                [DatasetFormat("zarr", ("zarr",), False, False)],
+                sniff_dataset_formats([(path, None)]),
+            )
+        self.assertEqual(0, exists.call_count)
+
+    def test_flat_raw_v2_is_opened_as_dataset(self):
+        # A .zgroup but no .zmetadata and no child groups
+        path = self.path("v2-raw.zarr")
+        self.assertTrue(os.path.exists(f"{path}/.zgroup"))
+        self.assertFalse(os.path.exists(f"{path}/.zmetadata"))
+        (ds_format,) = sniff_dataset_formats([(path, None)])
+        self.assertEqual(False, ds_format.groups)
+        # The metadata of the children is fetched too
+        self.assertIsInstance(ds_format.documents.get(f"{path}/v/.zarray"), bytes)
+        self.assertIsNone(ds_format.documents.get(f"{path}/v/.zgroup"))
+        with patch.object(xr, "open_datatree", wraps=xr.open_datatree) as odt:
+            dataset, _, filesystem = _open_dataset(path, {}, path, ds_format)
+            dataset.close()
+        self.assertIsInstance(dataset, xr.Dataset)
+        self.assertEqual(0, odt.call_count)
+        self.assertEqual(0, filesystem.io_stats.get_count)
+
+    def test_datatree_falls_back_to_dataset(self):
+        # Some xarray versions fail to open no-group Zarr datasets
+        # as datatree with an AttributeError
+        path = self.path("v2-raw.zarr")
+        ds_format = DatasetFormat("zarr", ("zarr",), True, False)
+        with patch.object(
+            xr, "open_datatree", side_effect=AttributeError("read_only")
+        ) as odt:
+            dataset, _, _ = _open_dataset(path, {}, path, ds_format)
+            dataset.close()
+        self.assertIsInstance(dataset, xr.Dataset)
+        self.assertEqual(1, odt.call_count)
@@ -0,0 +1,238 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import xarray as xr
+from fsspec.implementations.local import LocalFileSystem
+
+from xrlint.cli.cache import LintCache
+from xrlint.config import Config, ConfigObject, get_core_config_object
+from xrlint.plugin import new_plugin
+from xrlint.result import Message, Result, Suggestion
+from xrlint.rule import RuleOp
+
+
+class LintCacheTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-").replace("\\", "/")
+        self.cache_path = f"{self.temp_dir}/.xrlintcache"
+        self.nc_path = f"{self.temp_dir}/ds.nc"
+        self.zarr_path = f"{self.temp_dir}/ds.zarr"
+        dataset = xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")})
+        dataset.to_netcdf(self.nc_path)
+        dataset.to_zarr(self.zarr_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @classmethod
+    def config_obj(cls, **rules) -> ConfigObject:
+        config = Config.from_config(get_core_config_object(), {"rules": rules})
+        return config.compute_config_object("ds.nc")
+
+    def lookup(
+        self, config_obj: ConfigObject, *file_paths: str, cache_data: bool = False
+    ) -> list[Result | None]:
+        lint_cache = LintCache(self.cache_path, cache_data=cache_data)
+        cached = [
+            cached_result
+            for _, _, cached_result in lint_cache.lookup_files(
+                (p, config_obj) for p in file_paths
+            )
+        ]
+        for file_path, cached_result in zip(file_paths, cached):
+            if cached_result is None:
+                lint_cache.update(
+                    Result(
+                        file_path=file_path,
+                        config_object=config_obj,
+                        messages=[
+                            Message(
+                                "Missing units",
+                                node_path="dataset.v",
+                                rule_id="var-units",
+                                severity=2,
+                                suggestions=[Suggestion("Add units")],
+                            )
+                        ],
+                    )
+                )
+        lint_cache.save()
+        return cached
+
+    def test_unchanged_files_are_cached(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        self.assertEqual(
+            [None, None], self.lookup(config_obj, self.nc_path, self.zarr_path)
+        )
+        results = self.lookup(config_obj, self.nc_path, self.zarr_path)
+        for file_path, result in zip((self.nc_path, self.zarr_path), results):
+            self.assertIsInstance(result, Result)
+            self.assertEqual(file_path, result.file_path)
+            self.assertIs(config_obj, result.config_object)
+            self.assertEqual(
+                [
+                    Message(
+                        "Missing units",
+                        node_path="dataset.v",
+                        rule_id="var-units",
+                        severity=2,
+                        suggestions=[Suggestion("Add units")],
+                    )
+                ],
+                result.messages,
+            )
+            self.assertEqual(1, result.error_count)
+
+    def test_changed_config_invalidates(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        self.lookup(config_obj, self.nc_path)
+        self.assertEqual(
+            [None], self.lookup(self.config_obj(**{"var-units": "warn"}), self.nc_path)
+        )
+
+    def test_changed_rule_version_invalidates(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        self.lookup(config_obj, self.nc_path)
+        rule = config_obj.get_rule("var-units")
+        version = rule.meta.version
+        try:
+            rule.meta.version = "99.0.0"
+            self.assertEqual([None], self.lookup(config_obj, self.nc_path))
+        finally:
+            rule.meta.version = version
+
+    def test_changed_files_invalidate(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        self.lookup(config_obj, self.nc_path, self.zarr_path)
+        xr.Dataset({"w": xr.DataArray([1, 2], dims="y")}).to_netcdf(self.nc_path)
+        os.utime(self.nc_path, (0, 0))
+        xr.Dataset({"w": xr.DataArray([1, 2], dims="y")}).to_zarr(
+            self.zarr_path, mode="w"
+        )
+        self.assertEqual(
+            [None, None], self.lookup(config_obj, self.nc_path, self.zarr_path)
+        )
+
+    def test_fatal_results_are_not_cached(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        lint_cache = LintCache(self.cache_path)
+        list(lint_cache.lookup_files([(self.nc_path, config_obj)]))
+        lint_cache.update(
+            Result(
+                file_path=self.nc_path,
+                config_object=config_obj,
+                messages=[Message("No such file", fatal=True, severity=2)],
+            )
+        )
+        lint_cache.save()
+        lint_cache = LintCache(self.cache_path)
+        list(lint_cache.lookup_files([(self.nc_path, config_obj)]))
+        self.assertEqual((0, 1), (lint_cache.hits, lint_cache.misses))
+
+    def test_missing_and_invalid_cache_files(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        self.assertEqual([None], self.lookup(config_obj, f"{self.temp_dir}/x.nc"))
+        with open(self.cache_path, "w") as f:
+            json.dump({"version": 0, "entries": []}, f)
+        self.assertEqual([None], self.lookup(config_obj, self.nc_path))
+
+    def test_changed_array_metadata_invalidates(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        for zarr_format, array_metadata_name in ((2, ".zattrs"), (3, "zarr.json")):
+            with self.subTest(zarr_format=zarr_format):
+                zarr_path = f"{self.temp_dir}/raw-v{zarr_format}.zarr"
+                xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")}).to_zarr(
+                    zarr_path, zarr_format=zarr_format, consolidated=False
+                )
+                self.assertEqual([None], self.lookup(config_obj, zarr_path))
+                self.assertIsInstance(self.lookup(config_obj, zarr_path)[0], Result)
+                metadata_path = f"{zarr_path}/v/{array_metadata_name}"
+                with open(metadata_path) as f:
+                    metadata = json.load(f)
+                attrs = metadata if zarr_format == 2 else metadata["attributes"]
+                attrs["units"] = "m"
+                with open(metadata_path, "w") as f:
+                    json.dump(metadata, f)
+                self.assertEqual([None], self.lookup(config_obj, zarr_path))
+
+    def test_changed_data_invalidates_if_rule_reads_data(self):
+        plugin = new_plugin(name="test", version="1.0.0")
+
+        @plugin.define_rule("read-data", needs_data=True)
+        class ReadData(RuleOp):
+            pass
+
+        data_config_obj = Config.from_config(
+            get_core_config_object(),
+            {"plugins": {"test": plugin}, "rules": {"test/read-data": "error"}},
+        ).compute_config_object("ds.zarr")
+        metadata_config_obj = self.config_obj(**{"var-units": "error"})
+        for config_obj, cache_data, expected_type in (
+            (metadata_config_obj, False, Result),
+            (data_config_obj, True, type(None)),
+        ):
+            with self.subTest(expected_type=expected_type):
+                self.assertEqual(
+                    [None],
+                    self.lookup(config_obj, self.zarr_path, cache_data=cache_data),
+                )
+                self.assertIsInstance(
+                    self.lookup(config_obj, self.zarr_path, cache_data=cache_data)[0],
+                    Result,
+                )
+                self._touch_data_files(self.zarr_path)
+                self.assertIsInstance(
+                    self.lookup(config_obj, self.zarr_path, cache_data=cache_data)[0],
+                    expected_type,
+                )
+        # Directories validated by rules that read data are not cached,
+        # unless requested, while files are
+        self.lookup(data_config_obj, self.zarr_path, self.nc_path)
+        self.assertEqual([None], self.lookup(data_config_obj, self.zarr_path))
+        self.assertIsInstance(self.lookup(data_config_obj, self.nc_path)[0], Result)
+
+    def test_data_files_are_not_listed(self):
+        config_obj = self.config_obj(**{"var-units": "error"})
+        zarr_path = f"{self.temp_dir}/raw-tree.zarr"
+        dataset = xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")})
+        xr.DataTree.from_dict({"/": dataset, "/group": dataset}).to_zarr(
+            zarr_path, zarr_format=2, consolidated=False
+        )
+        with (
+            patch.object(
+                LocalFileSystem, "ls", autospec=True, side_effect=LocalFileSystem.ls
+            ) as ls,
+            patch.object(
+                LocalFileSystem, "find", autospec=True, side_effect=LocalFileSystem.find
+            ) as find,
+        ):
+            self.assertEqual([None], self.lookup(config_obj, zarr_path))
+            self.assertIsInstance(self.lookup(config_obj, zarr_path)[0], Result)
+        self.assertEqual(0, find.call_count)
+        # Only the groups are listed, not the arrays
+        self.assertEqual(
+            {zarr_path, f"{zarr_path}/group"},
+            {call.args[1].rstrip("/") for call in ls.call_args_list},
+        )
+        # Changed array metadata of a child group invalidates
+        metadata_path = f"{zarr_path}/group/v/.zattrs"
+        with open(metadata_path, "w") as f:
+            json.dump({"units": "m"}, f)
+        self.assertEqual([None], self.lookup(config_obj, zarr_path))
+
+    @classmethod
+    def _touch_data_files(cls, zarr_path: str):
+        for dir_path, _, file_names in os.walk(zarr_path):
+            for file_name in file_names:
+                if file_name not in ("zarr.json", ".zmetadata", ".zattrs"):
+                    file_path = os.path.join(dir_path, file_name)
+                    mtime = os.path.getmtime(file_path) + 10
+                    os.utime(file_path, (mtime, mtime))
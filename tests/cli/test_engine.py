@@ -0,0 +1,192 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import weakref
+from unittest import TestCase
+from unittest.mock import patch
+
+import xarray as xr
+from fsspec.implementations.local import LocalFileSystem
+
+# noinspection PyProtectedMember
+from xrlint._linter.sniff import sniff_dataset_formats
+
+# noinspection PyProtectedMember
+from xrlint._linter.validate import OpenedDatasets, open_datasets
+from xrlint.cli.engine import XRLint
+
+
+class GetFilesTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-").replace("\\", "/")
+        for path in (
+            "data/a.zarr",
+            "data/archive/b.zarr",
+            "data/archive/2025/c.zarr",
+            "data/more/d.zarr",
+        ):
+            os.makedirs(f"{self.temp_dir}/{path}")
+        for path in ("data/e.nc", "data/more/f.nc", "data/more/README.md"):
+            with open(f"{self.temp_dir}/{path}", "w") as f:
+                f.write("")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def get_files(self, *configs) -> tuple[list[str], list[str]]:
+        xrlint = XRLint(no_config_lookup=True)
+        xrlint.init_config(*configs, {"rules": {"var-units": "error"}})
+        ls = LocalFileSystem.ls
+        with patch.object(
+            LocalFileSystem, "ls", autospec=True, side_effect=ls
+        ) as ls_mock:
+            files = [
+                path[len(self.temp_dir) + 1 :]
+                for path, _ in xrlint.get_files([self.temp_dir])
+            ]
+        listed = [
+            call.args[1][len(self.temp_dir) + 1 :] for call in ls_mock.call_args_list
+        ]
+        return sorted(files), listed
+
+    def test_all_files(self):
+        files, listed = self.get_files()
+        self.assertEqual(
+            [
+                "data/a.zarr",
+                "data/archive/2025/c.zarr",
+                "data/archive/b.zarr",
+                "data/e.nc",
+                "data/more/d.zarr",
+                "data/more/f.nc",
+            ],
+            files,
+        )
+        self.assertIn("data/archive/2025", listed)
+
+    def test_ignored_dirs_are_not_listed(self):
+        files, listed = self.get_files({"ignores": ["**/archive/**"]})
+        self.assertEqual(
+            ["data/a.zarr", "data/e.nc", "data/more/d.zarr", "data/more/f.nc"],
+            files,
+        )
+        self.assertIn("data/more", listed)
+        self.assertNotIn("data/archive", listed)
+        self.assertNotIn("data/archive/2025", listed)
+
+
+class ValidateFilesTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-").replace("\\", "/")
+        dataset = xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")})
+        for i in range(5):
+            dataset.to_zarr(f"{self.temp_dir}/ds-{i}.zarr", consolidated=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_formats_are_sniffed_in_batches(self):
+        xrlint = XRLint(no_config_lookup=True)
+        xrlint.init_config({"rules": {"var-units": "error"}})
+        with (
+            patch(
+                "xrlint.cli.engine.sniff_dataset_formats",
+                wraps=sniff_dataset_formats,
+            ) as sniff_mock,
+            patch.object(xr, "open_dataset", wraps=xr.open_dataset) as ods_mock,
+        ):
+            results = list(xrlint.validate_files([self.temp_dir]))
+        self.assertEqual(5, len(results))
+        for result in results:
+            self.assertEqual(1, result.error_count)
+            self.assertEqual("var-units", result.messages[0].rule_id)
+        self.assertEqual(1, sniff_mock.call_count)
+        self.assertEqual(5, ods_mock.call_count)
+        for call in ods_mock.call_args_list:
+            self.assertEqual(True, call.kwargs.get("consolidated"))
+
+    def test_prefetched_datasets_are_closed(self):
+        xrlint = XRLint(no_config_lookup=True, prefetch=2)
+        xrlint.init_config({"rules": {"var-units": "error"}})
+        opened_list: list[OpenedDatasets] = []
+
+        def _open_datasets(*args, **kwargs):
+            opened = open_datasets(*args, **kwargs)
+            opened_list.append(opened)
+            return opened
+
+        with (
+            patch("xrlint.cli.engine.open_datasets", side_effect=_open_datasets),
+            patch.object(
+                OpenedDatasets,
+                "close",
+                autospec=True,
+                side_effect=OpenedDatasets.close,
+            ) as close_mock,
+        ):
+            results = xrlint.validate_files([self.temp_dir])
+            self.assertEqual(1, next(results).error_count)
+            # Datasets prefetched meanwhile are not validated
+            # Waits for the worker threads to finish
+            results.close()
+        self.assertLess(1, len(opened_list))
+        self.assertEqual(
+            sorted(map(id, opened_list)),
+            sorted(id(call.args[0]) for call in close_mock.call_args_list),
+        )
+
+    def test_stats_include_worker_processes(self):
+        requests = []
+        for jobs in (1, 2):
+            xrlint = XRLint(no_config_lookup=True, jobs=jobs)
+            xrlint.init_config({"rules": {"var-units": "error"}})
+            results = list(xrlint.validate_files([self.temp_dir]))
+            self.assertEqual(5, len(results))
+            stats = xrlint.format_stats()
+            hits, misses = map(
+                int,
+                re.search(r"(\d+) hit\(s\), (\d+) miss\(es\)", stats).groups(),
+            )
+            requests.append(hits + misses)
+        # Filesystems are requested by the workers for opening the datasets
+        self.assertEqual(requests[0], requests[1])
+
+
+class WriteReportTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-").replace("\\", "/")
+        dataset = xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")})
+        for i in range(3):
+            dataset.to_zarr(f"{self.temp_dir}/ds-{i}.zarr", consolidated=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_results_are_streamed_to_output_file(self):
+        output_path = f"{self.temp_dir}/report.json"
+        xrlint = XRLint(
+            no_config_lookup=True, output_format="json", output_path=output_path
+        )
+        xrlint.init_config({"rules": {"var-units": "error"}})
+        result_refs = []
+
+        def validate_files():
+            for result in xrlint.validate_files([self.temp_dir]):
+                result_refs.append(weakref.ref(result))
+                yield result
+
+        xrlint.write_report(validate_files())
+        # Results are not kept once they have been written
+        self.assertEqual(3, len(result_refs))
+        self.assertEqual([None, None, None], [ref() for ref in result_refs])
+        with open(output_path) as f:
+            report = json.load(f)
+        self.assertEqual(3, len(report["results"]))
+        self.assertEqual(3, xrlint.result_stats.result_count)
+        self.assertEqual(3, xrlint.result_stats.error_count)
@@ -2,12 +2,16 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import json
 import os
 import shutil
+import sys
 import tempfile
 from unittest import TestCase
+from unittest.mock import patch
 
 import click.testing
+import pyarrow.parquet as pq
 import xarray as xr
 from click.testing import CliRunner
 
@@ -62,9 +66,11 @@ class CliMainTest(TestCase):
         os.chdir(cls.last_cwd)
         shutil.rmtree(cls.temp_dir)
 
-    def xrlint(self, *args: tuple[str, ...]) -> click.testing.Result:
+    def xrlint(
+        self, *args: tuple[str, ...], env: dict[str, str] | None = None
+    ) -> click.testing.Result:
         runner = CliRunner()
-        result = runner.invoke(main, args)
+        result = runner.invoke(main, args, env=env)
         if not isinstance(result.exception, SystemExit):
             import traceback
 
@@ -192,6 +198,59 @@ class CliMainTest(TestCase):
         self.assertIn("xcube/any-spatial-data-var", result.output)
         self.assertEqual(1, result.exit_code)
 
+    def test_files_with_jobs(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            result = self.xrlint("--no-color", "--jobs", "2", "--ordered", *self.files)
+            self.assertEqual(
+                "\n"
+                "dataset1.zarr - ok\n\n"
+                "dataset1.nc - ok\n\n"
+                "dataset2.zarr - ok\n\n"
+                "dataset2.nc - ok\n\n"
+                "no problems\n\n",
+                result.output,
+            )
+            self.assertEqual(0, result.exit_code)
+
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.fail_config_yaml):
+            result = self.xrlint("--jobs", "0", *self.files)
+            self.assertIn("Missing attribute 'Conventions'.", result.output)
+            self.assertIn("4 errors", result.output)
+            self.assertEqual(1, result.exit_code)
+
+    def test_files_with_jobs_and_max_warnings(self):
+        result = self.xrlint(
+            "--rule",
+            "conventions: warn",
+            "--max-warnings",
+            "0",
+            "--jobs",
+            "2",
+            *self.files,
+        )
+        self.assertIn("Maximum number of warnings exceeded.", result.output)
+        self.assertEqual(1, result.exit_code)
+
+    def test_files_with_prefetch(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            result = self.xrlint("--no-color", "--prefetch", "2", *self.files)
+            self.assertEqual(
+                "\n"
+                "dataset1.zarr - ok\n\n"
+                "dataset1.nc - ok\n\n"
+                "dataset2.zarr - ok\n\n"
+                "dataset2.nc - ok\n\n"
+                "no problems\n\n",
+                result.output,
+            )
+            self.assertEqual(0, result.exit_code)
+
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            result = self.xrlint("--no-color", "--prefetch", "1", "missing.nc")
+            self.assertIn("missing.nc:\n", result.output)
+            self.assertIn("No such file or directory", result.output)
+            self.assertEqual(1, result.exit_code)
+
     def test_files_with_output_file(self):
         with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
             result = self.xrlint("-o", "memory://report.txt", *self.files)
@@ -215,6 +274,49 @@ class CliMainTest(TestCase):
             self.assertIn("<h3>Results</h3>", result.output)
             self.assertEqual(0, result.exit_code)
 
+    def test_files_with_format_ndjson(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.fail_config_yaml):
+            result = self.xrlint("-f", "ndjson", *self.files)
+            lines = result.output.splitlines()
+            self.assertEqual(4, len(lines))
+            self.assertIn('"rule_id": "conventions"', lines[0])
+            self.assertEqual(1, result.exit_code)
+
+    def test_files_with_format_parquet(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.fail_config_yaml):
+            result = self.xrlint("-f", "parquet", "-o", "report.parquet", *self.files)
+            try:
+                self.assertEqual("", result.output)
+                self.assertEqual(1, result.exit_code)
+                table = pq.read_table("report.parquet")
+                self.assertEqual(4, table.num_rows)
+            finally:
+                os.remove("report.parquet")
+
+    def test_files_with_format_parquet_but_no_output_file(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            result = self.xrlint("-f", "parquet", *self.files)
+            self.assertIn(
+                "Error: format 'parquet' writes binary data"
+                " and requires an output file, use '--output-file'.",
+                result.output,
+            )
+            self.assertEqual(1, result.exit_code)
+
+    def test_files_with_format_parquet_but_no_pyarrow(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            with patch.dict(sys.modules, {"pyarrow": None}):
+                result = self.xrlint(
+                    "-f", "parquet", "-o", "report.parquet", *self.files
+                )
+            self.assertIn(
+                "Error: the 'parquet' format requires the 'pyarrow' package,"
+                " install it using 'pip install pyarrow'",
+                result.output,
+            )
+            self.assertEqual(1, result.exit_code)
+            self.assertFalse(os.path.exists("report.parquet"))
+
     def test_file_does_not_match(self):
         with text_file(DEFAULT_CONFIG_FILE_YAML, no_match_config_yaml):
             result = self.xrlint("test.zarr")
@@ -241,6 +343,76 @@ class CliMainTest(TestCase):
             )
             self.assertEqual(0, result.exit_code)
 
+    def test_files_with_metadata_only(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            result = self.xrlint("--no-color", "--metadata-only", *self.files)
+            self.assertIn("no problems", result.output)
+            self.assertEqual(0, result.exit_code)
+
+            result = self.xrlint("--metadata-only", "--print-config", "dataset2.zarr")
+            self.assertIn('"metadata_only": true', result.output)
+            self.assertEqual(0, result.exit_code)
+
+    def test_files_with_stats(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
+            result = self.xrlint("--no-color", "--stats", *self.files)
+            self.assertIn("no problems", result.output)
+            self.assertIn("Filesystem pool: 1 filesystem(s),", result.output)
+            self.assertEqual(0, result.exit_code)
+
+    def test_files_with_timing(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.fail_config_yaml):
+            result = self.xrlint("--no-color", "--timing", *self.files)
+            self.assertIn("4 errors", result.output)
+            self.assertIn("Calls per node kind", result.output)
+            self.assertIn("conventions", result.output)
+            self.assertIn("open", result.output)
+            self.assertEqual(1, result.exit_code)
+
+            result = self.xrlint("-f", "json", *self.files, env={"XRLINT_TIMING": "1"})
+            self.assertIn('"timing": {', result.output)
+            self.assertIn('"conventions": {', result.output)
+
+    def test_files_with_trace(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.fail_config_yaml):
+            try:
+                result = self.xrlint("--trace", "trace.json", *self.files)
+                self.assertIn("4 errors", result.output)
+                self.assertEqual(1, result.exit_code)
+                with open("trace.json") as f:
+                    trace = json.load(f)
+                events = trace["traceEvents"]
+                names = [e["name"] for e in events]
+                for name in ("discover", "compute_config", "sniff", "open", "validate"):
+                    self.assertIn(name, names)
+                # One span per dataset for a rule that validates datasets
+                self.assertEqual(4, names.count("conventions"))
+                self.assertEqual("write_report", events[-1]["name"])
+            finally:
+                os.remove("trace.json")
+
+    def test_files_with_cache(self):
+        with text_file(DEFAULT_CONFIG_FILE_YAML, self.fail_config_yaml):
+            try:
+                for expected_stats in (
+                    "Cache: 0 hit(s), 4 miss(es)",
+                    "Cache: 4 hit(s), 0 miss(es)",
+                ):
+                    result = self.xrlint(
+                        "--no-color",
+                        "--cache",
+                        "--cache-location",
+                        "cache",
+                        "--stats",
+                        *self.files,
+                    )
+                    self.assertIn("4 errors", result.output)
+                    self.assertIn(expected_stats, result.output)
+                    self.assertEqual(1, result.exit_code)
+                self.assertTrue(os.path.isfile("cache"))
+            finally:
+                os.remove("cache")
+
     def test_files_with_invalid_format_option(self):
         with text_file(DEFAULT_CONFIG_FILE_YAML, self.ok_config_yaml):
             result = self.xrlint("-f", "foo", *self.files)
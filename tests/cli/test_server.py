@@ -0,0 +1,121 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from unittest import TestCase
+
+import xarray as xr
+
+from xrlint.cli.engine import XRLint
+from xrlint.cli.server import LintServer, parse_address
+
+
+class ParseAddressTest(TestCase):
+    def test_parse_address(self):
+        self.assertEqual(("127.0.0.1", 8080), parse_address("8080"))
+        self.assertEqual(("0.0.0.0", 8080), parse_address("0.0.0.0:8080"))
+        self.assertEqual(("127.0.0.1", 8080), parse_address(":8080"))
+        self.assertEqual("/tmp/xrlint.sock", parse_address("/tmp/xrlint.sock"))
+        self.assertEqual("xrlint.sock", parse_address("xrlint.sock"))
+
+
+class LintServerTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-")
+        self.config_path = os.path.join(self.temp_dir, "xrlint-config.yaml")
+        self.write_config("var-units")
+        self.dataset_path = os.path.join(self.temp_dir, "ds.zarr")
+        xr.Dataset(
+            {"v": xr.DataArray([1, 2, 3], dims="x")}, attrs={"title": "Test"}
+        ).to_zarr(self.dataset_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_config(self, rule_name: str):
+        with open(self.config_path, "w") as f:
+            f.write(f"- rules:\n    {rule_name}: error\n")
+
+    def start_server(self, address: str) -> LintServer:
+        cli_engine = XRLint(config_path=self.config_path)
+        cli_engine.init_config()
+        server = LintServer(cli_engine, address)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            thread.join()
+
+        self.addCleanup(stop)
+        return server
+
+    def test_http(self):
+        server = self.start_server("127.0.0.1:0")
+        url = server.server_address
+
+        with urllib.request.urlopen(f"{url}/health") as response:
+            self.assertEqual("ok", json.load(response)["status"])
+
+        def lint() -> set[str]:
+            request = urllib.request.Request(
+                f"{url}/lint",
+                data=json.dumps({"files": [self.dataset_path]}).encode(),
+                method="POST",
+            )
+            with urllib.request.urlopen(request) as response:
+                results = json.load(response)["results"]
+            self.assertEqual(1, len(results))
+            return {m["rule_id"] for m in results[0]["messages"]}
+
+        self.assertEqual({"var-units"}, lint())
+
+        # Configuration is reloaded if modified
+        self.write_config("var-desc")
+        mtime = os.path.getmtime(self.config_path)
+        os.utime(self.config_path, (mtime + 10, mtime + 10))
+        self.assertEqual({"var-desc"}, lint())
+
+        for path, data, status in (
+            ("/lint", b"[]", 400),
+            ("/lint", b'{"files": [1]}', 400),
+            ("/lint", b"{", 400),
+            ("/validate", b"{}", 404),
+        ):
+            request = urllib.request.Request(f"{url}{path}", data=data, method="POST")
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(request)
+            self.assertEqual(status, cm.exception.code, msg=data)
+            self.assertIn("error", json.load(cm.exception))
+            cm.exception.close()
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires UNIX sockets")
+    def test_unix_socket(self):
+        socket_path = os.path.join(self.temp_dir, "xrlint.sock")
+        server = self.start_server(socket_path)
+        self.assertEqual(socket_path, server.server_address)
+
+        body = json.dumps({"files": [self.dataset_path]}).encode()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(
+                b"POST /lint HTTP/1.0\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            response = b""
+            while chunk := sock.recv(65536):
+                response += chunk
+        header, _, content = response.partition(b"\r\n\r\n")
+        self.assertTrue(header.startswith(b"HTTP/1.0 200"))
+        results = json.loads(content)["results"]
+        self.assertEqual(["var-units"], [m["rule_id"] for m in results[0]["messages"]])
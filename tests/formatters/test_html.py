@@ -2,6 +2,7 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import io
 from unittest import TestCase
 
 from xrlint.formatters.html import Html, HtmlText
@@ -31,3 +32,10 @@ class HtmlTest(TestCase):
         self.assertIsInstance(text, HtmlText)
         self.assertIs(text, text._repr_html_())
         self.assertIn("</p>", text)
+
+    def test_html_write(self):
+        stream = io.StringIO()
+        Html().write(get_context(), iter(get_test_results()), stream)
+        text = stream.getvalue()
+        self.assertTrue(text.startswith("<div>\n<h3>Results</h3>"))
+        self.assertTrue(text.endswith("</div>"))
@@ -2,9 +2,12 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import io
+import json
 from unittest import TestCase
 
 from xrlint.formatters.json import Json
+from xrlint.result import get_rules_meta_for_results
 
 from .helpers import get_context, get_test_results
 
@@ -27,3 +30,26 @@ class JsonTest(TestCase):
             results=results,
         )
         self.assertIn('"results": [', text)
+
+    def test_json_is_same_as_json_dumps(self):
+        for with_meta in (False, True):
+            for indent in (None, 0, 2):
+                for results in (get_test_results(), []):
+                    formatter = Json(indent=indent, with_meta=with_meta)
+                    text = formatter.format(context=get_context(), results=results)
+                    expected = {"results": [r.to_json() for r in results]}
+                    if with_meta:
+                        expected["rules_meta"] = [
+                            rm.to_json()
+                            for rm in get_rules_meta_for_results(results).values()
+                        ]
+                    self.assertEqual(
+                        json.dumps(expected, indent=indent),
+                        text,
+                        msg=f"with_meta={with_meta}, indent={indent}",
+                    )
+
+    def test_json_write(self):
+        stream = io.StringIO()
+        Json().write(get_context(), iter(get_test_results()), stream)
+        self.assertEqual(2, len(json.loads(stream.getvalue())["results"]))
@@ -0,0 +1,51 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import io
+import json
+from unittest import TestCase
+
+from xrlint.formatters.ndjson import NdJson
+
+from .helpers import get_context, get_test_results
+
+
+class NdJsonTest(TestCase):
+    def test_ndjson(self):
+        results = get_test_results()
+        formatter = NdJson()
+        text = formatter.format(
+            context=get_context(),
+            results=results,
+        )
+        lines = text.splitlines()
+        self.assertEqual(6, len(lines))
+        self.assertTrue(text.endswith("}\n"))
+        self.assertEqual(
+            {
+                "file_path": "test.nc",
+                "node_path": "dataset",
+                "rule_id": "test/rule-1",
+                "severity": 2,
+                "fatal": None,
+                "message": "message-1",
+            },
+            json.loads(lines[0]),
+        )
+        self.assertEqual(
+            {
+                "file_path": "test.nc",
+                "node_path": None,
+                "rule_id": None,
+                "severity": None,
+                "fatal": True,
+                "message": "message-3",
+            },
+            json.loads(lines[2]),
+        )
+
+    def test_ndjson_write(self):
+        stream = io.StringIO()
+        NdJson().write(get_context(), iter([]), stream)
+        self.assertEqual("", stream.getvalue())
@@ -0,0 +1,57 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import io
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from xrlint.formatters.parquet import Parquet
+
+from .helpers import get_context, get_test_results
+
+
+class ParquetTest(TestCase):
+    def test_parquet(self):
+        results = get_test_results()
+        formatter = Parquet(batch_size=4)
+        data = formatter.format(
+            context=get_context(),
+            results=results,
+        )
+        self.assertIsInstance(data, bytes)
+        parquet_file = pq.ParquetFile(io.BytesIO(data))
+        # 6 messages in batches of 4
+        self.assertEqual(2, parquet_file.metadata.num_row_groups)
+        table = parquet_file.read()
+        self.assertEqual(6, table.num_rows)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("file_path").type))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("rule_id").type))
+        self.assertEqual(
+            {
+                "file_path": "test.nc",
+                "node_path": "dataset",
+                "rule_id": "test/rule-1",
+                "severity": 2,
+                "fatal": None,
+                "message": "message-1",
+            },
+            table.slice(0, 1).to_pylist()[0],
+        )
+
+    def test_parquet_without_results(self):
+        data = Parquet().format(context=get_context(), results=[])
+        self.assertEqual(0, pq.read_table(io.BytesIO(data)).num_rows)
+
+    # noinspection PyMethodMayBeStatic
+    def test_parquet_without_pyarrow(self):
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(
+                ValueError, match="install it using 'pip install pyarrow'"
+            ):
+                Parquet()
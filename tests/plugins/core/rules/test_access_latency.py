@@ -35,7 +35,6 @@ class OpeningTimeTest(TestCase):
         )
         node = DatasetNode(
             parent=None,
-            path=DATASET_ROOT_NAME,
             name=DATASET_ROOT_NAME,
             dataset=ctx.dataset,
         )
@@ -0,0 +1,90 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+from unittest import TestCase
+
+from tests.plugins.xcube.helpers import make_cube
+from xrlint.plugins.xcube.rules.aligned_chunks import (
+    AlignedChunks,
+    _get_read_amplification,
+)
+from xrlint.testing import RuleTest, RuleTester
+
+
+def make_chunked_cube(**chunks):
+    dataset = make_cube(360, 180, 10).chunk(**chunks)
+    dataset.chl.encoding["chunks"] = (1, 90, 90)
+    return dataset
+
+
+valid_dataset_0 = make_cube(360, 180, 10)
+# ok, storage chunks unknown
+valid_dataset_1 = make_cube(360, 180, 10).chunk(lat=45)
+# ok, dask chunks equal storage chunks
+valid_dataset_2 = make_chunked_cube(time=1, lat=90, lon=90)
+# ok, dask chunks are multiples of storage chunks
+valid_dataset_3 = make_chunked_cube(time=5, lat=180, lon=180)
+# ok, not chunked by dask
+valid_dataset_4 = make_cube(360, 180, 10).compute()
+valid_dataset_4.chl.encoding["chunks"] = (1, 90, 90)
+
+# split storage chunks in lat, amplification 2
+invalid_dataset_0 = make_chunked_cube(time=1, lat=45, lon=90)
+# straddle storage chunks in lon, amplification 1.5
+invalid_dataset_1 = make_chunked_cube(time=1, lat=90, lon=120)
+
+AlignedChunksTest = RuleTester.define_test(
+    "aligned-chunks",
+    AlignedChunks,
+    valid=[
+        RuleTest(dataset=valid_dataset_0),
+        RuleTest(dataset=valid_dataset_1),
+        RuleTest(dataset=valid_dataset_2),
+        RuleTest(dataset=valid_dataset_3),
+        RuleTest(dataset=valid_dataset_4),
+        RuleTest(dataset=invalid_dataset_1, kwargs={"limit": 1.5}),
+    ],
+    invalid=[
+        RuleTest(
+            dataset=invalid_dataset_0,
+            expected=[
+                "Read amplification exceeds limit: 2.00 > 1.0,"
+                " dask chunks of shape {time: 1, lat: 45, lon: 90}"
+                " are not aligned with storage chunks of shape"
+                " {time: 1, lat: 90, lon: 90}."
+            ],
+        ),
+        RuleTest(
+            dataset=invalid_dataset_1,
+            expected=[
+                "Read amplification exceeds limit: 1.50 > 1.0,"
+                " dask chunks of shape {time: 1, lat: 90, lon: 120}"
+                " are not aligned with storage chunks of shape"
+                " {time: 1, lat: 90, lon: 90}."
+            ],
+        ),
+        RuleTest(dataset=invalid_dataset_0, kwargs={"limit": 1.5}, expected=1),
+    ],
+)
+
+
+class GetReadAmplificationTest(TestCase):
+    def test_aligned(self):
+        self.assertEqual(1.0, _get_read_amplification((100, 100, 100), 100))
+        self.assertEqual(1.0, _get_read_amplification((200, 100), 100))
+        self.assertEqual(1.0, _get_read_amplification((100, 100, 50), 100))
+        self.assertEqual(1.0, _get_read_amplification((250,), 100))
+
+    def test_split(self):
+        self.assertEqual(2.0, _get_read_amplification((50, 50, 50, 50), 100))
+        self.assertEqual(10.0, _get_read_amplification((10,) * 30, 100))
+
+    def test_straddle(self):
+        self.assertAlmostEqual(4 / 3, _get_read_amplification((150, 150), 100))
+        # [0, 90) fetches [0, 100), [90, 180) fetches [0, 180)
+        self.assertAlmostEqual(280 / 180, _get_read_amplification((90, 90), 100))
+
+    def test_empty(self):
+        self.assertEqual(1.0, _get_read_amplification((), 100))
+        self.assertEqual(1.0, _get_read_amplification((0,), 100))
@@ -0,0 +1,116 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+from unittest import TestCase
+
+import xarray as xr
+
+from tests.plugins.xcube.helpers import make_cube
+from xrlint.linter import new_linter
+from xrlint.plugins.xcube import export_plugin
+from xrlint.plugins.xcube.rules.chunk_size import ChunkSize, _suggest_chunk_shape
+from xrlint.result import Suggestion
+from xrlint.testing import RuleTest, RuleTester
+
+MiB = 1024 * 1024
+
+valid_dataset_0 = xr.Dataset(attrs=dict(title="Empty"))
+# ok, not chunked
+valid_dataset_1 = make_cube(360, 180, 3).compute()
+# ok, 8 * 1 * 1800 * 3600 bytes = 49.4 MiB
+valid_dataset_2 = make_cube(3600, 1800, 3)
+valid_dataset_2.chl.encoding["chunks"] = (1, 1800, 3600)
+# ok, single small chunk
+valid_dataset_3 = make_cube(90, 45, 1)
+# ok, coordinates are not checked
+valid_dataset_4 = make_cube(3600, 1800, 3)
+valid_dataset_4.chl.encoding["chunks"] = (1, 1800, 3600)
+valid_dataset_4.lon.encoding["chunks"] = (10,)
+
+# storage chunks of 8 * 1 * 90 * 90 bytes = 63.3 KiB
+invalid_dataset_0 = make_cube(360, 180, 10)
+invalid_dataset_0.chl.encoding["chunks"] = (1, 90, 90)
+# dask chunks of 8 * 3 * 1800 * 3600 bytes = 148.3 MiB
+invalid_dataset_1 = make_cube(3600, 1800, 3).chunk(time=3, lat=1800, lon=3600)
+# storage chunks exceeding the shape
+invalid_dataset_2 = make_cube(3600, 1800, 3)
+invalid_dataset_2.chl.encoding["chunks"] = (10, 2000, 4000)
+
+ChunkSizeTest = RuleTester.define_test(
+    "chunk-size",
+    ChunkSize,
+    valid=[
+        RuleTest(dataset=valid_dataset_0),
+        RuleTest(dataset=valid_dataset_1),
+        RuleTest(dataset=valid_dataset_2),
+        RuleTest(dataset=valid_dataset_3),
+        RuleTest(dataset=valid_dataset_4),
+        RuleTest(dataset=invalid_dataset_0, kwargs={"min_size": 60 * 1024}),
+        RuleTest(dataset=invalid_dataset_1, kwargs={"max_size": 200 * MiB}),
+    ],
+    invalid=[
+        RuleTest(
+            dataset=invalid_dataset_0,
+            expected=[
+                "Chunk size is below minimum: 63.3 KiB < 1.0 MiB,"
+                " variable has 80 chunks of shape {time: 1, lat: 90, lon: 90}."
+            ],
+        ),
+        RuleTest(
+            dataset=invalid_dataset_1,
+            expected=[
+                "Chunk size exceeds maximum: 148.3 MiB > 100.0 MiB,"
+                " variable has one chunk of shape {time: 3, lat: 1800, lon: 3600}."
+            ],
+        ),
+        RuleTest(
+            dataset=invalid_dataset_2,
+            expected=[
+                "Chunk size exceeds maximum: 148.3 MiB > 100.0 MiB,"
+                " variable has one chunk of shape {time: 3, lat: 1800, lon: 3600}."
+            ],
+        ),
+    ],
+)
+
+
+class SuggestChunkShapeTest(TestCase):
+    def test_grow_innermost_dims_first(self):
+        # 63.3 KiB chunks, target 10 MiB
+        self.assertEqual(
+            (1, 360, 3600),
+            _suggest_chunk_shape((10, 1800, 3600), (1, 90, 90), 8, 10 * MiB),
+        )
+
+    def test_grow_is_limited_by_shape(self):
+        self.assertEqual(
+            (10, 180, 360),
+            _suggest_chunk_shape((10, 180, 360), (1, 90, 90), 8, 10 * MiB),
+        )
+
+    def test_shrink_outermost_dims_first(self):
+        # 148.3 MiB chunks, target 10 MiB
+        self.assertEqual(
+            (1, 364, 3600),
+            _suggest_chunk_shape((3, 1800, 3600), (3, 1800, 3600), 8, 10 * MiB),
+        )
+
+    def test_suggestion_is_reported(self):
+        dataset = make_cube(3600, 1800, 10)
+        dataset.chl.encoding["chunks"] = (1, 90, 90)
+        linter = new_linter(
+            {"plugins": {"xcube": export_plugin()}},
+            rules={"xcube/chunk-size": "warn"},
+        )
+        result = linter.validate(dataset, file_path="test.zarr")
+        self.assertEqual(1, len(result.messages))
+        self.assertEqual(
+            [
+                Suggestion(
+                    "Use chunks of shape {time: 1, lat: 360, lon: 3600},"
+                    " which results in 50 chunks of 9.9 MiB."
+                )
+            ],
+            result.messages[0].suggestions,
+        )
@@ -2,9 +2,13 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import subprocess
+import sys
 from unittest import TestCase
 
 from xrlint.plugins.xcube import export_plugin
+from xrlint.plugins.xcube.manifest import RULE_MANIFEST
+from xrlint.util.importutil import import_submodules
 
 
 class ExportPluginTest(TestCase):
@@ -12,7 +16,9 @@ class ExportPluginTest(TestCase):
         plugin = export_plugin()
         self.assertEqual(
             {
+                "aligned-chunks",
                 "any-spatial-data-var",
+                "chunk-size",
                 "cube-dims-order",
                 "data-var-colors",
                 "dataset-title",
@@ -47,3 +53,57 @@ class ExportPluginTest(TestCase):
             all_rule_names,
             set(plugin.configs["recommended"][-1].rules.keys()),
         )
+
+    def test_manifest_is_up_to_date(self):
+        plugin = export_plugin()
+        import_submodules("xrlint.plugins.xcube.rules")
+        # Recreate the manifest using "python -m mkrulemanifest"
+        self.assertEqual(
+            {
+                rule_name: (rule.op_class.__module__, rule.meta)
+                for rule_name, rule in plugin.rules.items()
+            },
+            RULE_MANIFEST,
+        )
+
+    def test_manifest_keeps_definition_order(self):
+        # Rules defined by importing their modules, as before
+        # the manifest was introduced, and the "all" config,
+        # each in a fresh process
+        eager_code = (
+            "from xrlint.plugins.xcube.plugin import plugin\n"
+            "from xrlint.util.importutil import import_submodules\n"
+            "import_submodules('xrlint.plugins.xcube.rules')\n"
+            "print(list(plugin.rules.keys()))\n"
+        )
+        config_code = (
+            "from xrlint.plugins.xcube import export_plugin\n"
+            "rules = export_plugin().configs['all'][-1].rules\n"
+            "print([rule_id.split('/')[-1] for rule_id in rules.keys()])\n"
+        )
+        expected = f"{list(RULE_MANIFEST.keys())}\n"
+        for code in (eager_code, config_code):
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            self.assertEqual(expected, output)
+
+    def test_rules_are_imported_lazily(self):
+        code = (
+            "import sys\n"
+            "from xrlint.plugins.xcube import export_plugin\n"
+            "plugin = export_plugin()\n"
+            "print(sorted(m for m in sys.modules if '.xcube.rules.' in m))\n"
+            "plugin.rules['any-spatial-data-var'].op_class\n"
+            "print(sorted(m for m in sys.modules if '.xcube.rules.' in m))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(
+            "[]\n['xrlint.plugins.xcube.rules.any_spatial_data_var']\n",
+            output,
+        )
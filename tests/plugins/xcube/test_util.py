@@ -4,8 +4,14 @@
 
 from unittest import TestCase
 
-from xrlint.plugins.xcube.util import is_absolute_path
-from xrlint.plugins.xcube.util import resolve_path
+from tests.plugins.xcube.helpers import make_cube
+from xrlint.plugins.xcube.util import (
+    format_chunk_shape,
+    get_chunk_shape,
+    get_storage_chunks,
+    is_absolute_path,
+    resolve_path,
+)
 
 
 class UtilTest(TestCase):
@@ -34,3 +40,27 @@ class UtilTest(TestCase):
             "/home/data", resolve_path("../data", root_path="/home/forman")
         )
         self.assertEqual("s3://opensr/test.zarr", resolve_path("s3://opensr/test.zarr"))
+
+    def test_get_storage_chunks(self):
+        dataset = make_cube(360, 180, 3)
+        self.assertIsNone(get_storage_chunks(dataset.chl))
+        dataset.chl.encoding["chunks"] = (1, 90, 90)
+        self.assertEqual((1, 90, 90), get_storage_chunks(dataset.chl))
+        dataset.chl.encoding = {"chunksizes": [1, 45, 45]}
+        self.assertEqual((1, 45, 45), get_storage_chunks(dataset.chl))
+        dataset.chl.encoding = {"chunks": (1, 90)}
+        self.assertIsNone(get_storage_chunks(dataset.chl))
+
+    def test_get_chunk_shape(self):
+        dataset = make_cube(360, 180, 3)
+        self.assertEqual((1, 90, 90), get_chunk_shape(dataset.chl))
+        dataset.chl.encoding["chunks"] = (1, 200, 400)
+        self.assertEqual((1, 180, 360), get_chunk_shape(dataset.chl))
+        self.assertIsNone(get_chunk_shape(dataset.lon))
+
+    def test_format_chunk_shape(self):
+        self.assertEqual("{}", format_chunk_shape((), ()))
+        self.assertEqual(
+            "{time: 1, lat: 90, lon: 90}",
+            format_chunk_shape(("time", "lat", "lon"), (1, 90, 90)),
+        )
@@ -4,6 +4,7 @@
 
 from typing import Any
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 import xarray as xr
@@ -274,6 +275,28 @@ class ConfigTest(TestCase):
             config.compute_config_object(file_path),
         )
 
+    def test_compute_config_is_shared(self):
+        config = Config(
+            [
+                ConfigObject(settings={"a": 1}),
+                ConfigObject(files=["**/*.zarr"], settings={"b": 2}),
+                ConfigObject(files=["**/*.nc"], settings={"c": 3}),
+            ]
+        )
+        with patch.object(ConfigObject, "merge", autospec=True) as merge:
+            merge.side_effect = lambda self, other: ConfigObject(
+                settings={**self.settings, **other.settings}
+            )
+            zarr_1 = config.compute_config_object("s3://bucket/chl-1.zarr")
+            zarr_2 = config.compute_config_object("s3://bucket/chl-2.zarr")
+            nc_1 = config.compute_config_object("s3://bucket/chl-1.nc")
+            nc_2 = config.compute_config_object("s3://bucket/chl-2.nc")
+            self.assertEqual(2, merge.call_count)
+        self.assertEqual(ConfigObject(settings={"a": 1, "b": 2}), zarr_1)
+        self.assertEqual(ConfigObject(settings={"a": 1, "c": 3}), nc_1)
+        self.assertIs(zarr_1, zarr_2)
+        self.assertIs(nc_1, nc_2)
+
     def test_split_global_filter(self):
         config = Config(
             [
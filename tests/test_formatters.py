@@ -14,6 +14,8 @@ class ImportFormattersTest(TestCase):
             {
                 "html",
                 "json",
+                "ndjson",
+                "parquet",
                 "simple",
             },
             set(registry.keys()),
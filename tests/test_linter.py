@@ -2,11 +2,17 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import os
+import shutil
+import tempfile
 from typing import Any
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
 import xarray as xr
 
+# noinspection PyProtectedMember
+from xrlint._linter.validate import OpenedDatasets
 from xrlint.config import Config, ConfigObject
 from xrlint.constants import CORE_PLUGIN_NAME, DATASET_ROOT_NAME
 from xrlint.linter import Linter, new_linter
@@ -89,6 +95,13 @@ class LinterValidateWithConfigTest(TestCase):
         result = linter.validate(xr.Dataset())
         self.assert_result_ok(result, "No configuration given or matches '<dataset>'.")
 
+    def test_no_config_closes_opened_datasets(self):
+        dataset = MagicMock(spec=xr.Dataset)
+        opened = OpenedDatasets(datasets=[(dataset, "ds.zarr")])
+        result = Linter().validate(opened, file_path="ds.zarr")
+        self.assert_result_ok(result, "No configuration given or matches 'ds.zarr'.")
+        dataset.close.assert_called_once_with()
+
     def assert_result_ok(self, result: Result, expected_message: str):
         self.assertIsInstance(result, Result)
         self.assertEqual(1, len(result.messages))
@@ -171,6 +184,22 @@ class LinterValidateTest(TestCase):
             list(self.linter.config.objects[0].plugins["test"].rules.keys()),
         )
 
+    def test_linter_reuses_rule_ops(self):
+        rule_ops = []
+
+        class RecordingOp(RuleOp):
+            def validate_dataset(self, ctx: RuleContext, node: DatasetNode):
+                rule_ops.append(self)
+
+        plugin = new_plugin(name="rec")
+        plugin.define_rule("recording", op_class=RecordingOp)
+        linter = Linter(plugins={"rec": plugin})
+        for _ in range(3):
+            linter.validate(xr.Dataset(), rules={"rec/recording": "error"})
+        self.assertEqual(3, len(rule_ops))
+        self.assertIs(rule_ops[0], rule_ops[1])
+        self.assertIs(rule_ops[0], rule_ops[2])
+
     def test_linter_respects_rule_severity_error(self):
         result = self.linter.validate(
             xr.Dataset(), rules={"test/dataset-without-data-vars": 2}
@@ -436,3 +465,148 @@ class LinterValidateTest(TestCase):
             ],
             result.messages,
         )
+
+
+class LinterMetadataOnlyTest(TestCase):
+    def setUp(self):
+        plugin = new_plugin(name="test")
+
+        @plugin.define_rule("count-indexes")
+        class CountIndexes(RuleOp):
+            def validate_dataset(self, ctx: RuleContext, node: DatasetNode):
+                ctx.report(f"{len(node.dataset.xindexes)} indexes")
+
+        @plugin.define_rule("read-data", needs_data=True)
+        class ReadData(RuleOp):
+            def validate_variable(self, ctx: RuleContext, node: VariableNode):
+                ctx.report(f"{node.array.values.tolist()}")
+
+        self.linter = Linter(
+            plugins={"test": plugin},
+            rules={"test/count-indexes": "error", "test/read-data": "error"},
+        )
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-")
+        self.path = os.path.join(self.temp_dir, "test.zarr")
+        xr.Dataset(coords={"x": [1, 2]}).to_zarr(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_all_rules(self):
+        result = self.linter.validate(self.path)
+        self.assertEqual(["1 indexes", "[1, 2]"], [m.message for m in result.messages])
+
+    def test_metadata_only(self):
+        result = self.linter.validate(self.path, linter_options={"metadata_only": True})
+        self.assertEqual(["0 indexes"], [m.message for m in result.messages])
+
+    def test_metadata_only_without_create_default_indexes(self):
+        # Older xarray versions do not support create_default_indexes,
+        # so indexes are created, but rules that need data are skipped
+        with patch(
+            "xrlint._linter.validate._supports_create_default_indexes",
+            return_value=False,
+        ):
+            result = self.linter.validate(
+                self.path, linter_options={"metadata_only": True}
+            )
+        self.assertEqual(["1 indexes"], [m.message for m in result.messages])
+
+
+class LinterIOStatsTest(TestCase):
+    def setUp(self):
+        plugin = new_plugin(name="test")
+
+        @plugin.define_rule("io-stats")
+        class IOStatsRule(RuleOp):
+            def validate_dataset(self, ctx: RuleContext, node: DatasetNode):
+                io_stats = ctx.io_stats
+                ctx.report(f"{io_stats.get_count if io_stats else None} requests")
+
+        self.linter = Linter(plugins={"test": plugin}, rules={"test/io-stats": "error"})
+        self.temp_dir = tempfile.mkdtemp(prefix="xrlint-")
+        self.path = os.path.join(self.temp_dir, "test.zarr")
+        xr.Dataset(coords={"x": [1, 2]}).to_zarr(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_zarr(self):
+        result = self.linter.validate(self.path)
+        self.assertIsNotNone(result.io_stats)
+        self.assertGreater(result.io_stats.get_count, 0)
+        self.assertGreater(result.io_stats.bytes_read, 0)
+        self.assertEqual(
+            [f"{result.io_stats.get_count} requests"],
+            [m.message for m in result.messages],
+        )
+        self.assertEqual(
+            result.io_stats.get_count, result.to_json()["io_stats"]["get_count"]
+        )
+
+    def test_dataset(self):
+        result = self.linter.validate(xr.Dataset(), file_path="test.zarr")
+        self.assertIsNone(result.io_stats)
+        self.assertEqual(["None requests"], [m.message for m in result.messages])
+
+
+class LinterOpenZarrTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp(prefix="xrlint-")
+        dataset = xr.Dataset({"v": xr.DataArray([1, 2, 3], dims="x")})
+        datatree = xr.DataTree.from_dict({"/": dataset, "/group": dataset})
+        for zarr_format in (2, 3):
+            for consolidated in (True, False):
+                name = f"v{zarr_format}-{'cons' if consolidated else 'raw'}"
+                dataset.to_zarr(
+                    cls.path(f"{name}.zarr"),
+                    zarr_format=zarr_format,
+                    consolidated=consolidated,
+                )
+                datatree.to_zarr(
+                    cls.path(f"tree-{name}.zarr"),
+                    zarr_format=zarr_format,
+                    consolidated=consolidated,
+                )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    @classmethod
+    def path(cls, name: str) -> str:
+        return os.path.join(cls.temp_dir, name)
+
+    def setUp(self):
+        plugin = new_plugin(name="test")
+
+        @plugin.define_rule("variables")
+        class Variables(RuleOp):
+            def validate_variable(self, ctx: RuleContext, node: VariableNode):
+                # Reads the single chunk of the variable
+                node.array.load()
+                ctx.report(f"{node.name}")
+
+        self.linter = Linter(
+            plugins={"test": plugin}, rules={"test/variables": "error"}
+        )
+
+    def test_zarr_stores(self):
+        for zarr_format in (2, 3):
+            for consolidated in ("cons", "raw"):
+                for prefix in ("", "tree-"):
+                    name = f"{prefix}v{zarr_format}-{consolidated}.zarr"
+                    with self.subTest(name=name):
+                        result = self.linter.validate(self.path(name))
+                        self.assertEqual(0, result.fatal_error_count)
+                        messages = [m.message for m in result.messages]
+                        self.assertIn("v", messages)
+                        self.assertIsNotNone(result.io_stats)
+                        self.assertGreater(result.io_stats.get_count, 0)
+                        if consolidated == "cons":
+                            # Metadata is not fetched again after sniffing,
+                            # only the chunks read are
+                            self.assertEqual(
+                                messages.count("v"), result.io_stats.get_count
+                            )
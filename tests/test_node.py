@@ -4,33 +4,120 @@
 
 from unittest import TestCase
 
-from xrlint.node import XarrayNode
+import xarray as xr
+
+from xrlint.node import (
+    AttrNode,
+    AttrsNode,
+    DatasetNode,
+    DataTreeNode,
+    NodeKind,
+    VariableNode,
+)
 
 
 class XarrayNodeTest(TestCase):
-    def node(self, path: str):
-        return XarrayNode(path=path, parent=None)
+    def dataset_node(self):
+        return DatasetNode(parent=None, name="ds", dataset=xr.Dataset())
 
     def attrs_node(self):
-        return self.node("dataset.attrs")
+        return AttrsNode(parent=self.dataset_node(), attrs={})
 
     def coords_node(self):
-        return self.node("dataset.coords['x']")
+        return self.variable_node(NodeKind.COORD, "x")
 
     def data_var_node(self):
-        return self.node("dataset.data_vars['v']")
+        return self.variable_node(NodeKind.DATA_VAR, "v")
+
+    def variable_node(self, kind: NodeKind, name: str):
+        return VariableNode(
+            parent=self.dataset_node(), kind=kind, name=name, array=xr.DataArray()
+        )
+
+    def attr_node(self, variable_node: VariableNode):
+        return AttrNode(
+            parent=AttrsNode(parent=variable_node, attrs={"units": "m"}),
+            name="units",
+            value="m",
+        )
 
     def test_in_coords(self):
         self.assertEqual(False, self.attrs_node().in_coords())
         self.assertEqual(True, self.coords_node().in_coords())
         self.assertEqual(False, self.data_var_node().in_coords())
+        self.assertEqual(True, self.attr_node(self.coords_node()).in_coords())
 
     def test_in_data_vars(self):
         self.assertEqual(False, self.attrs_node().in_data_vars())
         self.assertEqual(False, self.coords_node().in_data_vars())
         self.assertEqual(True, self.data_var_node().in_data_vars())
+        self.assertEqual(True, self.attr_node(self.data_var_node()).in_data_vars())
 
     def test_in_root(self):
+        self.assertEqual(True, self.dataset_node().in_root())
         self.assertEqual(True, self.attrs_node().in_root())
         self.assertEqual(False, self.coords_node().in_root())
         self.assertEqual(False, self.data_var_node().in_root())
+
+    def test_path(self):
+        self.assertEqual("ds", self.dataset_node().path)
+        self.assertEqual("ds.attrs", self.attrs_node().path)
+        self.assertEqual("ds.coords['x']", self.coords_node().path)
+        self.assertEqual("ds.data_vars['v']", self.data_var_node().path)
+        self.assertEqual(
+            "ds.data_vars['v'].attrs['units']",
+            self.attr_node(self.data_var_node()).path,
+        )
+        dt_node = DataTreeNode(parent=None, name="dt", datatree=xr.DataTree())
+        self.assertEqual(
+            "dt/r10m",
+            DataTreeNode(
+                parent=dt_node, kind=NodeKind.CHILD, name="r10m", datatree=xr.DataTree()
+            ).path,
+        )
+
+    def test_eq(self):
+        dataset_node = DatasetNode(parent=None, name="ds", dataset=xr.Dataset())
+        array = xr.DataArray()
+
+        def variable_node(kind: NodeKind, name: str):
+            return VariableNode(parent=dataset_node, kind=kind, name=name, array=array)
+
+        node = variable_node(NodeKind.DATA_VAR, "v")
+        self.assertEqual(variable_node(NodeKind.DATA_VAR, "v"), node)
+        # Regardless whether the path has been computed
+        self.assertEqual("ds.data_vars['v']", node.path)
+        self.assertEqual(variable_node(NodeKind.DATA_VAR, "v"), node)
+        self.assertNotEqual(variable_node(NodeKind.COORD, "v"), node)
+        self.assertNotEqual(variable_node(NodeKind.DATA_VAR, "w"), node)
+
+    def test_nodes_are_slotted(self):
+        for node in (
+            self.dataset_node(),
+            self.attrs_node(),
+            self.coords_node(),
+            self.attr_node(self.coords_node()),
+        ):
+            self.assertFalse(hasattr(node, "__dict__"), msg=type(node).__name__)
+
+    def test_given_path(self):
+        dataset_node = DatasetNode(
+            parent=None, _path="dataset", name="ds", dataset=xr.Dataset()
+        )
+        self.assertEqual("dataset", dataset_node.path)
+        self.assertEqual("dataset.attrs", AttrsNode(parent=dataset_node, attrs={}).path)
+        self.assertEqual(True, dataset_node.in_root())
+        # Nodes created with a path only, without their kind
+        for path, in_coords, in_data_vars in (
+            ("dataset.coords['x']", True, False),
+            ("dataset.data_vars['v']", False, True),
+        ):
+            variable_node = VariableNode(
+                parent=dataset_node, _path=path, name="v", array=xr.DataArray()
+            )
+            attr_node = self.attr_node(variable_node)
+            for node in (variable_node, attr_node):
+                self.assertEqual(in_coords, node.in_coords(), msg=node.path)
+                self.assertEqual(in_data_vars, node.in_data_vars(), msg=node.path)
+                self.assertEqual(False, node.in_root(), msg=node.path)
+            self.assertEqual(f"{path}.attrs['units']", attr_node.path)
@@ -10,7 +10,7 @@ import xarray as xr
 from xrlint.plugin import Plugin, PluginMeta, new_plugin
 from xrlint.processor import Processor, ProcessorOp
 from xrlint.result import Message
-from xrlint.rule import Rule, RuleOp, define_rule
+from xrlint.rule import LazyRule, Rule, RuleMeta, RuleOp, define_rule
 
 
 class PluginTest(TestCase):
@@ -22,6 +22,27 @@ class PluginTest(TestCase):
         plugin = new_plugin(name="hello", version="2.4.5")
         self.assertEqual(Plugin(meta=PluginMeta(name="hello", version="2.4.5")), plugin)
 
+    def test_define_lazy_rules(self):
+        plugin = new_plugin(name="hello")
+
+        @plugin.define_rule("r1")
+        class MyRule1(RuleOp):
+            """This is my 1st rule."""
+
+        rule1 = plugin.rules["r1"]
+        plugin.define_lazy_rules(
+            {
+                "r1": ("my_plugin.rules.r1", RuleMeta(name="r1")),
+                "r2": ("my_plugin.rules.r2", RuleMeta(name="r2")),
+            }
+        )
+        # Already defined rules are not changed
+        self.assertIs(rule1, plugin.rules["r1"])
+        rule2 = plugin.rules["r2"]
+        self.assertIsInstance(rule2, LazyRule)
+        self.assertEqual("my_plugin.rules.r2", rule2.module_name)
+        self.assertEqual(RuleMeta(name="r2"), rule2.meta)
+
     def test_from_value_ok_plugin(self):
         plugin = Plugin(meta=PluginMeta(name="hello"))
         self.assertIs(plugin, Plugin.from_value(plugin))
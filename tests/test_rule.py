@@ -2,12 +2,13 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import pickle
 import unittest
 from unittest import TestCase
 
 import pytest
 
-from xrlint.rule import Rule, RuleConfig, RuleMeta, RuleOp, define_rule
+from xrlint.rule import LazyRule, Rule, RuleConfig, RuleMeta, RuleOp, define_rule
 
 
 class MyRule1(RuleOp):
@@ -146,6 +147,93 @@ class DefineRuleTest(unittest.TestCase):
             define_rule(op_class=DefineRuleTest)
 
 
+class LazyRuleTest(TestCase):
+    def test_op_class_is_resolved_from_registry(self):
+        registry = {}
+        meta = RuleMeta(name="my-rule-1", description="This is my 1st rule.")
+        lazy_rule = LazyRule(meta, __name__, registry)
+        registry["my-rule-1"] = lazy_rule
+        self.assertIs(meta, lazy_rule.meta)
+        self.assertEqual(__name__, lazy_rule.module_name)
+        self.assertIsInstance(lazy_rule, Rule)
+
+        with pytest.raises(
+            ValueError,
+            match=f"module '{__name__}' does not define rule 'my-rule-1'",
+        ):
+            # noinspection PyStatementEffect
+            lazy_rule.op_class
+
+        rule = define_rule(op_class=MyRule1, registry=registry)
+        self.assertIs(rule, registry["my-rule-1"])
+        self.assertIs(MyRule1, lazy_rule.op_class)
+        self.assertEqual(rule, lazy_rule)
+        self.assertEqual(lazy_rule, rule)
+
+    def test_pickle(self):
+        registry = {}
+        meta = RuleMeta(name="my-rule-1", description="This is my 1st rule.")
+        lazy_rule = LazyRule(meta, __name__, registry)
+        registry["my-rule-1"] = lazy_rule
+        define_rule(op_class=MyRule1, registry=registry)
+        rule = pickle.loads(pickle.dumps(lazy_rule))
+        self.assertIs(LazyRule, type(rule))
+        self.assertEqual(meta, rule.meta)
+        self.assertIs(MyRule1, rule.op_class)
+
+    def test_pickle_does_not_import(self):
+        lazy_rule = LazyRule(RuleMeta(name="my-rule-1"), "my_rules.my_rule_1", {})
+        lazy_rule2 = pickle.loads(pickle.dumps(lazy_rule))
+        self.assertIs(LazyRule, type(lazy_rule2))
+        self.assertEqual("my_rules.my_rule_1", lazy_rule2.module_name)
+        self.assertEqual(lazy_rule, lazy_rule2)
+        with pytest.raises(ModuleNotFoundError):
+            # noinspection PyStatementEffect
+            lazy_rule2.op_class
+
+    def test_pickle_without_registry(self):
+        lazy_rule = LazyRule(RuleMeta(name="var-units"), "xrlint.plugins.core.plugin")
+        lazy_rule2 = pickle.loads(pickle.dumps(lazy_rule))
+        with pytest.raises(
+            ValueError,
+            match="does not define rule 'var-units'",
+        ):
+            # noinspection PyStatementEffect
+            lazy_rule2.op_class
+
+        lazy_rule = LazyRule(
+            RuleMeta(name="var-units"), "xrlint.plugins.core.rules.var_units"
+        )
+        lazy_rule2 = pickle.loads(pickle.dumps(lazy_rule))
+        self.assertEqual("VarUnits", lazy_rule2.op_class.__name__)
+
+    def test_eq_and_hash_do_not_import(self):
+        meta = RuleMeta(name="my-rule-1")
+        lazy_rule = LazyRule(meta, "my_rules.my_rule_1", {})
+        lazy_rule2 = LazyRule(RuleMeta(name="my-rule-1"), "my_rules.my_rule_1", {})
+        lazy_rule3 = LazyRule(meta, "my_rules.my_rule_2", {})
+        self.assertEqual(lazy_rule, lazy_rule2)
+        self.assertEqual(hash(lazy_rule), hash(lazy_rule2))
+        self.assertNotEqual(lazy_rule, lazy_rule3)
+        self.assertEqual(2, len({lazy_rule, lazy_rule2, lazy_rule3}))
+        self.assertNotEqual(lazy_rule, export_rule())
+
+    def test_hash_is_consistent_with_rule(self):
+        registry = {}
+        meta = RuleMeta(name="my-rule-1", description="This is my 1st rule.")
+        lazy_rule = LazyRule(meta, __name__, registry)
+        registry["my-rule-1"] = lazy_rule
+        rule = define_rule(op_class=MyRule1, registry=registry)
+        self.assertEqual(rule, lazy_rule)
+        self.assertEqual(hash(rule), hash(lazy_rule))
+        self.assertEqual(hash(rule), hash(export_rule()))
+
+    def test_repr(self):
+        lazy_rule = LazyRule(RuleMeta(name="my-rule-1"), "my_rules.my_rule_1", {})
+        self.assertTrue(repr(lazy_rule).startswith("LazyRule(meta=RuleMeta("))
+        self.assertTrue(repr(lazy_rule).endswith(", module_name='my_rules.my_rule_1')"))
+
+
 class RuleConfigTest(TestCase):
     def test_class_props(self):
         self.assertEqual("rule_config", RuleConfig.value_name())
@@ -0,0 +1,86 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from xrlint.util.concurrency import map_bounded
+
+
+def _delayed_square(x: int) -> int:
+    # Make earlier items finish later
+    time.sleep(0.01 * (5 - x))
+    return x * x
+
+
+class MapBoundedTest(TestCase):
+    def test_ordered(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                map_bounded(
+                    executor,
+                    _delayed_square,
+                    ((x,) for x in range(6)),
+                    max_pending=3,
+                    ordered=True,
+                )
+            )
+        self.assertEqual([0, 1, 4, 9, 16, 25], results)
+
+    def test_unordered(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                map_bounded(
+                    executor,
+                    _delayed_square,
+                    ((x,) for x in range(6)),
+                    max_pending=3,
+                    ordered=False,
+                )
+            )
+        self.assertEqual([0, 1, 4, 9, 16, 25], sorted(results))
+
+    def test_input_is_consumed_lazily(self):
+        consumed = []
+
+        def args_iterable():
+            for x in range(10):
+                consumed.append(x)
+                yield (x,)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = map_bounded(
+                executor, _delayed_square, args_iterable(), max_pending=2
+            )
+            self.assertEqual(0, next(results))
+            self.assertEqual(2, len(consumed))
+            results.close()
+
+    def test_errors_are_propagated(self):
+        def fail(x):
+            raise ValueError(f"bad {x}")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(ValueError):
+                list(map_bounded(executor, fail, [(1,), (2,)], max_pending=2))
+
+    def test_results_not_yielded_are_discarded(self):
+        discarded = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = map_bounded(
+                executor,
+                _delayed_square,
+                ((x,) for x in range(6)),
+                max_pending=4,
+                discard=discarded.append,
+            )
+            self.assertEqual(0, next(results))
+            results.close()
+        # Submitted calls that are running or done cannot be
+        # cancelled, their results are discarded
+        self.assertLessEqual(1, len(discarded))
+        self.assertEqual(
+            sorted(discarded), [x * x for x in range(1, 1 + len(discarded))]
+        )
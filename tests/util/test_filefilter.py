@@ -4,7 +4,7 @@
 
 import unittest
 
-from xrlint.util.filefilter import FileFilter
+from xrlint.util.filefilter import FileFilter, FileFilterSet
 from xrlint.util.filepattern import FilePattern
 
 
@@ -89,3 +89,131 @@ class FileFilterTest(unittest.TestCase):
         self.assertEqual(False, file_filter.accept("c.yaml"))
         self.assertEqual(False, file_filter.accept("test/config.json"))
         self.assertEqual(False, file_filter.accept("test/config.yaml"))
+
+    def test_accept_is_same_as_sequential_matching(self):
+        patterns = [
+            (["**/*.zarr"], ["**/temp/*", "!**/temp/x.zarr", "!**/temp/y.zarr"]),
+            ([], ["!**/*.nc", "**/temp/*", "!**/*.zarr", "**/x.*", "!**/x.zarr"]),
+            ([], ["**/temp/*", "**/*.nc", "!**/temp/*.nc"]),
+            (["**/*.zarr", "**/*.nc"], ["**/x.*", "!**/x.nc", "**/y.*"]),
+        ]
+        paths = [
+            "x.zarr",
+            "x.nc",
+            "y.zarr",
+            "./temp/x.zarr",
+            "./temp/y.zarr",
+            "./temp/z.zarr",
+            "./temp/x.nc",
+            "./temp/z.nc",
+            "./temp/README.md",
+            "s3://bucket/temp/y.nc/",
+        ]
+        for files, ignores in patterns:
+            file_filter = FileFilter.from_patterns(files, ignores)
+            for path in paths:
+                self.assertEqual(
+                    _accept_sequentially(file_filter, path),
+                    file_filter.accept(path),
+                    msg=f"files={files!r}, ignores={ignores!r}, path={path!r}",
+                )
+
+
+class FileFilterSetTest(unittest.TestCase):
+    def test_accept_is_same_as_filter_accept(self):
+        file_filters = [
+            FileFilter.from_patterns(["**/*.zarr"], ["**/temp/*", "!**/temp/x.zarr"]),
+            FileFilter.from_patterns(
+                [], ["!**/*.nc", "**/temp/*", "!**/*.zarr", "**/x.*", "!**/x.zarr"]
+            ),
+            FileFilter(),
+            FileFilter.from_patterns([], ["**/temp/*", "**/*.nc", "!**/temp/*.nc"]),
+            FileFilter.from_patterns(["**/*.zarr", "**/*.nc"], ["**/x.*", "**/y.*"]),
+            FileFilter.from_patterns(["!**/*.nc"], []),
+            FileFilter.from_patterns(["**/*.zarr"], ["**/temp/*"]),
+        ]
+        paths = [
+            "x.zarr",
+            "x.nc",
+            "y.zarr",
+            "./temp/x.zarr",
+            "./temp/y.zarr",
+            "./temp/z.zarr",
+            "./temp/x.nc",
+            "./temp/z.nc",
+            "./temp/README.md",
+            "s3://bucket/temp/y.nc/",
+        ]
+        file_filter_set = FileFilterSet(file_filters)
+        for path in paths:
+            expected = 0
+            for i, file_filter in enumerate(file_filters):
+                if file_filter.accept(path):
+                    expected |= 1 << i
+            self.assertEqual(expected, file_filter_set.accept(path), msg=path)
+
+    def test_accept_empty(self):
+        self.assertEqual(0, FileFilterSet([]).accept("x.zarr"))
+        self.assertEqual(0b11, FileFilterSet([FileFilter()] * 2).accept("x.zarr"))
+
+
+def _accept_sequentially(file_filter: FileFilter, file_path: str) -> bool:
+    """Reference implementation that matches patterns one by one."""
+    if file_filter.files and not any(p.match(file_path) for p in file_filter.files):
+        return False
+    excluded = False
+    for p in file_filter.ignores:
+        if not p.negate:
+            if excluded:
+                return False
+            excluded = p.match(file_path)
+        elif excluded and p.match(file_path):
+            excluded = False
+    return not excluded
+
+
+class FileFilterWalkTest(unittest.TestCase):
+    def test_may_accept_below(self):
+        file_filter = FileFilter.from_patterns(["data/**/*.zarr"], ["**/archive/**"])
+        self.assertEqual(True, file_filter.may_accept_below("data"))
+        self.assertEqual(True, file_filter.may_accept_below("data/cubes"))
+        self.assertEqual(False, file_filter.may_accept_below("docs"))
+        self.assertEqual(False, file_filter.may_accept_below("data/archive"))
+
+        # negated ignores may re-include paths
+        file_filter = FileFilter.from_patterns(
+            [], ["**/archive/**", "!**/archive/**/*.zarr"]
+        )
+        self.assertEqual(True, file_filter.may_accept_below("data/archive"))
+
+        self.assertEqual(True, FileFilter().may_accept_below("data"))
+
+    def test_get_start_dirs(self):
+        file_filter = FileFilter.from_patterns(
+            ["s3://bucket/data/cubes/*.zarr", "s3://bucket/data/**/*.nc", "docs/*"],
+            None,
+        )
+        self.assertEqual(
+            ["s3://bucket/data"], file_filter.get_start_dirs("s3://bucket")
+        )
+        self.assertEqual(
+            ["s3://bucket/data/"], file_filter.get_start_dirs("s3://bucket/data/")
+        )
+        self.assertEqual(
+            ["s3://bucket/data/cubes"],
+            file_filter.get_start_dirs("s3://bucket/data/cubes"),
+        )
+        self.assertEqual([], file_filter.get_start_dirs("s3://bucket/images"))
+        self.assertEqual([], file_filter.get_start_dirs("s3://bucket/dat"))
+
+        file_filter = FileFilter.from_patterns(
+            ["s3://bucket/data/a/*.zarr", "s3://bucket/data/b/**/*.zarr"], None
+        )
+        self.assertEqual(
+            ["s3://bucket/data/a", "s3://bucket/data/b"],
+            file_filter.get_start_dirs("s3://bucket"),
+        )
+
+        file_filter = FileFilter.from_patterns(["**/*.zarr", "data/*.nc"], None)
+        self.assertEqual(["s3://bucket"], file_filter.get_start_dirs("s3://bucket"))
+        self.assertEqual(["."], FileFilter().get_start_dirs("."))
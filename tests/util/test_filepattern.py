@@ -4,7 +4,7 @@
 
 import unittest
 
-from xrlint.util.filepattern import FilePattern
+from xrlint.util.filepattern import FilePattern, FilePatternSet
 
 
 class MinimatchTest(unittest.TestCase):
@@ -189,3 +189,110 @@ class MinimatchTest(unittest.TestCase):
         self.assertEqual(True, matcher.match("dir/"))
         self.assertEqual(False, matcher.match("dir1"))
         self.assertEqual(False, matcher.match("dir/dir2"))
+
+    def test_dir_prefix(self):
+        self.assertEqual("data/cubes", FilePattern("data/cubes/*.zarr").dir_prefix)
+        self.assertEqual("data/cubes", FilePattern("data/cubes/x.zarr").dir_prefix)
+        self.assertEqual("data", FilePattern("data/cube?/x.zarr").dir_prefix)
+        self.assertEqual("s3://bucket", FilePattern("s3://bucket/**/*.nc").dir_prefix)
+        self.assertEqual("", FilePattern("**/*.zarr").dir_prefix)
+        self.assertEqual("", FilePattern("x.zarr").dir_prefix)
+        self.assertEqual("", FilePattern("!data/*.zarr").dir_prefix)
+        self.assertEqual("", FilePattern("").dir_prefix)
+
+    def test_may_match_below(self):
+        pattern = FilePattern("data/*/cubes/**/*.zarr")
+        self.assertEqual(True, pattern.may_match_below("data"))
+        self.assertEqual(True, pattern.may_match_below("data/2025/"))
+        self.assertEqual(True, pattern.may_match_below("data/2025/cubes"))
+        self.assertEqual(True, pattern.may_match_below("data/2025/cubes/a/b"))
+        self.assertEqual(False, pattern.may_match_below("docs"))
+        self.assertEqual(False, pattern.may_match_below("data/2025/images"))
+
+        pattern = FilePattern("data/*.zarr")
+        self.assertEqual(True, pattern.may_match_below("data"))
+        self.assertEqual(False, pattern.may_match_below("data/x.zarr"))
+
+        self.assertEqual(True, FilePattern("**/*.zarr").may_match_below("data"))
+        self.assertEqual(True, FilePattern("dat?/x").may_match_below("data/y"))
+        self.assertEqual(True, FilePattern("!data/**").may_match_below("docs"))
+        self.assertEqual(True, FilePattern("").may_match_below("docs"))
+        self.assertEqual(False, FilePattern("# data/**").may_match_below("data"))
+
+    def test_match_all_below(self):
+        pattern = FilePattern("**/archive/**")
+        self.assertEqual(True, pattern.match_all_below("data/archive"))
+        self.assertEqual(True, pattern.match_all_below("archive/"))
+        self.assertEqual(False, pattern.match_all_below("data"))
+
+        self.assertEqual(True, FilePattern("**").match_all_below("data"))
+        self.assertEqual(True, FilePattern("").match_all_below("data"))
+        self.assertEqual(False, FilePattern("**/archive").match_all_below("archive"))
+        self.assertEqual(False, FilePattern("!archive/**").match_all_below("archive"))
+        self.assertEqual(
+            True,
+            FilePattern("!archive/**", flip_negate=True).match_all_below("archive"),
+        )
+
+
+class FilePatternSetTest(unittest.TestCase):
+    def test_match(self):
+        pattern_set = FilePatternSet(
+            [FilePattern("**/*.zarr"), FilePattern("dir/"), FilePattern("# *.nc")]
+        )
+        self.assertEqual(3, len(pattern_set.patterns))
+        self.assertEqual(True, pattern_set.match("fod.zarr"))
+        self.assertEqual(True, pattern_set.match("dir1/fod.zarr/"))
+        self.assertEqual(True, pattern_set.match("dir/"))
+        self.assertEqual(False, pattern_set.match("dir/fod"))
+        self.assertEqual(False, pattern_set.match("fod.nc"))
+
+    def test_match_negated(self):
+        pattern_set = FilePatternSet([FilePattern("dir/"), FilePattern("!**/*.nc")])
+        self.assertEqual(True, pattern_set.match("dir"))
+        self.assertEqual(True, pattern_set.match("fod.zarr"))
+        self.assertEqual(False, pattern_set.match("fod.nc"))
+
+        pattern_set = FilePatternSet([FilePattern("!**/*.nc", flip_negate=True)])
+        self.assertEqual(False, pattern_set.match("fod.zarr"))
+        self.assertEqual(True, pattern_set.match("fod.nc"))
+
+    def test_match_empty(self):
+        self.assertEqual(False, FilePatternSet([]).match("fod.zarr"))
+        self.assertEqual(True, FilePatternSet([FilePattern("")]).match("fod.zarr"))
+
+    def test_match_is_same_as_pattern_match(self):
+        patterns = ["**/temp", "**/", "a/**", "**/*.zarr", "dir/**/x.zarr", "?.nc", "x"]
+        paths = ["temp", "xtemp", "a/temp/", "a/b", "x.zarr", "dir/x.zarr", "b.nc", "x"]
+        for pattern in patterns:
+            file_pattern = FilePattern(pattern)
+            pattern_set = FilePatternSet([file_pattern])
+            for path in paths:
+                self.assertEqual(
+                    file_pattern.match(path),
+                    pattern_set.match(path),
+                    msg=f"pattern={pattern!r}, path={path!r}",
+                )
+
+    def test_match_indices(self):
+        patterns = [
+            "**/temp",
+            "**/",
+            "a/**",
+            "**/*.zarr",
+            "dir/**/x.zarr",
+            "?.nc",
+            "x",
+            "!**/*.nc",
+            "# x",
+            "",
+        ]
+        paths = ["temp", "xtemp", "a/temp/", "a/b", "x.zarr", "dir/x.zarr", "b.nc", "x"]
+        file_patterns = [FilePattern(p) for p in patterns]
+        pattern_set = FilePatternSet(file_patterns)
+        for path in paths:
+            self.assertEqual(
+                [i for i, p in enumerate(file_patterns) if p.match(path)],
+                sorted(pattern_set.match_indices(path)),
+                msg=f"path={path!r}",
+            )
@@ -5,6 +5,7 @@
 from unittest import TestCase
 
 from xrlint.util.formatting import (
+    format_byte_size,
     format_case,
     format_count,
     format_problems,
@@ -36,6 +37,15 @@ class FormattingTest(TestCase):
         self.assertEqual("3 problems (one error and 2 warnings)", format_problems(1, 2))
         self.assertEqual("4 problems (2 errors and 2 warnings)", format_problems(2, 2))
 
+    def test_format_byte_size(self):
+        self.assertEqual("0 B", format_byte_size(0))
+        self.assertEqual("1023 B", format_byte_size(1023))
+        self.assertEqual("1.0 KiB", format_byte_size(1024))
+        self.assertEqual("1.5 MiB", format_byte_size(1536 * 1024))
+        self.assertEqual("100.0 MiB", format_byte_size(100 * 1024**2))
+        self.assertEqual("4.8 GiB", format_byte_size(8 * 100 * 1800 * 3600))
+        self.assertEqual("2048.0 TiB", format_byte_size(2 * 1024**5))
+
     def test_format_case(self):
         self.assertEqual("hello", format_case("hello"))
         self.assertEqual("Hello", format_case("Hello"))
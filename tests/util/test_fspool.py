@@ -0,0 +1,68 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import fsspec
+from fsspec.implementations.memory import MemoryFileSystem
+
+from xrlint.util.fspool import (
+    FileSystemPool,
+    FileSystemPoolStats,
+    get_fs_pool,
+    use_fs_pool,
+)
+
+
+class FileSystemPoolTest(TestCase):
+    def test_get_filesystem(self):
+        fs_pool = FileSystemPool()
+        fs1, path1 = fs_pool.get_filesystem("memory://data/a.zarr")
+        fs2, path2 = fs_pool.get_filesystem("memory://data/b.zarr", {})
+        self.assertIsInstance(fs1, MemoryFileSystem)
+        self.assertIs(fs1, fs2)
+        self.assertEqual(fsspec.url_to_fs("memory://data/a.zarr")[1], path1)
+        self.assertEqual("/data/b.zarr", path2)
+        self.assertEqual(FileSystemPoolStats(hits=1, misses=1, size=1), fs_pool.stats)
+
+    def test_storage_options_are_part_of_key(self):
+        fs_pool = FileSystemPool()
+        fs1, _ = fs_pool.get_filesystem("data/a.nc")
+        fs2, _ = fs_pool.get_filesystem("data/b.nc", {"auto_mkdir": True})
+        fs3, _ = fs_pool.get_filesystem("file://data/c.nc", {"auto_mkdir": True})
+        self.assertIsNot(fs1, fs2)
+        self.assertIs(fs2, fs3)
+        self.assertEqual(FileSystemPoolStats(hits=1, misses=2, size=2), fs_pool.stats)
+
+    def test_filesystems_are_shared_by_threads(self):
+        fs_pool = FileSystemPool()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            filesystems = list(
+                executor.map(
+                    lambda i: fs_pool.get_filesystem(f"data/{i}.nc")[0], range(20)
+                )
+            )
+        self.assertEqual(1, len(set(map(id, filesystems))))
+        self.assertEqual(FileSystemPoolStats(hits=19, misses=1, size=1), fs_pool.stats)
+
+    def test_chained_urls_are_not_pooled(self):
+        fs_pool = FileSystemPool()
+        fs, path = fs_pool.get_filesystem("simplecache::memory://data/a.zarr")
+        self.assertEqual("/data/a.zarr", path)
+        self.assertEqual(FileSystemPoolStats(), fs_pool.stats)
+
+    def test_clear(self):
+        fs_pool = FileSystemPool()
+        fs_pool.get_filesystem("data/a.nc")
+        fs_pool.clear()
+        self.assertEqual(FileSystemPoolStats(), fs_pool.stats)
+
+    def test_use_fs_pool(self):
+        default_fs_pool = get_fs_pool()
+        fs_pool = FileSystemPool()
+        with use_fs_pool(fs_pool) as used_fs_pool:
+            self.assertIs(fs_pool, used_fs_pool)
+            self.assertIs(fs_pool, get_fs_pool())
+        self.assertIs(default_fs_pool, get_fs_pool())
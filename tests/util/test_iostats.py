@@ -0,0 +1,137 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import asyncio
+import pickle
+import time
+from unittest import TestCase
+
+import fsspec
+from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+from fsspec.implementations.memory import MemoryFileSystem
+
+from xrlint.util.iostats import InstrumentedFileSystem, IOStats
+
+
+class IOStatsTest(TestCase):
+    def test_request_count(self):
+        self.assertEqual(0, IOStats().request_count)
+        self.assertEqual(
+            6, IOStats(get_count=3, head_count=2, list_count=1).request_count
+        )
+
+    def test_to_json(self):
+        self.assertEqual(
+            {"get_count": 2, "bytes_read": 10, "total_latency": 0.5},
+            IOStats(get_count=2, bytes_read=10, total_latency=0.5).to_json(),
+        )
+
+    def test_pickle(self):
+        io_stats = IOStats(get_count=2, bytes_read=10)
+        self.assertEqual(io_stats, pickle.loads(pickle.dumps(io_stats)))
+
+
+class SlowMemoryFileSystem(MemoryFileSystem):
+    cachable = False
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        time.sleep(0.1)
+        return super().cat_file(path, start=start, end=end, **kwargs)
+
+
+class InstrumentedFileSystemTest(TestCase):
+    def setUp(self):
+        self.memory_fs = fsspec.filesystem("memory")
+        self.memory_fs.pipe(
+            {
+                "/iostats/test.zarr/a": b"12345",
+                "/iostats/test.zarr/b": b"678",
+            }
+        )
+
+    def tearDown(self):
+        self.memory_fs.rm("/iostats", recursive=True)
+
+    def test_initial_stats(self):
+        fs = InstrumentedFileSystem(self.memory_fs)
+        self.assertEqual(IOStats(), fs.io_stats)
+
+    def test_mapper(self):
+        fs = InstrumentedFileSystem(self.memory_fs)
+        mapper = fs.get_mapper("/iostats/test.zarr")
+        self.assertEqual(b"12345", mapper["a"])
+        self.assertEqual(b"678", mapper["b"])
+        self.assertNotIn("c", mapper)
+        self.assertEqual(["a", "b"], sorted(mapper))
+        io_stats = fs.io_stats
+        self.assertEqual(2, io_stats.get_count)
+        self.assertEqual(8, io_stats.bytes_read)
+        self.assertGreaterEqual(io_stats.head_count, 1)
+        self.assertGreaterEqual(io_stats.list_count, 1)
+        self.assertGreater(io_stats.total_latency, 0)
+        self.assertGreaterEqual(io_stats.total_latency, io_stats.max_latency)
+
+    def test_info_and_open(self):
+        fs = InstrumentedFileSystem(self.memory_fs)
+        self.assertEqual(5, fs.info("/iostats/test.zarr/a")["size"])
+        with fs.open("/iostats/test.zarr/b") as f:
+            self.assertEqual(b"678", f.read())
+        io_stats = fs.io_stats
+        self.assertEqual(0, io_stats.get_count)
+        self.assertEqual(2, io_stats.head_count)
+
+    def test_failed_request_is_recorded(self):
+        fs = InstrumentedFileSystem(self.memory_fs)
+        with self.assertRaises(FileNotFoundError):
+            fs.cat_file("/iostats/test.zarr/c")
+        self.assertEqual(1, fs.io_stats.get_count)
+        self.assertEqual(0, fs.io_stats.bytes_read)
+
+    def test_not_cached(self):
+        self.assertIsNot(
+            InstrumentedFileSystem(self.memory_fs),
+            InstrumentedFileSystem(self.memory_fs),
+        )
+
+    def test_files_are_read_concurrently(self):
+        paths = [f"/iostats/slow/{i}" for i in range(8)]
+        self.memory_fs.pipe({path: b"x" for path in paths})
+        slow_fs = SlowMemoryFileSystem()
+        for wrapped_fs in (slow_fs, AsyncFileSystemWrapper(slow_fs)):
+            for asynchronous in (False, True):
+                with self.subTest(
+                    wrapped_fs=type(wrapped_fs), asynchronous=asynchronous
+                ):
+                    fs = InstrumentedFileSystem(wrapped_fs, asynchronous=asynchronous)
+                    t0 = time.perf_counter()
+                    if asynchronous:
+                        contents = asyncio.run(fs._cat(paths))
+                        ranges = asyncio.run(fs._cat_ranges(paths, 0, 1))
+                    else:
+                        contents = fs.cat(paths)
+                        ranges = fs.cat_ranges(paths, 0, 1)
+                    duration = time.perf_counter() - t0
+                    self.assertEqual({path: b"x" for path in paths}, contents)
+                    self.assertEqual([b"x"] * len(paths), ranges)
+                    self.assertEqual(2 * len(paths), fs.io_stats.get_count)
+                    # Sequential reads would take 1.6 seconds
+                    self.assertLess(duration, 1.0)
+                    self.assertGreater(fs.io_stats.total_latency, duration)
+
+    def test_known_files(self):
+        fs = InstrumentedFileSystem(
+            self.memory_fs,
+            known_files={
+                "/iostats/test.zarr/a": b"abcde",
+                "/iostats/test.zarr/c": None,
+            },
+        )
+        self.assertEqual(
+            {"/iostats/test.zarr/a": b"abcde", "/iostats/test.zarr/b": b"678"},
+            fs.cat(["/iostats/test.zarr/a", "/iostats/test.zarr/b"]),
+        )
+        self.assertEqual(b"bc", fs.cat_file("/iostats/test.zarr/a", start=1, end=3))
+        with self.assertRaises(FileNotFoundError):
+            fs.cat_file("/iostats/test.zarr/c")
+        self.assertEqual(1, fs.io_stats.get_count)
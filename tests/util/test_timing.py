@@ -0,0 +1,84 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import pickle
+from unittest import TestCase
+
+from xrlint.util.timing import (
+    PHASE_OPEN,
+    TimingEntry,
+    TimingProfile,
+    get_timing_profile,
+    use_timing_profile,
+)
+
+
+class TimingProfileTest(TestCase):
+    @classmethod
+    def new_profile(cls) -> TimingProfile:
+        timing_profile = TimingProfile()
+        timing_profile.add_rule_time("rule-a", "dataset", 0.5)
+        timing_profile.add_rule_time("rule-b", "variable", 1.0)
+        timing_profile.add_rule_time("rule-b", "variable", 1.0)
+        timing_profile.add_rule_time("rule-b", "attrs", 0.5)
+        timing_profile.add_phase_time(PHASE_OPEN, 2.0)
+        return timing_profile
+
+    def test_entries(self):
+        timing_profile = self.new_profile()
+        self.assertEqual(
+            {
+                "rule-a": {"dataset": TimingEntry(1, 0.5)},
+                "rule-b": {
+                    "variable": TimingEntry(2, 2.0),
+                    "attrs": TimingEntry(1, 0.5),
+                },
+            },
+            timing_profile.rules,
+        )
+        self.assertEqual({"open": TimingEntry(1, 2.0)}, timing_profile.phases)
+        self.assertEqual(
+            [("rule-b", TimingEntry(3, 2.5)), ("rule-a", TimingEntry(1, 0.5))],
+            timing_profile.get_rule_totals(),
+        )
+
+    def test_merge_and_pickle(self):
+        timing_profile = self.new_profile()
+        timing_profile.merge(pickle.loads(pickle.dumps(self.new_profile())))
+        self.assertEqual(
+            [("rule-b", TimingEntry(6, 5.0)), ("rule-a", TimingEntry(2, 1.0))],
+            timing_profile.get_rule_totals(),
+        )
+        self.assertEqual({"open": TimingEntry(2, 4.0)}, timing_profile.phases)
+
+    def test_format_table(self):
+        text = self.new_profile().format_table(top_n=1)
+        self.assertIn("rule-b", text)
+        self.assertIn("2500.000", text)
+        self.assertIn("attrs: 1, variable: 2", text)
+        self.assertNotIn("rule-a", text)
+        self.assertIn("open", text)
+
+    def test_to_json(self):
+        self.assertEqual(
+            {
+                "rules": {
+                    "rule-b": {
+                        "variable": {"count": 2, "time": 2.0},
+                        "attrs": {"count": 1, "time": 0.5},
+                    },
+                    "rule-a": {"dataset": {"count": 1, "time": 0.5}},
+                },
+                "phases": {"open": {"count": 1, "time": 2.0}},
+            },
+            self.new_profile().to_json(),
+        )
+
+    def test_use_timing_profile(self):
+        self.assertIsNone(get_timing_profile())
+        timing_profile = TimingProfile()
+        with use_timing_profile(timing_profile) as p:
+            self.assertIs(timing_profile, p)
+            self.assertIs(timing_profile, get_timing_profile())
+        self.assertIsNone(get_timing_profile())
@@ -0,0 +1,84 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import io
+import json
+import os
+from unittest import TestCase
+
+from xrlint.util.tracing import (
+    Tracer,
+    get_tracer,
+    trace_iter,
+    trace_span,
+    use_tracer,
+)
+
+
+class TracerTest(TestCase):
+    def test_span(self):
+        tracer = Tracer()
+        with tracer.span("open", "open", {"file_path": "test.zarr"}):
+            pass
+        tracer.add_span("my-rule", "rule", 1.0, 1.5)
+        self.assertEqual(2, tracer.event_count)
+        event_1, event_2 = tracer.pop_events()
+        self.assertEqual("open", event_1["name"])
+        self.assertEqual("X", event_1["ph"])
+        self.assertEqual({"file_path": "test.zarr"}, event_1["args"])
+        self.assertEqual(os.getpid(), event_1["pid"])
+        self.assertGreaterEqual(event_1["dur"], 0)
+        self.assertEqual(
+            {
+                "name": "my-rule",
+                "cat": "rule",
+                "ph": "X",
+                "ts": 1e6,
+                "dur": 0.5e6,
+                "pid": event_2["pid"],
+                "tid": event_2["tid"],
+            },
+            event_2,
+        )
+        self.assertEqual([], tracer.pop_events())
+
+    def test_stream(self):
+        for buffer_size in (1, 2, 100):
+            stream = io.StringIO()
+            tracer = Tracer(stream, buffer_size=buffer_size)
+            for i in range(5):
+                tracer.add_span(f"span-{i}", "test", i, i + 1)
+            worker_tracer = Tracer()
+            worker_tracer.add_span("span-5", "test", 5, 6)
+            tracer.add_events(worker_tracer.pop_events())
+            tracer.close()
+            trace = json.loads(stream.getvalue())
+            self.assertEqual("ms", trace["displayTimeUnit"])
+            events = trace["traceEvents"]
+            # Including process name
+            self.assertEqual(7, len(events), msg=f"buffer_size={buffer_size}")
+            self.assertEqual("M", events[0]["ph"])
+            self.assertEqual(
+                [f"span-{i}" for i in range(6)], [e["name"] for e in events[1:]]
+            )
+
+    def test_trace_functions(self):
+        self.assertIsNone(get_tracer())
+        with trace_span("open", "open"):
+            pass
+        self.assertEqual([1, 2], list(trace_iter([1, 2], "discover", "discovery")))
+
+        tracer = Tracer()
+        with use_tracer(tracer) as t:
+            self.assertIs(tracer, t)
+            self.assertIs(tracer, get_tracer())
+            with trace_span("open", "open"):
+                pass
+            self.assertEqual([1, 2], list(trace_iter([1, 2], "discover", "discovery")))
+        self.assertIsNone(get_tracer())
+        # One span per item plus one for the end of iteration
+        self.assertEqual(
+            ["open", "discover", "discover", "discover"],
+            [e["name"] for e in tracer.pop_events()],
+        )
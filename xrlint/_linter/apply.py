@@ -2,159 +2,440 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
-from xrlint.node import AttrNode, AttrsNode, DatasetNode, DataTreeNode, VariableNode
-from xrlint.rule import RuleConfig, RuleExit, RuleOp
+import functools
+import time
+from collections.abc import Hashable
+from typing import Any, Final, Type, TypeAlias
 
-from ..constants import DATASET_ROOT_NAME, DATATREE_ROOT_NAME
+from xrlint.node import (
+    AttrNode,
+    AttrsNode,
+    DatasetNode,
+    DataTreeNode,
+    Node,
+    NodeKind,
+    VariableNode,
+)
+from xrlint.result import Message
+from xrlint.rule import Rule, RuleConfig, RuleExit, RuleOp
+from xrlint.util.timing import TimingProfile, get_timing_profile
+from xrlint.util.tracing import Tracer, get_tracer
+
+from ..constants import (
+    DATASET_ROOT_NAME,
+    DATATREE_ROOT_NAME,
+    LINTER_OPTION_METADATA_ONLY,
+)
 from .rulectx import RuleContextImpl
 
+HOOK_NAMES: Final = (
+    "validate_datatree",
+    "validate_dataset",
+    "validate_variable",
+    "validate_attrs",
+    "validate_attr",
+)
+
+RuleOpCache: TypeAlias = dict[Hashable, RuleOp]
+"""Maps rule configuration keys to reusable rule operation instances."""
+
+
+@functools.cache
+def get_rule_op_hooks(op_class: Type[RuleOp]) -> frozenset[str]:
+    """Get the names of the validation methods that are
+    actually overridden by the given rule operation class.
+    """
+    return frozenset(
+        name
+        for name in HOOK_NAMES
+        if getattr(op_class, name, None) is not getattr(RuleOp, name)
+    )
+
+
+class _RuleApplication:
+    """The state of a single rule while it is applied."""
+
+    __slots__ = ("rule_id", "severity", "rule_op", "hooks", "messages")
+
+    def __init__(self, rule_id: str, severity: int, rule_op: RuleOp | None):
+        self.rule_id = rule_id
+        self.severity = severity
+        self.rule_op = rule_op
+        self.hooks = get_rule_op_hooks(type(rule_op)) if rule_op else frozenset()
+        self.messages: list[Message] = []
+
+
+class _Dispatch:
+    """A dispatch table that provides, for each validation method,
+    the active rules that implement it.
+    Rules that raise `RuleExit` are removed from the table.
+    If a timing profile or a tracer is given, the validation
+    methods are timed.
+    """
+
+    __slots__ = (
+        "applications",
+        "timing_profile",
+        "tracer",
+        "datatree",
+        "dataset",
+        "variable",
+        "attrs",
+        "attr",
+        "visit_variables",
+        "visit_attrs",
+        "visit_datasets",
+    )
+
+    def __init__(
+        self,
+        applications: list[_RuleApplication],
+        timing_profile: TimingProfile | None = None,
+        tracer: Tracer | None = None,
+    ):
+        self.applications = applications
+        self.timing_profile = timing_profile
+        self.tracer = tracer
+        self._update()
+
+    def _update(self):
+        active = [a for a in self.applications if a.rule_op is not None]
+        self.applications = active
+        self.datatree = [a for a in active if "validate_datatree" in a.hooks]
+        self.dataset = [a for a in active if "validate_dataset" in a.hooks]
+        self.variable = [a for a in active if "validate_variable" in a.hooks]
+        self.attrs = [a for a in active if "validate_attrs" in a.hooks]
+        self.attr = [a for a in active if "validate_attr" in a.hooks]
+        # Subtrees need to be visited only if
+        # a rule validates any of their nodes
+        self.visit_attrs = bool(self.attrs or self.attr)
+        self.visit_variables = bool(self.variable or self.visit_attrs)
+        self.visit_datasets = bool(self.dataset or self.visit_variables)
+
+    @property
+    def empty(self) -> bool:
+        return not self.applications
+
+    def validate(
+        self,
+        context: RuleContextImpl,
+        applications: list[_RuleApplication],
+        method_name: str,
+        node: Node,
+    ):
+        """Pass `node` to the validation method `method_name` of
+        the given `applications`.
+        """
+        measured = self.timing_profile is not None or self.tracer is not None
+        exited = False
+        for application in applications:
+            context.rule_id = application.rule_id
+            context.severity = application.severity
+            context.messages = application.messages
+            try:
+                if measured:
+                    self._call_measured(application, method_name, context, node)
+                else:
+                    getattr(application.rule_op, method_name)(context, node)
+            except RuleExit:
+                # This is ok, the rule requested it.
+                application.rule_op = None
+                exited = True
+        if exited:
+            self._update()
+
+    def _call_measured(
+        self,
+        application: _RuleApplication,
+        method_name: str,
+        context: RuleContextImpl,
+        node: Node,
+    ):
+        node_kind = method_name[len("validate_") :]
+        start = time.perf_counter()
+        try:
+            getattr(application.rule_op, method_name)(context, node)
+        finally:
+            end = time.perf_counter()
+            if self.timing_profile is not None:
+                self.timing_profile.add_rule_time(
+                    application.rule_id, node_kind, end - start
+                )
+            if self.tracer is not None:
+                self.tracer.add_span(
+                    application.rule_id,
+                    "rule",
+                    start,
+                    end,
+                    {"node_kind": node_kind, "node_path": node.path},
+                )
+
 
-def apply_rule(
+def apply_rules(
     ctx: RuleContextImpl,
-    rule_id: str,
-    rule_config: RuleConfig,
+    rule_configs: dict[str, RuleConfig],
+    rule_op_cache: RuleOpCache | None = None,
 ):
-    """Apply rule given by `rule_id` to dataset given in
-    `context` using rule configuration `rule_config`.
+    """Apply the rules configured by `rule_configs` to the dataset
+    given in `ctx`.
+
+    If `rule_op_cache` is given, instances of stateless rule operations
+    are taken from it, or, if not yet contained, created and put into it.
+
+    The dataset is traversed once and every node is passed to all
+    rules that implement the node's validation method and that have
+    not yet requested to exit. Subtrees whose nodes are not validated
+    by any rule are skipped.
+    Messages are collected per rule and appended to `ctx.messages`
+    in the order of `rule_configs`.
+
+    If the linter option `metadata_only` is set, rules that need
+    data values are not applied.
+
+    If a timing profile is in use, the time of every call of
+    a validation method is added to it. If a tracer is in use,
+    a span is recorded for every call.
     """
+    linter_options = ctx.config.linter_options or {}
+    metadata_only = bool(linter_options.get(LINTER_OPTION_METADATA_ONLY))
+    applications: list[_RuleApplication] = []
+    # Restore the rule-specific state after application
+    with ctx.use_state(
+        rule_id=ctx.rule_id, severity=ctx.severity, messages=ctx.messages
+    ):
+        for rule_id, rule_config in rule_configs.items():
+            application = _new_rule_application(
+                ctx, rule_id, rule_config, rule_op_cache, metadata_only
+            )
+            if application is not None:
+                applications.append(application)
+
+        dispatch = _Dispatch(applications, get_timing_profile(), get_tracer())
+        if not dispatch.empty:
+            _traverse(ctx, dispatch)
+
+    for application in applications:
+        ctx.messages.extend(application.messages)
+
+
+def _new_rule_application(
+    ctx: RuleContextImpl,
+    rule_id: str,
+    rule_config: RuleConfig,
+    rule_op_cache: RuleOpCache | None,
+    metadata_only: bool,
+) -> _RuleApplication | None:
+    ctx.rule_id = rule_id
     try:
         rule = ctx.config.get_rule(rule_id)
     except ValueError as e:
+        application = _RuleApplication(rule_id, rule_config.severity, None)
+        ctx.messages = application.messages
         ctx.report(f"{e}", fatal=True)
-        return
+        return application
 
     if rule_config.severity == 0:
         # rule is off
-        return
+        return None
 
-    with ctx.use_state(severity=rule_config.severity):
-        # TODO: validate rule_config.args/kwargs against rule.meta.schema
-        # noinspection PyArgumentList
-        rule_op: RuleOp = rule.op_class(*rule_config.args, **rule_config.kwargs)
-        try:
-            if ctx.datatree is not None:
-                name = (
-                    DATATREE_ROOT_NAME
-                    if ctx.file_index is None
-                    else f"{DATATREE_ROOT_NAME}[{ctx.file_index}]"
-                )
-                _visit_datatree_node(
-                    rule_op,
-                    ctx,
-                    DataTreeNode(
-                        parent=None, path=name, name=name, datatree=ctx.datatree
-                    ),
-                )
-            else:
-                name = (
-                    DATASET_ROOT_NAME
-                    if ctx.file_index is None
-                    else f"{DATASET_ROOT_NAME}[{ctx.file_index}]"
-                )
-                _visit_dataset_node(
-                    rule_op,
-                    ctx,
-                    DatasetNode(parent=None, path=name, name=name, dataset=ctx.dataset),
-                )
-        except RuleExit:
-            # This is ok, the rule requested it.
-            pass
+    if metadata_only and rule.meta.needs_data:
+        # rule would read data values
+        return None
+
+    cache_key = (
+        _get_rule_op_cache_key(rule_id, rule, rule_config)
+        if rule_op_cache is not None
+        else None
+    )
+    rule_op = rule_op_cache.get(cache_key) if cache_key is not None else None
+    if rule_op is None:
+        with ctx.use_state(severity=rule_config.severity):
+            # TODO: validate rule_config.args/kwargs against rule.meta.schema
+            # noinspection PyArgumentList
+            rule_op = rule.op_class(*rule_config.args, **rule_config.kwargs)
+        if cache_key is not None:
+            rule_op_cache[cache_key] = rule_op
+    return _RuleApplication(rule_id, rule_config.severity, rule_op)
 
 
-def _visit_datatree_node(rule_op: RuleOp, context: RuleContextImpl, node: DataTreeNode):
-    with context.use_state(node=node):
-        rule_op.validate_datatree(context, node)
+def _get_rule_op_cache_key(
+    rule_id: str, rule: Rule, rule_config: RuleConfig
+) -> Hashable | None:
+    """Get the key for the rule operation instance configured by
+    `rule_config`, or `None` if the instance must not be cached.
+    The severity is not part of the key, because it is not passed
+    to the rule operation.
+    """
+    if rule.meta.stateful:
+        return None
+    try:
+        key = (
+            rule_id,
+            rule.op_class,
+            _freeze(rule_config.args),
+            _freeze(rule_config.kwargs),
+        )
+        hash(key)
+    except TypeError:
+        # Unhashable or unorderable option values
+        return None
+    return key
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert the given rule option value into a hashable value."""
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(_freeze(v) for v in value)
+    # Include the type, so that, e.g., `1` and `True` yield different keys
+    return type(value), value
+
+
+def _traverse(ctx: RuleContextImpl, dispatch: _Dispatch):
+    if ctx.datatree is not None:
+        name = (
+            DATATREE_ROOT_NAME
+            if ctx.file_index is None
+            else f"{DATATREE_ROOT_NAME}[{ctx.file_index}]"
+        )
+        _visit_datatree_node(
+            dispatch,
+            ctx,
+            DataTreeNode(parent=None, name=name, datatree=ctx.datatree),
+        )
+    else:
+        name = (
+            DATASET_ROOT_NAME
+            if ctx.file_index is None
+            else f"{DATASET_ROOT_NAME}[{ctx.file_index}]"
+        )
+        _visit_dataset_node(
+            dispatch,
+            ctx,
+            DatasetNode(parent=None, name=name, dataset=ctx.dataset),
+        )
+
+
+def _visit_datatree_node(
+    dispatch: _Dispatch, context: RuleContextImpl, node: DataTreeNode
+):
+    context.enter_node(node)
+    try:
+        if dispatch.datatree:
+            dispatch.validate(context, dispatch.datatree, "validate_datatree", node)
         if node.datatree.is_leaf:
-            _visit_dataset_node(
-                rule_op,
-                context,
-                DatasetNode(
-                    parent=node,
-                    path=f"{node.path}/{node.datatree.name}",
-                    name=node.datatree.name,
-                    dataset=node.datatree.dataset,
-                ),
-            )
+            if dispatch.visit_datasets:
+                _visit_dataset_node(
+                    dispatch,
+                    context,
+                    DatasetNode(
+                        parent=node,
+                        kind=NodeKind.CHILD,
+                        name=node.datatree.name,
+                        dataset=node.datatree.dataset,
+                    ),
+                )
         else:
             for name, datatree in node.datatree.children.items():
+                if dispatch.empty:
+                    return
                 _visit_datatree_node(
-                    rule_op,
+                    dispatch,
                     context,
                     DataTreeNode(
                         parent=node,
-                        path=f"{node.path}/{name}",
+                        kind=NodeKind.CHILD,
                         name=name,
                         datatree=datatree,
                     ),
                 )
+    finally:
+        context.leave_node()
 
 
-def _visit_dataset_node(rule_op: RuleOp, context: RuleContextImpl, node: DatasetNode):
-    with context.use_state(dataset=node.dataset, node=node):
-        rule_op.validate_dataset(context, node)
-        _visit_attrs_node(
-            rule_op,
-            context,
-            AttrsNode(
-                parent=node,
-                path=f"{node.path}.attrs",
-                attrs=node.dataset.attrs,
-            ),
-        )
+def _visit_dataset_node(
+    dispatch: _Dispatch, context: RuleContextImpl, node: DatasetNode
+):
+    context.enter_dataset_node(node)
+    try:
+        if dispatch.dataset:
+            dispatch.validate(context, dispatch.dataset, "validate_dataset", node)
+        if dispatch.visit_attrs:
+            _visit_attrs_node(
+                dispatch,
+                context,
+                AttrsNode(parent=node, attrs=node.dataset.attrs),
+            )
         for name, variable in node.dataset.coords.items():
+            if not dispatch.visit_variables:
+                return
             _visit_variable_node(
-                rule_op,
+                dispatch,
                 context,
                 VariableNode(
                     parent=node,
-                    path=f"{node.path}.coords[{name!r}]",
+                    kind=NodeKind.COORD,
                     name=name,
                     array=variable,
                 ),
             )
         for name, variable in node.dataset.data_vars.items():
+            if not dispatch.visit_variables:
+                return
             _visit_variable_node(
-                rule_op,
+                dispatch,
                 context,
                 VariableNode(
                     parent=node,
-                    path=f"{node.path}.data_vars[{name!r}]",
+                    kind=NodeKind.DATA_VAR,
                     name=name,
                     array=variable,
                 ),
             )
+    finally:
+        context.leave_dataset_node()
 
 
-def _visit_variable_node(rule_op: RuleOp, context: RuleContextImpl, node: VariableNode):
-    with context.use_state(node=node):
-        rule_op.validate_variable(context, node)
-        _visit_attrs_node(
-            rule_op,
-            context,
-            AttrsNode(
-                parent=node,
-                path=f"{node.path}.attrs",
-                attrs=node.array.attrs,
-            ),
-        )
+def _visit_variable_node(
+    dispatch: _Dispatch, context: RuleContextImpl, node: VariableNode
+):
+    context.enter_node(node)
+    try:
+        if dispatch.variable:
+            dispatch.validate(context, dispatch.variable, "validate_variable", node)
+        if dispatch.visit_attrs:
+            _visit_attrs_node(
+                dispatch,
+                context,
+                AttrsNode(parent=node, attrs=node.array.attrs),
+            )
+    finally:
+        context.leave_node()
 
 
-def _visit_attrs_node(rule_op: RuleOp, context: RuleContextImpl, node: AttrsNode):
-    with context.use_state(node=node):
-        rule_op.validate_attrs(context, node)
+def _visit_attrs_node(dispatch: _Dispatch, context: RuleContextImpl, node: AttrsNode):
+    context.enter_node(node)
+    try:
+        if dispatch.attrs:
+            dispatch.validate(context, dispatch.attrs, "validate_attrs", node)
         for name, value in node.attrs.items():
+            if not dispatch.attr:
+                return
             _visit_attr_node(
-                rule_op,
+                dispatch,
                 context,
-                AttrNode(
-                    parent=node,
-                    name=name,
-                    value=value,
-                    path=f"{node.path}[{name!r}]",
-                ),
+                AttrNode(parent=node, name=name, value=value),
             )
+    finally:
+        context.leave_node()
 
 
-def _visit_attr_node(rule_op: RuleOp, context: RuleContextImpl, node: AttrNode):
-    with context.use_state(node=node):
-        rule_op.validate_attr(context, node)
+def _visit_attr_node(dispatch: _Dispatch, context: RuleContextImpl, node: AttrNode):
+    context.enter_node(node)
+    try:
+        dispatch.validate(context, dispatch.attr, "validate_attr", node)
+    finally:
+        context.leave_node()
@@ -9,9 +9,10 @@ import xarray as xr
 
 from xrlint.config import ConfigObject
 from xrlint.constants import DATASET_ROOT_NAME, SEVERITY_ERROR
-from xrlint.node import Node
+from xrlint.node import DatasetNode, Node
 from xrlint.result import Message, Suggestion
 from xrlint.rule import RuleContext
+from xrlint.util.iostats import IOStats
 
 
 class RuleContextImpl(RuleContext):
@@ -22,12 +23,14 @@ class RuleContextImpl(RuleContext):
         file_path: str,
         file_index: int | None,
         access_latency: float | None,
+        io_stats: IOStats | None = None,
     ):
         assert isinstance(config, ConfigObject)
         assert isinstance(dataset, (xr.Dataset | xr.DataTree))
         assert isinstance(file_path, str)
         assert file_index is None or isinstance(file_index, int)
         assert access_latency is None or isinstance(access_latency, float)
+        assert io_stats is None or isinstance(io_stats, IOStats)
         if isinstance(dataset, xr.DataTree):
             datatree = dataset
             dataset = None
@@ -42,10 +45,14 @@ class RuleContextImpl(RuleContext):
         self._file_path = file_path
         self._file_index = file_index
         self._access_latency = access_latency
+        self._io_stats = io_stats
         self.messages: list[Message] = []
         self.rule_id: str | None = None
         self.severity: Literal[1, 2] = SEVERITY_ERROR
         self.node: Node | None = None
+        # Saved traversal state, see enter_node() and leave_node()
+        self._saved_nodes: list[Node | None] = []
+        self._saved_datasets: list[xr.Dataset | None] = []
 
     @property
     def config(self) -> ConfigObject:
@@ -79,6 +86,10 @@ class RuleContextImpl(RuleContext):
     def access_latency(self) -> float | None:
         return self._access_latency
 
+    @property
+    def io_stats(self) -> IOStats | None:
+        return self._io_stats
+
     def report(
         self,
         message: str,
@@ -99,6 +110,37 @@ class RuleContextImpl(RuleContext):
         )
         self.messages.append(m)
 
+    def enter_node(self, node: Node):
+        """Make `node` the current node.
+        Must be paired with a call to `leave_node()`.
+
+        Together with `leave_node()`, this is the allocation-free
+        alternative to `use_state(node=node)` used for traversal.
+        """
+        self._saved_nodes.append(self.node)
+        self.node = node
+
+    def leave_node(self):
+        """Restore the node that was current before `enter_node()`."""
+        self.node = self._saved_nodes.pop()
+
+    def enter_dataset_node(self, node: DatasetNode):
+        """Make `node` the current node and its dataset the
+        current dataset.
+        Must be paired with a call to `leave_dataset_node()`.
+        """
+        self._saved_nodes.append(self.node)
+        self._saved_datasets.append(self._dataset)
+        self.node = node
+        self._dataset = node.dataset
+
+    def leave_dataset_node(self):
+        """Restore the node and dataset that were current
+        before `enter_dataset_node()`.
+        """
+        self.node = self._saved_nodes.pop()
+        self._dataset = self._saved_datasets.pop()
+
     @contextlib.contextmanager
     def use_state(self, **new_state):
         old_state = {k: getattr(self, k) for k in new_state.keys()}
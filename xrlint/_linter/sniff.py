@@ -0,0 +1,351 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from glob import has_magic
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import fsspec
+
+from xrlint.util.fspool import get_fs_pool
+
+HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+NETCDF3_SIGNATURES = (b"CDF\x01", b"CDF\x02", b"CDF\x05")
+
+
+@dataclass(frozen=True)
+class DatasetFormat:
+    """The format of a dataset source as detected by
+    `sniff_dataset_format()`.
+    """
+
+    name: str
+    """Format name, one of `"zarr"`, `"hdf5"`, `"netcdf3"`."""
+
+    engines: tuple[str, ...]
+    """The xarray engines that can open the format.
+    The first one is used if no engine is configured.
+    May be empty, if xarray should guess the engine.
+    """
+
+    groups: bool
+    """`True` if the dataset has or may have child groups
+    and hence should be opened as `xr.DataTree`.
+    """
+
+    consolidated: bool | None = None
+    """For Zarr, whether the store provides consolidated metadata."""
+
+    documents: dict[str, bytes | None] | None = field(
+        default=None, compare=False, repr=False
+    )
+    """For Zarr, the metadata documents fetched for sniffing,
+    mapping their paths to their contents, or to `None` if they do not
+    exist. Allows for opening the store without fetching them again.
+    These are the root documents and, for stores without consolidated
+    metadata, the documents of the root's children.
+    """
+
+    @property
+    def engine(self) -> str | None:
+        """The default engine for this format."""
+        return self.engines[0] if self.engines else None
+
+    @property
+    def opener_options(self) -> dict[str, Any]:
+        """Options passed to the opener in addition to the engine."""
+        if self.consolidated is None:
+            return {}
+        return {"consolidated": self.consolidated}
+
+
+HDF5 = DatasetFormat("hdf5", (), groups=True)
+NETCDF3 = DatasetFormat("netcdf3", (), groups=False)
+
+# Engines that can open the formats if explicitly configured
+_COMPATIBLE_ENGINES = {
+    "zarr": {"zarr"},
+    "hdf5": {"netcdf4", "h5netcdf"},
+    "netcdf3": {"netcdf4", "scipy", "h5netcdf"},
+}
+
+# Root metadata documents of Zarr stores that are fetched for sniffing.
+# These are the documents zarr reads when opening a store.
+_ZARR_METADATA_NAMES = ("zarr.json", ".zmetadata", ".zgroup", ".zattrs")
+
+# Metadata documents of the children of Zarr stores without consolidated
+# metadata, fetched to find out whether a store has child groups.
+_ZARR_CHILD_METADATA_NAMES = {
+    2: (".zgroup", ".zarray", ".zattrs"),
+    3: ("zarr.json",),
+}
+
+
+def is_engine_compatible(ds_format: DatasetFormat, engine: str | None) -> bool:
+    """Check whether `engine` can be used to open a dataset
+    of the given format.
+    """
+    return engine is None or engine in _COMPATIBLE_ENGINES[ds_format.name]
+
+
+def sniff_dataset_format(
+    ds_source: Any, storage_options: dict[str, Any] | None = None
+) -> DatasetFormat | None:
+    """Detect the format of the dataset given by `ds_source` by
+    reading its signature or its Zarr metadata, which is one request
+    in most cases.
+
+    Args:
+        ds_source: The dataset source. Only file paths and URLs
+            are sniffed.
+        storage_options: Options for the filesystem
+            of `ds_source`, if any.
+
+    Returns:
+        The dataset format, or `None` if the format is unknown or
+            the dataset source cannot be sniffed.
+    """
+    if not isinstance(ds_source, (str, Path, PathLike)):
+        return None
+    try:
+        fs, path = get_fs_pool().get_filesystem(ds_source, storage_options)
+        path = path.rstrip("/")
+        if path.endswith(".zarr"):
+            return _sniff_zarr(fs, path) or _sniff_signature(fs, path)
+        return _sniff_signature(fs, path) or _sniff_zarr(fs, path)
+    except (OSError, ValueError, TypeError, ImportError):
+        return None
+
+
+def sniff_dataset_formats(
+    ds_sources: Sequence[tuple[str, dict[str, Any] | None]],
+) -> list[DatasetFormat | None]:
+    """Detect the formats of many datasets at once.
+
+    The signatures and Zarr metadata objects of all datasets
+    from the same filesystem are fetched with a single call,
+    which fetches them concurrently for asynchronous filesystems
+    such as S3. The metadata objects of the children of Zarr
+    datasets without consolidated metadata are fetched with
+    another single call.
+    Datasets whose format cannot be detected this way can
+    still be sniffed using `sniff_dataset_format()`.
+
+    Args:
+        ds_sources: Pairs of dataset path or URL and the options
+            for its filesystem, if any.
+
+    Returns:
+        A list of dataset formats, with `None` for every dataset
+            whose format is unknown.
+    """
+    formats: list[DatasetFormat | None] = [None] * len(ds_sources)
+    batches: dict[fsspec.AbstractFileSystem, list[tuple[int, str]]] = {}
+    for index, (ds_source, storage_options) in enumerate(ds_sources):
+        if not isinstance(ds_source, (str, Path, PathLike)):
+            continue
+        try:
+            fs, path = get_fs_pool().get_filesystem(ds_source, storage_options)
+        except (OSError, ValueError, TypeError, ImportError):
+            continue
+        path = path.rstrip("/")
+        if not has_magic(path):
+            batches.setdefault(fs, []).append((index, path))
+    for fs, batch in batches.items():
+        try:
+            _sniff_batch(fs, batch, formats)
+        except (OSError, ValueError, TypeError):
+            pass
+    return formats
+
+
+def _sniff_batch(
+    fs: fsspec.AbstractFileSystem,
+    batch: list[tuple[int, str]],
+    formats: list[DatasetFormat | None],
+):
+    zarr_batch = [(i, p) for i, p in batch if p.endswith(".zarr")]
+    file_batch = [(i, p) for i, p in batch if not p.endswith(".zarr")]
+    if zarr_batch:
+        contents = fs.cat(
+            [f"{p}/{name}" for _, p in zarr_batch for name in _ZARR_METADATA_NAMES],
+            on_error="return",
+        )
+        zarr_formats = {
+            p: _get_zarr_format_from_contents(p, contents) for _, p in zarr_batch
+        }
+        _sniff_zarr_children(fs, zarr_formats)
+        for i, p in zarr_batch:
+            formats[i] = zarr_formats[p]
+    if file_batch:
+        signatures = fs.cat_ranges(
+            [p for _, p in file_batch],
+            0,
+            len(HDF5_SIGNATURE),
+            on_error="return",
+        )
+        for (i, _), signature in zip(file_batch, signatures):
+            if isinstance(signature, bytes):
+                formats[i] = _get_signature_format(signature)
+
+
+def _sniff_signature(fs: fsspec.AbstractFileSystem, path: str) -> DatasetFormat | None:
+    try:
+        signature = fs.cat_file(path, start=0, end=len(HDF5_SIGNATURE))
+    except (IsADirectoryError, FileNotFoundError, NotADirectoryError):
+        return None
+    return _get_signature_format(signature)
+
+
+def _get_signature_format(signature: bytes) -> DatasetFormat | None:
+    if signature == HDF5_SIGNATURE:
+        return HDF5
+    if signature[:4] in NETCDF3_SIGNATURES:
+        return NETCDF3
+    return None
+
+
+def _sniff_zarr(fs: fsspec.AbstractFileSystem, path: str) -> DatasetFormat | None:
+    contents = fs.cat(
+        [f"{path}/{name}" for name in _ZARR_METADATA_NAMES], on_error="return"
+    )
+    zarr_formats = {path: _get_zarr_format_from_contents(path, contents)}
+    _sniff_zarr_children(fs, zarr_formats)
+    return zarr_formats[path]
+
+
+def _sniff_zarr_children(
+    fs: fsspec.AbstractFileSystem,
+    zarr_formats: dict[str, DatasetFormat | None],
+):
+    """Find out whether Zarr stores without consolidated metadata have
+    child groups, by listing each store and fetching the metadata
+    documents of all children with a single call.
+    The formats in `zarr_formats` are replaced accordingly.
+    """
+    child_names: dict[str, tuple[int, list[str]]] = {}
+    for path, ds_format in zarr_formats.items():
+        if ds_format is None or ds_format.consolidated:
+            continue
+        zarr_format = 3 if ds_format.documents.get(f"{path}/zarr.json") else 2
+        try:
+            entries = fs.ls(path, detail=True)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        child_names[path] = (
+            zarr_format,
+            [
+                e["name"].rstrip("/").rsplit("/", 1)[-1]
+                for e in entries
+                if e.get("type") == "directory"
+            ],
+        )
+    document_paths = [
+        f"{path}/{child_name}/{name}"
+        for path, (zarr_format, names) in child_names.items()
+        for child_name in names
+        for name in _ZARR_CHILD_METADATA_NAMES[zarr_format]
+    ]
+    contents = fs.cat(document_paths, on_error="return") if document_paths else {}
+    for path, (zarr_format, names) in child_names.items():
+        documents = dict(zarr_formats[path].documents)
+        groups = False
+        for child_name in names:
+            for name in _ZARR_CHILD_METADATA_NAMES[zarr_format]:
+                document_path = f"{path}/{child_name}/{name}"
+                content = contents.get(document_path)
+                if isinstance(content, bytes):
+                    documents[document_path] = content
+                elif isinstance(content, FileNotFoundError):
+                    documents[document_path] = None
+            if zarr_format == 2:
+                groups = groups or isinstance(
+                    contents.get(f"{path}/{child_name}/.zgroup"), bytes
+                )
+            else:
+                node = _parse_json(contents.get(f"{path}/{child_name}/zarr.json"))
+                groups = groups or (node or {}).get("node_type") == "group"
+        zarr_formats[path] = _zarr_format(
+            groups=groups, consolidated=False, documents=documents
+        )
+
+
+def _get_zarr_format_from_contents(
+    path: str, contents: dict[str, bytes | Exception]
+) -> DatasetFormat | None:
+    documents: dict[str, bytes | None] = {}
+    for name in _ZARR_METADATA_NAMES:
+        document_path = f"{path}/{name}"
+        content = contents.get(document_path)
+        if isinstance(content, bytes):
+            documents[document_path] = content
+        elif isinstance(content, FileNotFoundError):
+            documents[document_path] = None
+    zarr_json = _parse_json(contents.get(f"{path}/zarr.json"))
+    zmetadata = _parse_json(contents.get(f"{path}/.zmetadata"))
+    zgroup = isinstance(contents.get(f"{path}/.zgroup"), bytes)
+    return _get_zarr_format(zarr_json, zmetadata, zgroup, documents)
+
+
+def _get_zarr_format(
+    zarr_json: dict[str, Any] | None,
+    zmetadata: dict[str, Any] | None,
+    zgroup: bool,
+    documents: dict[str, bytes | None] | None = None,
+) -> DatasetFormat | None:
+    # Zarr format 3
+    if zarr_json is not None:
+        if zarr_json.get("node_type") != "group":
+            return None
+        consolidated = zarr_json.get("consolidated_metadata")
+        if not isinstance(consolidated, dict):
+            return _zarr_format(groups=True, consolidated=False, documents=documents)
+        nodes = consolidated.get("metadata") or {}
+        return _zarr_format(
+            groups=any(
+                isinstance(node, dict) and node.get("node_type") == "group"
+                for node in nodes.values()
+            ),
+            consolidated=True,
+            documents=documents,
+        )
+    # Zarr format 2
+    if zmetadata is not None:
+        keys = (zmetadata.get("metadata") or {}).keys()
+        return _zarr_format(
+            groups=any(k.endswith("/.zgroup") for k in keys),
+            consolidated=True,
+            documents=documents,
+        )
+    if zgroup:
+        return _zarr_format(groups=True, consolidated=False, documents=documents)
+    return None
+
+
+def _zarr_format(
+    groups: bool,
+    consolidated: bool,
+    documents: dict[str, bytes | None] | None = None,
+) -> DatasetFormat:
+    return DatasetFormat(
+        "zarr",
+        ("zarr",),
+        groups=groups,
+        consolidated=consolidated,
+        documents=documents or None,
+    )
+
+
+def _parse_json(content: bytes | Exception | None) -> dict[str, Any] | None:
+    if not isinstance(content, bytes):
+        return None
+    try:
+        metadata = json.loads(content)
+    except ValueError:
+        return None
+    return metadata if isinstance(metadata, dict) else None
@@ -2,28 +2,58 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import inspect
 import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from os import PathLike
 from typing import Any
 
 import xarray as xr
 
 from xrlint.config import ConfigObject
+from xrlint.processor import ProcessorOp
 from xrlint.result import Message, Result
+from xrlint.util.fspool import get_fs_pool
+from xrlint.util.iostats import InstrumentedFileSystem, IOStats
+from xrlint.util.timing import (
+    PHASE_OPEN,
+    PHASE_POSTPROCESS,
+    PHASE_PREPROCESS,
+    get_timing_profile,
+)
+from xrlint.util.tracing import trace_span
 
-from ..constants import DATASET_ROOT_NAME
-from .apply import apply_rule
+from ..constants import DATASET_ROOT_NAME, LINTER_OPTION_METADATA_ONLY
+from .apply import RuleOpCache, apply_rules
 from .rulectx import RuleContextImpl
+from .sniff import DatasetFormat, is_engine_compatible, sniff_dataset_format
 
 
-def validate_dataset(config_obj: ConfigObject, dataset: Any, file_path: str):
+def validate_dataset(
+    config_obj: ConfigObject,
+    dataset: Any,
+    file_path: str,
+    rule_op_cache: RuleOpCache | None = None,
+):
     assert isinstance(config_obj, ConfigObject)
     assert dataset is not None
     assert isinstance(file_path, str)
     if isinstance(dataset, (xr.Dataset, xr.DataTree)):
-        messages = _validate_dataset(config_obj, dataset, file_path, None, None)
-    else:
-        messages = _open_and_validate_dataset(config_obj, dataset, file_path)
-    return Result(file_path=file_path, config_object=config_obj, messages=messages)
+        messages = _validate_dataset(
+            config_obj, dataset, file_path, None, None, None, rule_op_cache
+        )
+        return Result(file_path=file_path, config_object=config_obj, messages=messages)
+    if not isinstance(dataset, OpenedDatasets):
+        dataset = open_datasets(config_obj, dataset, file_path)
+    messages = _validate_opened_datasets(config_obj, dataset, file_path, rule_op_cache)
+    return Result(
+        file_path=file_path,
+        config_object=config_obj,
+        messages=messages,
+        # Includes the requests made by rules that read data
+        io_stats=dataset.filesystem.io_stats if dataset.filesystem else None,
+    )
 
 
 def _validate_dataset(
@@ -32,64 +62,193 @@ def _validate_dataset(
     file_path: str,
     file_index: int | None,
     access_latency: float | None,
+    io_stats: IOStats | None,
+    rule_op_cache: RuleOpCache | None,
 ) -> list[Message]:
     assert isinstance(config_obj, ConfigObject)
     assert isinstance(dataset, (xr.Dataset, xr.DataTree))
     assert isinstance(file_path, str)
 
     context = RuleContextImpl(
-        config_obj, dataset, file_path, file_index, access_latency
+        config_obj, dataset, file_path, file_index, access_latency, io_stats
     )
-    for rule_id, rule_config in config_obj.rules.items():
-        with context.use_state(rule_id=rule_id):
-            apply_rule(context, rule_id, rule_config)
+    with trace_span("validate", "validate", {"file_path": file_path}):
+        apply_rules(context, config_obj.rules, rule_op_cache)
     return context.messages
 
 
-def _open_and_validate_dataset(
-    config_obj: ConfigObject, ds_source: Any, file_path: str
-) -> list[Message]:
-    assert isinstance(config_obj, ConfigObject)
-    assert ds_source is not None
-    assert isinstance(file_path, str)
+@dataclass(frozen=True, kw_only=True)
+class OpenedDatasets:
+    """The outcome of opening the dataset(s) from a dataset source.
+    Separates dataset opening from validation, so that both
+    can be performed by different threads.
+    """
+
+    datasets: list[tuple[xr.Dataset | xr.DataTree, str]] = field(default_factory=list)
+    """Pairs of opened dataset and its file path."""
+
+    access_latency: float | None = None
+    """The time in seconds that it took for opening the datasets."""
+
+    io_stats: IOStats | None = None
+    """The requests made for opening the datasets,
+    if they have been opened from an instrumented filesystem.
+    """
+
+    filesystem: InstrumentedFileSystem | None = None
+    """The instrumented filesystem the datasets have been opened from,
+    if any. Records the requests made while validating the datasets.
+    """
 
-    opener_options = config_obj.opener_options or {}
+    processor_op: ProcessorOp | None = None
+    """The processor operation used to open the datasets, if any."""
+
+    error: Exception | None = None
+    """The error that occurred while opening, if any."""
+
+    def close(self):
+        """Close the opened datasets, e.g., if they
+        are not going to be validated.
+        """
+        for dataset, _ in self.datasets:
+            dataset.close()
+
+
+def open_datasets(
+    config_obj: ConfigObject,
+    ds_source: Any,
+    file_path: str,
+    ds_format: DatasetFormat | None = None,
+) -> OpenedDatasets:
+    """Open the dataset(s) from the given dataset source using
+    the opener options and processor of `config_obj`.
+    If the format of the dataset source is already known,
+    it can be passed as `ds_format`.
+    Errors raised while opening are not raised but returned.
+    """
+    # Copy, so we do not modify the configuration
+    opener_options = dict(config_obj.opener_options or {})
+    linter_options = config_obj.linter_options or {}
+    if (
+        linter_options.get(LINTER_OPTION_METADATA_ONLY)
+        and _supports_create_default_indexes()
+    ):
+        # Do not create indexes, which would load coordinate values
+        opener_options.setdefault("create_default_indexes", False)
     if config_obj.processor is not None:
         processor_op = config_obj.get_processor_op(config_obj.processor)
         t0 = time.time()
         try:
-            ds_path_list = processor_op.preprocess(file_path, opener_options)
+            with trace_span("preprocess", "processor", {"file_path": file_path}):
+                ds_path_list = processor_op.preprocess(file_path, opener_options)
         except (OSError, ValueError, TypeError) as e:
-            return [new_fatal_message(str(e))]
+            return OpenedDatasets(error=e)
         access_latency = time.time() - t0
-        messages = [
-            _validate_dataset(config_obj, ds, path, i, access_latency)
-            for i, (ds, path) in enumerate(ds_path_list)
-        ]
-        return processor_op.postprocess(messages, file_path)
+        _add_phase_time(PHASE_PREPROCESS, access_latency)
+        return OpenedDatasets(
+            datasets=ds_path_list,
+            access_latency=access_latency,
+            processor_op=processor_op,
+        )
     else:
         try:
-            dataset, access_latency = _open_dataset(
-                ds_source, opener_options, file_path
-            )
+            with trace_span("open", "open", {"file_path": file_path}):
+                dataset, access_latency, filesystem = _open_dataset(
+                    ds_source, opener_options, file_path, ds_format
+                )
         except (OSError, ValueError, TypeError) as e:
-            return [new_fatal_message(str(e))]
+            return OpenedDatasets(error=e)
+        _add_phase_time(PHASE_OPEN, access_latency)
+        return OpenedDatasets(
+            datasets=[(dataset, file_path)],
+            access_latency=access_latency,
+            io_stats=filesystem.io_stats if filesystem is not None else None,
+            filesystem=filesystem,
+        )
+
+
+def _validate_opened_datasets(
+    config_obj: ConfigObject,
+    opened: OpenedDatasets,
+    file_path: str,
+    rule_op_cache: RuleOpCache | None,
+) -> list[Message]:
+    if opened.error is not None:
+        return [new_fatal_message(str(opened.error))]
+    if opened.processor_op is not None:
+        messages_list = [
+            _validate_dataset(
+                config_obj, ds, path, i, opened.access_latency, None, rule_op_cache
+            )
+            for i, (ds, path) in enumerate(opened.datasets)
+        ]
+        t0 = time.time()
+        with trace_span("postprocess", "processor", {"file_path": file_path}):
+            messages = opened.processor_op.postprocess(messages_list, file_path)
+        _add_phase_time(PHASE_POSTPROCESS, time.time() - t0)
+        return messages
+    else:
+        ((dataset, _),) = opened.datasets
         with dataset:
             return _validate_dataset(
-                config_obj, dataset, file_path, None, access_latency
+                config_obj,
+                dataset,
+                file_path,
+                None,
+                opened.access_latency,
+                opened.io_stats,
+                rule_op_cache,
             )
 
 
 def _open_dataset(
-    ds_source: Any, opener_options: dict[str, Any] | None, file_path: str
-) -> tuple[xr.Dataset | xr.DataTree, float]:
-    """Open a dataset."""
+    ds_source: Any,
+    opener_options: dict[str, Any] | None,
+    file_path: str,
+    ds_format: DatasetFormat | None = None,
+) -> tuple[xr.Dataset | xr.DataTree, float, InstrumentedFileSystem | None]:
+    """Open a dataset.
+
+    Returns:
+        A triple comprising the dataset, the time in seconds it took
+            to open it, and the instrumented filesystem it has been
+            opened from, if any.
+    """
+    opener_options = opener_options or {}
     engine = opener_options.pop("engine", None)
+    t0 = time.time()
+    if ds_format is None:
+        with trace_span("sniff", "open"):
+            ds_format = sniff_dataset_format(
+                ds_source, opener_options.get("storage_options")
+            )
+    if ds_format is not None and is_engine_compatible(ds_format, engine):
+        # Format is known, so we can open the dataset exactly once,
+        # e.g., using consolidated Zarr metadata if available
+        filesystem = None
+        if ds_format.name == "zarr":
+            ds_source, filesystem = _instrument_zarr_source(
+                ds_source, opener_options, ds_format.documents
+            )
+        engine = engine or ds_format.engine
+        opener_options = ds_format.opener_options | opener_options
+        if not ds_format.groups:
+            result = xr.open_dataset(ds_source, engine=engine, **opener_options)
+            return result, time.time() - t0, filesystem
+        try:
+            result = xr.open_datatree(ds_source, engine=engine, **opener_options)
+        except AttributeError:
+            # Some xarray versions fail to open no-group Zarr
+            # datasets as datatree, see below
+            with trace_span("open_dataset", "open", {"fallback": True}):
+                result = xr.open_dataset(ds_source, engine=engine, **opener_options)
+        return result, time.time() - t0, filesystem
+
     if engine is None and (file_path.endswith(".zarr") or file_path.endswith(".zarr/")):
         engine = "zarr"
     try:
-        t0 = time.time()
-        result = xr.open_datatree(ds_source, engine=engine, **(opener_options or {}))
+        with trace_span("open_datatree", "open"):
+            result = xr.open_datatree(ds_source, engine=engine, **opener_options)
         # When opening no-group Zarr datasets we get with xarray 2025.1.2:
         #
         #   File "<...>/site-packages/xarray/backends/zarr.py", line 741, in __init__
@@ -97,9 +256,55 @@ def _open_dataset(
         #                       ^^^^^^^^^^^^^^^^^^^^^^^^^
         # AttributeError: 'NoneType' object has no attribute 'read_only'
     except (OSError, ValueError, TypeError, AttributeError):
-        t0 = time.time()
-        result = xr.open_dataset(ds_source, engine=engine, **(opener_options or {}))
-    return result, time.time() - t0
+        with trace_span("open_dataset", "open", {"fallback": True}):
+            result = xr.open_dataset(ds_source, engine=engine, **opener_options)
+    # Includes the time of failed attempts, as they add to the latency
+    return result, time.time() - t0, None
+
+
+def _instrument_zarr_source(
+    ds_source: Any,
+    opener_options: dict[str, Any],
+    documents: dict[str, bytes | None] | None = None,
+) -> tuple[Any, InstrumentedFileSystem | None]:
+    """Get a Zarr store for the store given by `ds_source`
+    that records the requests made to the store's filesystem.
+    The storage options are removed from `opener_options`,
+    as they are used for the filesystem.
+    The metadata `documents` fetched for sniffing, if any,
+    are not fetched again.
+    """
+    if not isinstance(ds_source, (str, PathLike)) or "::" in str(ds_source):
+        # Chained URLs comprise multiple filesystems, don't instrument them
+        return ds_source, None
+    storage_options = opener_options.pop("storage_options", None)
+    fs, path = get_fs_pool().get_filesystem(ds_source, storage_options)
+    path = path.rstrip("/")
+    try:
+        from zarr.storage import FsspecStore
+    except ImportError:
+        # zarr < 3 opens groups of mappers
+        filesystem = InstrumentedFileSystem(fs, known_files=documents)
+        return filesystem.get_mapper(path), filesystem
+    # zarr >= 3 cannot open groups of mappers, as needed by
+    # xr.open_datatree(), and uses its stores from coroutines
+    filesystem = InstrumentedFileSystem(fs, known_files=documents, asynchronous=True)
+    return FsspecStore(filesystem, read_only=True, path=path), filesystem
+
+
+@lru_cache(maxsize=1)
+def _supports_create_default_indexes() -> bool:
+    """Check whether the installed xarray version supports
+    the `create_default_indexes` argument of `open_dataset()`,
+    which older versions reject.
+    """
+    return "create_default_indexes" in inspect.signature(xr.open_dataset).parameters
+
+
+def _add_phase_time(phase: str, time_: float):
+    timing_profile = get_timing_profile()
+    if timing_profile is not None:
+        timing_profile.add_phase_time(phase, time_)
 
 
 def new_fatal_message(message: str) -> Message:
@@ -12,7 +12,7 @@ from xrlint.formatter import (
     FormatterRegistry,
 )
 from xrlint.linter import Linter, new_linter
-from xrlint.node import AttrNode, AttrsNode, DatasetNode, Node, VariableNode
+from xrlint.node import AttrNode, AttrsNode, DatasetNode, Node, NodeKind, VariableNode
 from xrlint.plugin import Plugin, PluginMeta, new_plugin
 from xrlint.processor import Processor, ProcessorMeta, ProcessorOp, define_processor
 from xrlint.result import (
@@ -57,6 +57,7 @@ __all__ = [
     "VariableNode",
     "DatasetNode",
     "Node",
+    "NodeKind",
     "Plugin",
     "PluginMeta",
     "new_plugin",
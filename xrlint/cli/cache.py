@@ -0,0 +1,389 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import fsspec
+
+from xrlint.config import ConfigObject, split_config_spec
+from xrlint.constants import LINTER_OPTION_METADATA_ONLY
+from xrlint.result import Message, Result, Suggestion
+from xrlint.util.fspool import FileSystemPool
+from xrlint.version import version
+
+CACHE_FORMAT_VERSION = 1
+
+# Root metadata documents whose contents identify the state
+# of a dataset given by a directory, if its metadata is consolidated
+_ROOT_METADATA_NAMES = ("zarr.json", ".zmetadata", ".zgroup", ".zattrs", ".zlevels")
+
+# Metadata documents of the groups and arrays of a directory,
+# e.g., a Zarr store without consolidated metadata
+_METADATA_NAMES = frozenset(
+    ("zarr.json", ".zmetadata", ".zgroup", ".zattrs", ".zarray", ".zlevels")
+)
+
+# Metadata documents of the children of a group by Zarr format
+_CHILD_METADATA_NAMES = {
+    2: (".zgroup", ".zarray", ".zattrs"),
+    3: ("zarr.json",),
+}
+
+# File info entries that change if a file changes,
+# e.g., local mtime or S3 ETag
+_INFO_KEYS = (
+    "size",
+    "mtime",
+    "ETag",
+    "etag",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "generation",
+    "md5Hash",
+    "crc32c",
+)
+
+
+class LintCache:
+    """A persistent cache for validation results.
+
+    Results are stored per file path together with a fingerprint of
+    the file and its configuration. The fingerprint comprises
+
+    * the file's size, modification time and ETag, as far as provided
+      by its filesystem, or, for directories such as Zarr stores,
+      the contents of their metadata documents, that is, their
+      consolidated metadata, if any, otherwise the metadata documents
+      of their groups and arrays, which are found by listing the
+      group directories only;
+    * for directories and if `cache_data` is set, the size,
+      modification time and ETag of all other files, if a configured
+      rule reads data values;
+    * the computed configuration object;
+    * the versions of the configured rules, their plugins, and XRLint.
+
+    A cached result is used only if the fingerprint is unchanged.
+    Results with fatal messages, e.g., caused by network errors,
+    are not cached.
+
+    Changes to data values of directories are detected only by listing
+    all of their files, which, e.g., for Zarr stores in object storage,
+    may cost as much as validating them. Therefore, results of directories
+    validated by rules that read data values are cached only
+    if `cache_data` is set.
+
+    Args:
+        location: Path of the cache file.
+        fs_pool: Pool that provides the filesystems of the
+            validated files.
+        cache_data: Whether to cache the results of directories
+            validated by rules that read data values, which requires
+            fingerprinting all of their files.
+    """
+
+    def __init__(
+        self,
+        location: str,
+        fs_pool: FileSystemPool | None = None,
+        cache_data: bool = False,
+    ):
+        self.location = location
+        self.fs_pool = fs_pool or FileSystemPool()
+        self.cache_data = cache_data
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._fingerprints: dict[str, str] = {}
+
+    def lookup_files(
+        self, files: Iterable[tuple[str, ConfigObject]]
+    ) -> Iterator[tuple[str, ConfigObject, Result | None]]:
+        """Look up the cached results for the given files.
+
+        Args:
+            files: Iterable of pairs comprising a file path
+                and its computed configuration.
+
+        Returns:
+            An iterator of triples comprising the file path, its computed
+                configuration and the cached result, or `None` if there
+                is no valid cached result. In the latter case, the result
+                should be passed to `update()` once it is available.
+        """
+        for file_path, config_obj in files:
+            fingerprint = self._compute_fingerprint(file_path, config_obj)
+            entry = self._entries.get(file_path)
+            if (
+                fingerprint is not None
+                and entry is not None
+                and entry.get("fingerprint") == fingerprint
+            ):
+                self.hits += 1
+                yield (
+                    file_path,
+                    config_obj,
+                    _result_from_json(file_path, entry, config_obj),
+                )
+                continue
+            self.misses += 1
+            if fingerprint is not None:
+                self._fingerprints[file_path] = fingerprint
+            else:
+                self._entries.pop(file_path, None)
+            yield file_path, config_obj, None
+
+    def update(self, result: Result):
+        """Store the given result, if it was produced for a file
+        previously looked up by `lookup_files()`.
+        """
+        fingerprint = self._fingerprints.pop(result.file_path, None)
+        if fingerprint is None:
+            return
+        if result.fatal_error_count:
+            self._entries.pop(result.file_path, None)
+            return
+        self._entries[result.file_path] = {
+            "fingerprint": fingerprint,
+            "messages": [m.to_json() for m in result.messages],
+        }
+
+    def save(self):
+        """Write the cache to its location."""
+        cache_dir = os.path.dirname(os.path.abspath(self.location))
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=".xrlintcache-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {"version": CACHE_FORMAT_VERSION, "entries": self._entries}, f
+                )
+            # Replace atomically, so that concurrent
+            # runs never read a partially written cache
+            os.replace(temp_path, self.location)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.location) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _compute_fingerprint(
+        self, file_path: str, config_obj: ConfigObject
+    ) -> str | None:
+        try:
+            fs, path = self.fs_pool.get_filesystem(
+                file_path, (config_obj.opener_options or {}).get("storage_options")
+            )
+            file_state = _get_file_state(
+                fs, path.rstrip("/"), _needs_data(config_obj), self.cache_data
+            )
+        except (OSError, ValueError, TypeError, ImportError):
+            return None
+        if file_state is None:
+            return None
+        try:
+            rule_versions = _get_rule_versions(config_obj)
+            config_json = config_obj.to_json()
+        except ValueError:
+            return None
+        fingerprint_obj = {
+            "file_path": file_path,
+            "file_state": file_state,
+            "config": config_json,
+            "rules": rule_versions,
+            "xrlint": version,
+        }
+        fingerprint_json = json.dumps(fingerprint_obj, sort_keys=True, default=repr)
+        return hashlib.sha256(fingerprint_json.encode("utf-8")).hexdigest()
+
+
+def _get_file_state(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    needs_data: bool = False,
+    cache_data: bool = False,
+) -> Any:
+    info = fs.info(path)
+    if info.get("type") != "directory":
+        return _get_info_state(info)
+    if needs_data:
+        # Changes to data values can only be detected by listing all files
+        return _get_data_state(fs, path) if cache_data else None
+    root_paths = [f"{path}/{name}" for name in _ROOT_METADATA_NAMES]
+    contents = _cat_existing(fs, root_paths)
+    if contents is None:
+        return None
+    if not _is_consolidated(path, contents):
+        contents = _get_metadata_contents(fs, path, contents)
+        if contents is None:
+            return None
+    return {
+        p[len(path) + 1 :]: hashlib.sha256(content).hexdigest()
+        for p, content in sorted(contents.items())
+    }
+
+
+def _get_metadata_contents(
+    fs: fsspec.AbstractFileSystem, path: str, root_contents: dict[str, bytes]
+) -> dict[str, bytes] | None:
+    """Get the contents of the metadata documents of all groups and
+    arrays of a directory. Only group directories are listed,
+    level by level, and the documents of each level are fetched
+    with a single call, so that chunk files are never listed.
+    """
+    if f"{path}/zarr.json" in root_contents:
+        child_names = _CHILD_METADATA_NAMES[3]
+    elif f"{path}/.zgroup" in root_contents:
+        child_names = _CHILD_METADATA_NAMES[2]
+    else:
+        # E.g., multi-level datasets, whose levels are Zarr stores
+        child_names = _CHILD_METADATA_NAMES[2] + _CHILD_METADATA_NAMES[3]
+    contents = dict(root_contents)
+    group_paths = [path]
+    while group_paths:
+        child_paths = [
+            entry["name"].rstrip("/")
+            for group_path in group_paths
+            for entry in fs.ls(group_path, detail=True)
+            if entry.get("type") == "directory"
+        ]
+        child_contents = _cat_existing(
+            fs, [f"{p}/{name}" for p in child_paths for name in child_names]
+        )
+        if child_contents is None:
+            return None
+        contents.update(child_contents)
+        group_paths = [p for p in child_paths if _is_group(p, child_contents)]
+    return contents or None
+
+
+def _get_data_state(fs: fsspec.AbstractFileSystem, path: str) -> Any:
+    # Metadata documents of groups and arrays are read by the
+    # linter, and data files by rules that read data values
+    entries = fs.find(path, detail=True)
+    metadata_paths = [p for p in entries if p.rsplit("/", 1)[-1] in _METADATA_NAMES]
+    if not metadata_paths:
+        return None
+    contents = fs.cat(metadata_paths, on_error="omit")
+    if len(contents) != len(metadata_paths):
+        return None
+    file_state = {
+        p[len(path) + 1 :]: hashlib.sha256(content).hexdigest()
+        for p, content in sorted(contents.items())
+    }
+    for p, entry in sorted(entries.items()):
+        if p not in contents:
+            entry_state = _get_info_state(entry)
+            if entry_state is None:
+                return None
+            file_state[p[len(path) + 1 :]] = entry_state
+    return file_state
+
+
+def _cat_existing(
+    fs: fsspec.AbstractFileSystem, paths: list[str]
+) -> dict[str, bytes] | None:
+    """Fetch the files that exist, or return `None` if any other
+    error occurs, e.g., a network error.
+    """
+    if not paths:
+        return {}
+    contents = {}
+    for p, content in fs.cat(paths, on_error="return").items():
+        if isinstance(content, bytes):
+            contents[p] = content
+        elif not isinstance(content, FileNotFoundError):
+            return None
+    return contents
+
+
+def _is_group(path: str, contents: dict[str, bytes]) -> bool:
+    if f"{path}/.zgroup" in contents:
+        return True
+    zarr_json = contents.get(f"{path}/zarr.json")
+    if zarr_json is None:
+        return False
+    try:
+        return json.loads(zarr_json).get("node_type") == "group"
+    except (ValueError, AttributeError):
+        return False
+
+
+def _get_info_state(info: dict[str, Any]) -> dict[str, str] | None:
+    info_state = {k: str(info[k]) for k in _INFO_KEYS if k in info}
+    # The size alone is not sufficient to detect changes
+    return info_state if len(info_state) > 1 else None
+
+
+def _is_consolidated(path: str, contents: dict[str, bytes]) -> bool:
+    if f"{path}/.zmetadata" in contents:
+        return True
+    zarr_json = contents.get(f"{path}/zarr.json")
+    if zarr_json is None:
+        return False
+    try:
+        return json.loads(zarr_json).get("consolidated_metadata") is not None
+    except (ValueError, AttributeError):
+        return False
+
+
+def _needs_data(config_obj: ConfigObject) -> bool:
+    """Check whether a configured rule reads data values."""
+    if (config_obj.linter_options or {}).get(LINTER_OPTION_METADATA_ONLY):
+        return False
+    for rule_id, rule_config in (config_obj.rules or {}).items():
+        if rule_config.severity != 0:
+            try:
+                if config_obj.get_rule(rule_id).meta.needs_data:
+                    return True
+            except ValueError:
+                pass
+    return False
+
+
+def _get_rule_versions(config_obj: ConfigObject) -> dict[str, list[str]]:
+    rule_versions = {}
+    for rule_id, rule_config in (config_obj.rules or {}).items():
+        if rule_config.severity == 0:
+            continue
+        plugin_name, _ = split_config_spec(rule_id)
+        plugin = config_obj.get_plugin(plugin_name)
+        rule = config_obj.get_rule(rule_id)
+        rule_versions[rule_id] = [plugin.meta.version, rule.meta.version]
+    return rule_versions
+
+
+def _result_from_json(
+    file_path: str, entry: dict[str, Any], config_obj: ConfigObject
+) -> Result:
+    messages = []
+    for message in entry.get("messages") or []:
+        message = dict(message)
+        suggestions = message.pop("suggestions", None)
+        message.pop("fix", None)
+        messages.append(
+            Message(
+                **message,
+                suggestions=(
+                    [Suggestion(s["desc"], data=s.get("data")) for s in suggestions]
+                    if suggestions
+                    else None
+                ),
+            )
+        )
+    return Result(file_path=file_path, config_object=config_obj, messages=messages)
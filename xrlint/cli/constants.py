@@ -4,7 +4,6 @@
 
 from typing import Final
 
-
 _MODULE_BASENAME: Final = "xrlint_config"
 _REGULAR_BASENAME: Final = "xrlint-config"
 
@@ -24,6 +23,12 @@ DEFAULT_CONFIG_FILES: Final = [
 DEFAULT_CONFIG_FILE_YAML: Final = f"{_REGULAR_BASENAME}.yaml"
 DEFAULT_OUTPUT_FORMAT: Final = "simple"
 DEFAULT_MAX_WARNINGS: Final = 5
+DEFAULT_JOBS: Final = 1
+DEFAULT_PREFETCH: Final = 0
+SNIFF_BATCH_SIZE: Final = 100
+DEFAULT_CACHE_LOCATION: Final = ".xrlintcache"
+TIMING_ENV_VAR: Final = "XRLINT_TIMING"
+TIMING_TOP_N: Final = 10
 
 INIT_CONFIG_YAML: Final = (
     "# XRLint configuration file\n"
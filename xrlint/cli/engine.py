@@ -2,9 +2,13 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import contextlib
+import functools
 import json
 import os
-from collections.abc import Iterable, Iterator
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import click
 import fsspec
@@ -12,23 +16,48 @@ import fsspec.core
 import fsspec.implementations.local
 import yaml
 
+from xrlint._linter.sniff import DatasetFormat, sniff_dataset_formats
+from xrlint._linter.validate import OpenedDatasets, open_datasets
+from xrlint.cli.cache import LintCache
 from xrlint.cli.config import ConfigError, read_config
 from xrlint.cli.constants import (
+    DEFAULT_CACHE_LOCATION,
     DEFAULT_CONFIG_FILE_YAML,
     DEFAULT_CONFIG_FILES,
     DEFAULT_GLOBAL_FILES,
     DEFAULT_GLOBAL_IGNORES,
+    DEFAULT_JOBS,
     DEFAULT_MAX_WARNINGS,
     DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_PREFETCH,
     INIT_CONFIG_YAML,
+    SNIFF_BATCH_SIZE,
+    TIMING_TOP_N,
 )
 from xrlint.config import Config, ConfigLike, ConfigObject, get_core_config_object
-from xrlint.formatter import FormatterContext
+from xrlint.constants import LINTER_OPTION_METADATA_ONLY
+from xrlint.formatter import FormatterContext, FormatterOp
 from xrlint.formatters import export_formatters
 from xrlint.linter import Linter
 from xrlint.plugin import Plugin
 from xrlint.result import Result, ResultStats
+from xrlint.util.concurrency import map_bounded
 from xrlint.util.filefilter import FileFilter
+from xrlint.util.fspool import (
+    FileSystemPool,
+    FileSystemPoolStats,
+    get_fs_pool,
+    use_fs_pool,
+)
+from xrlint.util.timing import TimingProfile, use_timing_profile
+from xrlint.util.tracing import (
+    TraceEvent,
+    Tracer,
+    get_tracer,
+    trace_iter,
+    trace_span,
+    use_tracer,
+)
 
 DEFAULT_GLOBAL_FILTER = FileFilter.from_patterns(
     DEFAULT_GLOBAL_FILES, DEFAULT_GLOBAL_IGNORES
@@ -52,6 +81,15 @@ class XRLint(FormatterContext):
         output_path: str | None = None,
         output_styled: bool = True,
         max_warnings: int = DEFAULT_MAX_WARNINGS,
+        jobs: int = DEFAULT_JOBS,
+        ordered: bool = False,
+        prefetch: int = DEFAULT_PREFETCH,
+        metadata_only: bool = False,
+        cache: bool = False,
+        cache_location: str | None = None,
+        cache_data: bool = False,
+        timing: bool = False,
+        trace_path: str | None = None,
     ):
         self.no_config_lookup = no_config_lookup
         self.config_path = config_path
@@ -61,8 +99,23 @@ class XRLint(FormatterContext):
         self.output_path = output_path
         self.output_styled = output_styled
         self.max_warnings = max_warnings
+        self.jobs = jobs
+        self.ordered = ordered
+        self.prefetch = prefetch
+        self.metadata_only = metadata_only
+        self.cache = cache
+        self.cache_location = cache_location
+        self.cache_data = cache_data
+        self.lint_cache: LintCache | None = None
+        self.timing = timing
+        self._timing_profile: TimingProfile | None = None
+        self.trace_path = trace_path
+        self.config_file_path: str | None = None
+        self._linter: Linter | None = None
         self._result_stats = ResultStats()
         self.config = Config()
+        self.fs_pool = FileSystemPool()
+        self._worker_fs_pool_stats = FileSystemPoolStats()
 
     @property
     def max_warnings_exceeded(self) -> bool:
@@ -74,6 +127,34 @@ class XRLint(FormatterContext):
         """Get current result statistics."""
         return self._result_stats
 
+    @property
+    def timing_profile(self) -> TimingProfile | None:
+        """Get the timing profile of the last run, if `timing` is set."""
+        return self._timing_profile
+
+    @contextlib.contextmanager
+    def tracing(self) -> Iterator[Tracer | None]:
+        """Record a trace of everything done within the `with` block,
+        such as validating files and writing the report, if `trace_path`
+        is given. The trace is written to `trace_path` in the JSON trace
+        event format, which can be viewed using the Perfetto UI
+        or Chrome's `about:tracing`.
+
+        Returns:
+            A context manager that provides the tracer,
+                or `None` if `trace_path` is not given.
+        """
+        if not self.trace_path:
+            yield None
+            return
+        with fsspec.open(self.trace_path, mode="w") as f:
+            tracer = Tracer(f)
+            try:
+                with use_tracer(tracer):
+                    yield tracer
+            finally:
+                tracer.close()
+
     def init_config(self, *extra_configs: ConfigLike) -> None:
         """Initialize configuration.
         The function will load the configuration list from a specified
@@ -99,16 +180,19 @@ class XRLint(FormatterContext):
             rules.update(rule)
 
         file_config = None
+        self.config_file_path = None
 
         if self.config_path:
             try:
                 file_config = read_config(self.config_path)
+                self.config_file_path = self.config_path
             except (FileNotFoundError, ConfigError) as e:
                 raise click.ClickException(f"{e}") from e
         elif not self.no_config_lookup:
             for config_path in DEFAULT_CONFIG_FILES:
                 try:
                     file_config = read_config(config_path)
+                    self.config_file_path = config_path
                     break
                 except FileNotFoundError:
                     pass
@@ -125,11 +209,23 @@ class XRLint(FormatterContext):
             base_configs += file_config.objects
         if rules:
             base_configs += [{"rules": rules}]
+        if self.metadata_only:
+            base_configs += [{"linter_options": {LINTER_OPTION_METADATA_ONLY: True}}]
 
         self.config = Config.from_config(core_config_obj, *base_configs, *extra_configs)
         if not any(co.rules for co in self.config.objects):
             raise click.ClickException("no rules configured")
 
+    @property
+    def linter(self) -> Linter:
+        """The linter used to validate files in this process.
+        It is kept across runs, so that rule operation
+        instances are reused.
+        """
+        if self._linter is None:
+            self._linter = Linter()
+        return self._linter
+
     def compute_config_for_file(self, file_path: str) -> ConfigObject | None:
         """Compute the configuration object for the given file.
 
@@ -156,15 +252,127 @@ class XRLint(FormatterContext):
         """Validate given files or directories which may also be given as URLs.
         The function produces a validation result for each file.
 
+        If `jobs` is not `1`, files are validated in parallel using a
+        pool of worker processes. Results are then yielded as soon as
+        they are available, unless `ordered` is set, in which case they
+        are yielded in the order the files have been found.
+
+        Otherwise, if `prefetch` is greater than zero, up to `prefetch`
+        datasets are opened by a pool of threads while the rules
+        are applied to the current dataset.
+
+        The formats of the datasets are detected in batches, so that
+        the signatures and Zarr metadata of many datasets from the same
+        filesystem are fetched with a single concurrent request.
+        Zarr datasets with consolidated metadata are then opened
+        using the consolidated metadata only.
+
+        Filesystem instances are taken from the engine's `fs_pool`,
+        so that connections are reused across files.
+
+        If `cache` is set, results are read from and written to
+        the cache file at `cache_location`. Files whose fingerprint
+        has not changed since they were last validated are not
+        opened, their cached result is used instead.
+        Results of directories, such as Zarr stores, validated by
+        rules that read data values are cached only if `cache_data`
+        is set, as this requires listing all their files.
+
+        If `timing` is set, the time spent in every rule and in
+        opening datasets is recorded in `timing_profile`.
+
         Args:
             files: Iterable of files.
 
         Returns:
             Iterator of reports.
         """
-        linter = Linter()
-        for file_path, config in self.get_files(files):
-            yield linter.validate(file_path, config=config)
+        if self.cache:
+            cache_location = self.cache_location or DEFAULT_CACHE_LOCATION
+            if os.path.isdir(cache_location):
+                cache_location = os.path.join(cache_location, DEFAULT_CACHE_LOCATION)
+            self.lint_cache = LintCache(
+                cache_location, self.fs_pool, cache_data=self.cache_data
+            )
+        if self.timing:
+            self._timing_profile = TimingProfile()
+        with use_fs_pool(self.fs_pool), use_timing_profile(self._timing_profile):
+            if self.lint_cache is None:
+                yield from self._validate_files(files)
+                return
+            try:
+                for result in self._validate_files(files):
+                    self.lint_cache.update(result)
+                    yield result
+            finally:
+                self.lint_cache.save()
+
+    def _validate_files(self, files: Iterable[str]) -> Iterator[Result]:
+        if self.jobs == 1 and self.prefetch > 0:
+            linter = self.linter
+            with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+                # One more pending than prefetch because the
+                # dataset currently validated is also pending.
+                for file_path, config, opened in map_bounded(
+                    executor,
+                    _open_file,
+                    self._get_files_to_validate(files),
+                    max_pending=self.prefetch + 1,
+                    discard=_close_opened_file,
+                ):
+                    if isinstance(opened, Result):
+                        yield opened
+                        continue
+                    try:
+                        result = linter.validate(
+                            opened, file_path=file_path, config=config
+                        )
+                    finally:
+                        opened.close()
+                    yield result
+        elif self.jobs == 1:
+            linter = self.linter
+            for file_args in self._get_files_to_validate(files):
+                yield _validate_file_with_linter(linter, *file_args)
+        else:
+            max_workers = self.jobs if self.jobs > 0 else os.cpu_count()
+            timing_profile = self._timing_profile
+            tracer = get_tracer()
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # Worker processes return the usage of their filesystem
+                # pools, their timing profiles, and trace events
+                for (
+                    result,
+                    fs_pool_stats,
+                    worker_timing_profile,
+                    trace_events,
+                ) in map_bounded(
+                    executor,
+                    functools.partial(
+                        _validate_file_instrumented,
+                        timing=timing_profile is not None,
+                        tracing=tracer is not None,
+                    ),
+                    self._get_files_to_validate(files),
+                    max_pending=2 * max_workers,
+                    ordered=self.ordered,
+                ):
+                    self._worker_fs_pool_stats += fs_pool_stats
+                    if timing_profile is not None:
+                        timing_profile.merge(worker_timing_profile)
+                    if tracer is not None:
+                        tracer.add_events(trace_events)
+                    yield result
+
+    def _get_files_to_validate(
+        self, file_paths: Iterable[str]
+    ) -> Iterator[tuple[str, ConfigObject, DatasetFormat | None, Result | None]]:
+        files = trace_iter(self.get_files(file_paths), "discover", "discovery")
+        if self.lint_cache is None:
+            files_cached = ((p, c, None) for p, c in files)
+        else:
+            files_cached = self.lint_cache.lookup_files(files)
+        return _sniff_files(files_cached)
 
     def get_files(
         self, file_paths: Iterable[str]
@@ -173,7 +381,10 @@ class XRLint(FormatterContext):
         computed configurations.
 
         Directories in `files` that are not ignored and not recognized by any
-        file pattern will be recursively traversed.
+        file pattern will be recursively traversed. Subdirectories are
+        skipped if the global file filter cannot accept any path below
+        them. If all global `files` patterns start with literal directory
+        paths, traversal starts at these directories.
 
         Args:
             file_paths: Iterable of files or directories.
@@ -187,11 +398,13 @@ class XRLint(FormatterContext):
         )
 
         def compute_config_object(p: str):
-            return config.compute_config_object(p) if global_filter.accept(p) else None
+            if not global_filter.accept(p):
+                return None
+            with trace_span("compute_config", "config"):
+                return config.compute_config_object(p)
 
         for file_path in file_paths:
-            _fs, root = fsspec.url_to_fs(file_path)
-            fs: fsspec.AbstractFileSystem = _fs
+            fs, root = self.fs_pool.get_filesystem(file_path)
             is_local = isinstance(fs, fsspec.implementations.local.LocalFileSystem)
 
             config_obj = compute_config_object(file_path)
@@ -200,31 +413,110 @@ class XRLint(FormatterContext):
                 continue
 
             if fs.isdir(root):
-                for path, dirs, files in fs.walk(root, topdown=True):
-                    for d in list(dirs):
-                        d_path = f"{path}/{d}"
-                        d_path = d_path if is_local else fs.unstrip_protocol(d_path)
-                        c = compute_config_object(d_path)
-                        if c is not None:
-                            dirs.remove(d)
-                            yield d_path, c
-
-                    for f in files:
-                        f_path = f"{path}/{f}"
-                        f_path = f_path if is_local else fs.unstrip_protocol(f_path)
-                        c = compute_config_object(f_path)
-                        if c is not None:
-                            yield f_path, c
+                yield from _walk_dir(
+                    fs, root, is_local, global_filter, compute_config_object
+                )
+
+    def format_stats(self) -> str:
+        """Format the statistics of the last run.
+        The filesystem pool statistics include the pools
+        of worker processes, if any.
+
+        Returns:
+            The statistics in plain text.
+        """
+        result_stats = self._result_stats
+        fs_pool_stats = self.fs_pool.stats + self._worker_fs_pool_stats
+        stats = (
+            f"Results: {result_stats.result_count},"
+            f" errors: {result_stats.error_count},"
+            f" warnings: {result_stats.warning_count}\n"
+            f"Filesystem pool: {fs_pool_stats.size} filesystem(s),"
+            f" {fs_pool_stats.hits} hit(s), {fs_pool_stats.misses} miss(es)"
+        )
+        if self.lint_cache is not None:
+            stats += (
+                f"\nCache: {self.lint_cache.hits} hit(s),"
+                f" {self.lint_cache.misses} miss(es)"
+            )
+        return stats
+
+    def format_timing(self) -> str:
+        """Format the timing profile of the last run.
+
+        Returns:
+            The slowest rules and the time spent in opening
+                datasets in plain text.
+        """
+        if self._timing_profile is None:
+            return "No timing profile recorded."
+        return self._timing_profile.format_table(top_n=TIMING_TOP_N)
 
     def format_results(self, results: Iterable[Result]) -> str:
         """Format the given results.
 
+        Note that all results are kept in memory until the
+        report is complete. Pass the results to `write_report()`
+        to write them incrementally instead.
+
         Args:
             results: Iterable of results.
 
         Returns:
             A report in plain text.
         """
+        formatter_op = self._get_formatter_op(console=self.output_path is None)
+        return formatter_op.format(self, self._result_stats.collect(results))
+
+    def write_report(self, report: str | bytes | Iterable[Result]) -> None:
+        """Write the validation report.
+
+        If `report` is given as results, every result is formatted
+        and written to the output file, or to the console, as soon
+        as it is available, so that it can be released afterwards.
+
+        Args:
+            report: The report provided as plain text, as binary data
+                produced by a binary format, or an iterable of results.
+        """
+        if isinstance(report, (str, bytes)):
+            if self.output_path:
+                mode = "wb" if isinstance(report, bytes) else "w"
+                with fsspec.open(self.output_path, mode=mode) as f:
+                    f.write(report)
+            elif isinstance(report, bytes):
+                raise self._output_file_required()
+            elif self.output_format != "simple":
+                # The simple formatters outputs incrementally to console
+                print(report)
+            return
+
+        results = self._result_stats.collect(report)
+        # The formatter writes to the given stream only
+        formatter_op = self._get_formatter_op(console=False)
+        if formatter_op.binary and not self.output_path:
+            raise self._output_file_required()
+        # As results are written as soon as they are available,
+        # the span comprises the spans of producing them
+        with trace_span("write_report", "format"):
+            if self.output_path:
+                mode = "wb" if formatter_op.binary else "w"
+                with fsspec.open(self.output_path, mode=mode) as f:
+                    formatter_op.write(self, results, f)
+            else:
+                formatter_op.write(self, results, sys.stdout)
+                if self.output_format not in ("simple", "ndjson"):
+                    # Same as print(report)
+                    sys.stdout.write("\n")
+                sys.stdout.flush()
+
+    def _output_file_required(self) -> click.ClickException:
+        return click.ClickException(
+            f"format {self.output_format!r} writes binary data"
+            f" and requires an output file, use '--output-file'."
+        )
+
+    def _get_formatter_op(self, console: bool) -> FormatterOp:
         output_format = (
             self.output_format if self.output_format else DEFAULT_OUTPUT_FORMAT
         )
@@ -241,22 +533,15 @@ class XRLint(FormatterContext):
         if output_format == "simple":
             formatter_kwargs = {
                 "styled": self.output_styled and self.output_path is None,
-                "output": self.output_path is None,
+                "output": console,
             }
         else:
             formatter_kwargs = {}
-        # noinspection PyArgumentList
-        formatter_op = formatter.op_class(**formatter_kwargs)
-        return formatter_op.format(self, self._result_stats.collect(results))
-
-    def write_report(self, report: str) -> None:
-        """Write the validation report provided as plain text."""
-        if self.output_path:
-            with fsspec.open(self.output_path, mode="w") as f:
-                f.write(report)
-        elif self.output_format != "simple":
-            # The simple formatters outputs incrementally to console
-            print(report)
+        try:
+            # noinspection PyArgumentList
+            return formatter.op_class(**formatter_kwargs)
+        except ValueError as e:
+            raise click.ClickException(f"{e}") from e
 
     @classmethod
     def init_config_file(cls) -> None:
@@ -269,3 +554,177 @@ class XRLint(FormatterContext):
         with open(file_path, "w") as f:
             f.write(INIT_CONFIG_YAML)
         click.echo(f"Configuration template written to {file_path}")
+
+
+def _walk_dir(
+    fs: fsspec.AbstractFileSystem,
+    root: str,
+    is_local: bool,
+    global_filter: FileFilter,
+    compute_config_object: Callable[[str], ConfigObject | None],
+) -> Iterator[tuple[str, ConfigObject]]:
+    root_path = root if is_local else fs.unstrip_protocol(root)
+    for start_path in global_filter.get_start_dirs(root_path):
+        # Start listing at the deepest directory
+        # that may contain accepted files
+        start = root + start_path[len(root_path) :]
+        if start != root and not fs.isdir(start):
+            continue
+        for path, dirs, files in fs.walk(start, topdown=True):
+            for d in list(dirs):
+                d_path = f"{path}/{d}"
+                d_path = d_path if is_local else fs.unstrip_protocol(d_path)
+                c = compute_config_object(d_path)
+                if c is not None:
+                    dirs.remove(d)
+                    yield d_path, c
+                elif not global_filter.may_accept_below(d_path):
+                    # Skip subtrees that cannot contain accepted files
+                    dirs.remove(d)
+
+            for f in files:
+                f_path = f"{path}/{f}"
+                f_path = f_path if is_local else fs.unstrip_protocol(f_path)
+                c = compute_config_object(f_path)
+                if c is not None:
+                    yield f_path, c
+
+
+def _sniff_files(
+    files: Iterable[tuple[str, ConfigObject, Result | None]],
+    batch_size: int = SNIFF_BATCH_SIZE,
+) -> Iterator[tuple[str, ConfigObject, DatasetFormat | None, Result | None]]:
+    """Detect the formats of the given files in batches of
+    `batch_size` files.
+    Files that have a cached result, that are opened by a processor,
+    or that have no rules configured are not sniffed.
+    """
+    batch: list[tuple[str, ConfigObject, Result | None]] = []
+
+    def flush() -> Iterator[
+        tuple[str, ConfigObject, DatasetFormat | None, Result | None]
+    ]:
+        sniffed = [
+            (file_path, config_obj)
+            for file_path, config_obj, cached_result in batch
+            if cached_result is None
+            and config_obj.rules
+            and config_obj.processor is None
+        ]
+        with trace_span("sniff", "discovery", {"count": len(sniffed)}):
+            ds_formats = sniff_dataset_formats(
+                [
+                    (
+                        file_path,
+                        (config_obj.opener_options or {}).get("storage_options"),
+                    )
+                    for file_path, config_obj in sniffed
+                ]
+            )
+        ds_format_map = {
+            file_path: ds_format
+            for (file_path, _), ds_format in zip(sniffed, ds_formats)
+        }
+        for file_path, config_obj, cached_result in batch:
+            yield file_path, config_obj, ds_format_map.get(file_path), cached_result
+        batch.clear()
+
+    for file_args in files:
+        batch.append(file_args)
+        if len(batch) >= batch_size:
+            yield from flush()
+    if batch:
+        yield from flush()
+
+
+def _open_file(
+    file_path: str,
+    config_obj: ConfigObject,
+    ds_format: DatasetFormat | None,
+    cached_result: Result | None = None,
+) -> tuple[str, ConfigObject, OpenedDatasets | Result]:
+    """Open the dataset(s) of a single file, unless a cached result
+    is given. Runs in a worker thread.
+    """
+    if cached_result is not None:
+        return file_path, config_obj, cached_result
+    return (
+        file_path,
+        config_obj,
+        open_datasets(config_obj, file_path, file_path, ds_format),
+    )
+
+
+def _close_opened_file(
+    opened_file: tuple[str, ConfigObject, OpenedDatasets | Result],
+):
+    """Close the dataset(s) of a file opened by `_open_file()`
+    that is not going to be validated.
+    """
+    _, _, opened = opened_file
+    if isinstance(opened, OpenedDatasets):
+        opened.close()
+
+
+_worker_linter: Linter | None = None
+
+
+def _validate_file(
+    file_path: str,
+    config_obj: ConfigObject,
+    ds_format: DatasetFormat | None,
+    cached_result: Result | None = None,
+) -> Result:
+    """Validate a single file. Runs in a worker process."""
+    if cached_result is not None:
+        return cached_result
+    global _worker_linter
+    if _worker_linter is None:
+        # One linter per worker process, so that rule
+        # operation instances are reused across files.
+        _worker_linter = Linter()
+    return _validate_file_with_linter(_worker_linter, file_path, config_obj, ds_format)
+
+
+def _validate_file_instrumented(
+    file_path: str,
+    config_obj: ConfigObject,
+    ds_format: DatasetFormat | None,
+    cached_result: Result | None = None,
+    *,
+    timing: bool = False,
+    tracing: bool = False,
+) -> tuple[Result, FileSystemPoolStats, TimingProfile | None, list[TraceEvent] | None]:
+    """Validate a single file and record the usage of the worker's
+    filesystem pool, and a timing profile and trace events,
+    if requested. Runs in a worker process.
+    """
+    fs_pool = get_fs_pool()
+    fs_pool_stats = fs_pool.stats
+    with (
+        use_timing_profile(TimingProfile() if timing else None) as timing_profile,
+        use_tracer(Tracer() if tracing else None) as tracer,
+    ):
+        result = _validate_file(file_path, config_obj, ds_format, cached_result)
+    return (
+        result,
+        fs_pool.stats - fs_pool_stats,
+        timing_profile,
+        tracer.pop_events() if tracer else None,
+    )
+
+
+def _validate_file_with_linter(
+    linter: Linter,
+    file_path: str,
+    config_obj: ConfigObject,
+    ds_format: DatasetFormat | None,
+    cached_result: Result | None = None,
+) -> Result:
+    if cached_result is not None:
+        return cached_result
+    if ds_format is None:
+        # Let the linter open the dataset, if any
+        return linter.validate(file_path, config=config_obj)
+    _, _, opened = _open_file(file_path, config_obj, ds_format)
+    return linter.validate(opened, file_path=file_path, config=config_obj)
@@ -9,9 +9,14 @@ import click
 # Warning: do not import heavy stuff here, it can
 # slow down commands like "xrlint --help" otherwise.
 from xrlint.cli.constants import (
+    DEFAULT_CACHE_LOCATION,
+    DEFAULT_CONFIG_FILE_YAML,
+    DEFAULT_JOBS,
     DEFAULT_MAX_WARNINGS,
     DEFAULT_OUTPUT_FORMAT,
-    DEFAULT_CONFIG_FILE_YAML,
+    DEFAULT_PREFETCH,
+    TIMING_ENV_VAR,
+    TIMING_TOP_N,
 )
 from xrlint.version import version
 
@@ -88,6 +93,112 @@ from xrlint.version import version
     default=DEFAULT_MAX_WARNINGS,
     metavar="COUNT",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    help=(
+        f"Number of worker processes used to validate files in parallel."
+        f" Use 0 to use one process per CPU - default: {DEFAULT_JOBS}"
+    ),
+    type=click.IntRange(min=0),
+    default=DEFAULT_JOBS,
+    metavar="COUNT",
+)
+@click.option(
+    "--ordered",
+    "ordered",
+    help=("Output results in the order files are found when validating in parallel"),
+    is_flag=True,
+)
+@click.option(
+    "--prefetch",
+    "prefetch",
+    help=(
+        f"Number of datasets opened in advance by background threads"
+        f" while validating the current one."
+        f" Ignored if '--jobs' is not 1 - default: {DEFAULT_PREFETCH}"
+    ),
+    type=click.IntRange(min=0),
+    default=DEFAULT_PREFETCH,
+    metavar="COUNT",
+)
+@click.option(
+    "--metadata-only",
+    "metadata_only",
+    help=(
+        "Open datasets without reading data values such as coordinate labels"
+        " and skip rules that need them"
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--cache",
+    "cache",
+    help=(
+        "Only validate changed files, use cached results for unchanged"
+        " files and configuration"
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--cache-location",
+    "cache_location",
+    help=(f"Path to the cache file or directory - default: {DEFAULT_CACHE_LOCATION}"),
+    metavar="PATH",
+)
+@click.option(
+    "--cache-data",
+    "cache_data",
+    help=(
+        "Also cache the results of directories such as Zarr datasets"
+        " validated by rules that read data values. Requires listing all"
+        " files of the directories, which may be costly for object stores"
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--stats",
+    "show_stats",
+    help=(
+        "Print statistics, such as the reuse of filesystem instances,"
+        " to standard error after validation"
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--timing",
+    "timing",
+    help=(
+        "Measure the time spent in each rule and in opening datasets, and"
+        f" print the {TIMING_TOP_N} slowest rules to standard error after"
+        " validation. Can also be enabled by setting environment variable"
+        f" {TIMING_ENV_VAR}=1"
+    ),
+    is_flag=True,
+    envvar=TIMING_ENV_VAR,
+)
+@click.option(
+    "--trace",
+    "trace_file",
+    help=(
+        "Write a trace of the spans of file discovery, configuration,"
+        " opening, processing, each rule, and formatting to FILE."
+        " The trace uses the Chrome trace event format and can be"
+        " viewed with the Perfetto UI or Chrome's about:tracing"
+    ),
+    metavar="FILE",
+)
+@click.option(
+    "--serve",
+    "serve_address",
+    help=(
+        "Run as a server that validates files on request and keeps"
+        " plugins and configuration loaded. ADDRESS is either PORT or"
+        " HOST:PORT for HTTP, or the path of a UNIX socket"
+    ),
+    metavar="ADDRESS",
+)
 @click.option(
     "--init",
     "init_mode",
@@ -107,6 +218,17 @@ def main(
     output_file: str | None,
     output_format: str,
     color_enabled: bool,
+    jobs: int,
+    ordered: bool,
+    prefetch: int,
+    metadata_only: bool,
+    cache: bool,
+    cache_location: str | None,
+    cache_data: bool,
+    show_stats: bool,
+    timing: bool,
+    trace_file: str | None,
+    serve_address: str | None,
     init_mode: bool,
     files: tuple[str, ...],
 ):
@@ -134,8 +256,9 @@ def main(
 
     (3) The validation result is dumped to standard output if not otherwise
     stated by '--output-file'. The output format is 'simple' by default.
-    Other inbuilt formats are 'json' and 'html' which you can specify
-    using the '--format' option.
+    Other inbuilt formats are 'json', 'html', 'ndjson', and 'parquet'
+    which you can specify using the '--format' option.
+    The 'parquet' format requires an output file and the 'pyarrow' package.
 
     Please refer to the documentation (https://bcdev.github.io/xrlint/)
     for more information.
@@ -155,6 +278,15 @@ def main(
         output_path=output_file,
         output_styled=color_enabled,
         max_warnings=max_warnings,
+        jobs=jobs,
+        ordered=ordered,
+        prefetch=prefetch,
+        metadata_only=metadata_only,
+        cache=cache,
+        cache_location=cache_location,
+        cache_data=cache_data,
+        timing=timing,
+        trace_path=trace_file,
     )
 
     if inspect_path:
@@ -162,11 +294,27 @@ def main(
         cli_engine.print_config_for_file(inspect_path)
         return
 
+    if serve_address:
+        from xrlint.cli.server import LintServer
+
+        cli_engine.init_config()
+        server = LintServer(cli_engine, serve_address)
+        click.echo(f"Serving on {server.server_address}, press Ctrl+C to stop.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
     if files:
         cli_engine.init_config()
-        results = cli_engine.validate_files(files)
-        report = cli_engine.format_results(results)
-        cli_engine.write_report(report)
+        with cli_engine.tracing():
+            results = cli_engine.validate_files(files)
+            cli_engine.write_report(results)
+        if show_stats:
+            click.echo(cli_engine.format_stats(), err=True)
+        if timing:
+            click.echo(cli_engine.format_timing(), err=True)
 
         error_status = cli_engine.result_stats.error_count > 0
         max_warn_status = cli_engine.max_warnings_exceeded
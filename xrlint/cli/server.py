@@ -0,0 +1,172 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import json
+import os
+import socketserver
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import click
+
+from xrlint.cli.engine import XRLint
+from xrlint.formatters.json import Json
+from xrlint.version import version
+
+DEFAULT_SERVE_HOST = "127.0.0.1"
+
+
+class LintServer:
+    """A server that keeps an initialized XRLint engine in memory
+    and validates files on request.
+
+    The server speaks HTTP, either over TCP or over a UNIX socket.
+    It provides the following endpoints:
+
+    * `GET /health` returns `{"status": "ok", "version": <version>}`.
+    * `POST /lint` expects a JSON body `{"files": [<file>, ...]}` and
+      returns the results in the format of the `json` formatter.
+
+    Before a request is served, the configuration is reloaded if the
+    configuration file has been modified.
+    Requests are validated one after the other.
+
+    Args:
+        cli_engine: An XRLint engine whose configuration has been
+            initialized.
+        address: Either `PORT` or `HOST:PORT` to listen on TCP,
+            or a file path to listen on a UNIX socket.
+    """
+
+    def __init__(self, cli_engine: XRLint, address: str):
+        self.cli_engine = cli_engine
+        self.address = parse_address(address)
+        self._config_mtime = self._get_config_mtime()
+        self._lock = threading.Lock()
+        if isinstance(self.address, str):
+            if not hasattr(socketserver, "UnixStreamServer"):
+                raise click.ClickException(
+                    "UNIX sockets are not supported on this platform"
+                )
+            if os.path.exists(self.address):
+                os.remove(self.address)
+            self._server = _UnixHTTPServer(self.address, _LintRequestHandler)
+        else:
+            self._server = ThreadingHTTPServer(self.address, _LintRequestHandler)
+        self._server.lint_server = self
+
+    @property
+    def server_address(self) -> str:
+        """The address the server listens on."""
+        if isinstance(self.address, str):
+            return self.address
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        """Serve requests until `shutdown()` is called."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.remove(self.address)
+
+    def shutdown(self):
+        """Stop serving requests."""
+        self._server.shutdown()
+
+    def lint(self, files: list[str]) -> str:
+        """Validate the given files and return the results
+        in the format of the `json` formatter.
+        """
+        with self._lock:
+            self._reload_config_if_modified()
+            results = list(self.cli_engine.validate_files(files))
+            return Json(indent=2).format(self.cli_engine, results)
+
+    def _reload_config_if_modified(self):
+        config_mtime = self._get_config_mtime()
+        if config_mtime != self._config_mtime:
+            self.cli_engine.init_config()
+            self._config_mtime = config_mtime
+
+    def _get_config_mtime(self) -> float | None:
+        config_file_path = self.cli_engine.config_file_path
+        if config_file_path is None:
+            return None
+        try:
+            return os.path.getmtime(config_file_path)
+        except OSError:
+            return None
+
+
+def parse_address(address: str) -> tuple[str, int] | str:
+    """Parse a server address given as `PORT`, `HOST:PORT`,
+    or as the path of a UNIX socket.
+    """
+    if address.isdigit():
+        return DEFAULT_SERVE_HOST, int(address)
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in host and "\\" not in host:
+        return host or DEFAULT_SERVE_HOST, int(port)
+    return address
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class _LintRequestHandler(BaseHTTPRequestHandler):
+    server_version = f"xrlint/{version}"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok", "version": version})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/lint":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+            return
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(content_length) or b"{}")
+            files = request.get("files") if isinstance(request, dict) else None
+            if not isinstance(files, list) or not all(
+                isinstance(f, str) for f in files
+            ):
+                raise ValueError("expected a JSON object with a list of 'files'")
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"{e}"})
+            return
+        try:
+            report = self.server.lint_server.lint(files)
+        except click.ClickException as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": e.message})
+            return
+        self._send_body(HTTPStatus.OK, report.encode("utf-8"))
+
+    def address_string(self) -> str:
+        # UNIX sockets have no client address
+        return self.client_address[0] if self.client_address else "local"
+
+    def log_message(self, format: str, *args: Any):
+        # Do not clutter the console with a line per request
+        pass
+
+    def _send_json(self, status: HTTPStatus, value: Any):
+        self._send_body(status, json.dumps(value).encode("utf-8"))
+
+    def _send_body(self, status: HTTPStatus, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
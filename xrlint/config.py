@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, TypeAlias, Union
 
 from xrlint.constants import CORE_PLUGIN_NAME
 from xrlint.util.constructible import MappingConstructible, ValueConstructible
-from xrlint.util.filefilter import FileFilter
+from xrlint.util.filefilter import FileFilter, FileFilterSet
 from xrlint.util.merge import merge_arrays, merge_dicts, merge_set_lists, merge_values
 from xrlint.util.serializable import JsonSerializable
 
@@ -327,6 +327,9 @@ class Config(ValueConstructible, JsonSerializable):
     def compute_config_object(self, file_path: str) -> ConfigObject | None:
         """Compute the configuration object for the given file path.
 
+        All file paths that match the same configuration objects
+        share the same computed configuration object.
+
         Args:
             file_path: A dataset file path.
 
@@ -335,10 +338,30 @@ class Config(ValueConstructible, JsonSerializable):
                 if `file_path` is not included by any `files` pattern
                 or intentionally ignored by global `ignores`.
         """
+        # Bit i is set, if configuration object i matches
+        signature = self._file_filter_set.accept(file_path)
+
+        cache = self._computed_config_objects
+        if signature not in cache:
+            cache[signature] = self._merge_config_objects(signature)
+        return cache[signature]
+
+    @cached_property
+    def _file_filter_set(self) -> FileFilterSet:
+        """The file filters of all configuration objects,
+        matched in a single pass."""
+        return FileFilterSet(co.file_filter for co in self.objects)
 
+    @cached_property
+    def _computed_config_objects(self) -> dict[int, ConfigObject | None]:
+        """Computed configuration objects by signature of
+        matching configuration objects."""
+        return {}
+
+    def _merge_config_objects(self, signature: int) -> ConfigObject | None:
         config_obj = None
-        for co in self.objects:
-            if co.file_filter.empty or co.file_filter.accept(file_path):
+        for i, co in enumerate(self.objects):
+            if signature & (1 << i):
                 config_obj = config_obj.merge(co) if config_obj is not None else co
 
         if config_obj is None:
@@ -12,6 +12,8 @@ DATASET_ROOT_NAME: Final = "ds"
 MISSING_DATATREE_FILE_PATH: Final = "<datatree>"
 MISSING_DATASET_FILE_PATH: Final = "<dataset>"
 
+LINTER_OPTION_METADATA_ONLY: Final = "metadata_only"
+
 SEVERITY_ERROR: Final = 2
 SEVERITY_WARN: Final = 1
 SEVERITY_OFF: Final = 0
@@ -2,13 +2,15 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import io
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from typing import Any, Callable, Type
+from typing import Any, Callable, TextIO, Type
 
 from xrlint.operation import Operation, OperationMeta
 from xrlint.result import Result, ResultStats
+from xrlint.util.timing import TimingProfile
 
 
 class FormatterContext(ABC):
@@ -24,10 +26,23 @@ class FormatterContext(ABC):
     def result_stats(self) -> ResultStats:
         """Get current result statistics."""
 
+    @property
+    def timing_profile(self) -> TimingProfile | None:
+        """Get the timing profile of the run, if timing is enabled.
+        The profile is complete once all results have been formatted.
+        """
+        return None
+
 
 class FormatterOp(ABC):
     """Define the specific format operation."""
 
+    binary: bool = False
+    """Whether this operation produces binary data rather than text.
+    If so, `write()` expects a binary stream and `format()` returns
+    `bytes`.
+    """
+
     @abstractmethod
     def format(
         self,
@@ -43,6 +58,62 @@ class FormatterOp(ABC):
             A text representing the results in a given format
         """
 
+    def write(
+        self,
+        context: FormatterContext,
+        results: Iterable[Result],
+        stream: TextIO,
+    ) -> None:
+        """Format the given results and write them to `stream`.
+
+        The default implementation writes the text returned by
+        `format()`. Formatters that can write results incrementally
+        should derive from
+        [StreamingFormatterOp][xrlint.formatter.StreamingFormatterOp]
+        instead.
+
+        Args:
+            context: formatting context
+            results: an iterable of results to format
+            stream: a text stream to write the formatted results to
+        """
+        stream.write(self.format(context, results))
+
+
+class StreamingFormatterOp(FormatterOp):
+    """A format operation that writes every result as soon as it
+    is available, so that results are not kept in memory.
+
+    Derived classes implement `write()`, and `format()` returns
+    what has been written.
+    """
+
+    @abstractmethod
+    def write(
+        self,
+        context: FormatterContext,
+        results: Iterable[Result],
+        stream: TextIO,
+    ) -> None:
+        """Format the given results and write them to `stream`
+        one after the other.
+
+        Args:
+            context: formatting context
+            results: an iterable of results to format
+            stream: a text stream to write the formatted results to,
+                or a binary stream, if `binary` is set
+        """
+
+    def format(
+        self,
+        context: FormatterContext,
+        results: Iterable[Result],
+    ) -> str:
+        stream = io.BytesIO() if self.binary else io.StringIO()
+        self.write(context, results, stream)
+        return stream.getvalue()
+
 
 @dataclass(kw_only=True)
 class FormatterMeta(OperationMeta):
@@ -4,9 +4,10 @@
 
 import html
 from collections.abc import Iterable
+from typing import TextIO
 
 from xrlint.constants import SEVERITY_CODE_TO_COLOR, SEVERITY_CODE_TO_NAME
-from xrlint.formatter import FormatterContext, FormatterOp
+from xrlint.formatter import FormatterContext, StreamingFormatterOp
 from xrlint.formatters import registry
 from xrlint.result import Message, Result, get_rules_meta_for_results
 from xrlint.util.formatting import format_problems
@@ -23,7 +24,7 @@ from xrlint.util.schema import schema
         ),
     ),
 )
-class Html(FormatterOp):
+class Html(StreamingFormatterOp):
     def __init__(self, with_meta: bool = False):
         self.with_meta = with_meta
 
@@ -32,20 +33,25 @@ class Html(FormatterOp):
         context: FormatterContext,
         results: Iterable[Result],
     ) -> str:
-        results = list(results)  # get them all
+        return HtmlText(super().format(context, results))
 
-        lines = [
-            "<div>",
-            "<h3>Results</h3>",
-        ]
+    def write(
+        self,
+        context: FormatterContext,
+        results: Iterable[Result],
+        stream: TextIO,
+    ) -> None:
+        rules_meta = {}
+        stream.write("<div>\n<h3>Results</h3>")
         for result in results:
-            lines.extend(format_result(result))
-        lines.append("</div>")
+            for line in format_result(result):
+                stream.write(f"\n{line}")
+            if self.with_meta:
+                rules_meta.update(get_rules_meta_for_results([result]))
+        stream.write("\n</div>")
 
         if self.with_meta:
-            rules_meta = get_rules_meta_for_results(results)
-            lines.append("<div>")
-            lines.append("<h3>Rules</h3>")
+            lines = ["<div>", "<h3>Rules</h3>"]
             for rm in rules_meta.values():
                 lines.append(
                     f"<p>Rule <strong>{rm.name}</strong>, version {rm.version}</p>"
@@ -57,8 +63,8 @@ class Html(FormatterOp):
                         f'<p><a href="{rm.docs_url}">Rule documentation</a></p>'
                     )
             lines.append("</div>")
-
-        return HtmlText("\n".join(lines))
+            for line in lines:
+                stream.write(f"\n{line}")
 
 
 def format_result(result: Result) -> list[str]:
@@ -4,11 +4,13 @@
 
 import json
 from collections.abc import Iterable
+from typing import TextIO
 
-from xrlint.formatter import FormatterContext, FormatterOp
+from xrlint.formatter import FormatterContext, StreamingFormatterOp
 from xrlint.formatters import registry
 from xrlint.result import Result, get_rules_meta_for_results
 from xrlint.util.schema import schema
+from xrlint.util.serializable import JsonValue
 
 
 @registry.define_formatter(
@@ -22,31 +24,53 @@ from xrlint.util.schema import schema
         ),
     ),
 )
-class Json(FormatterOp):
+class Json(StreamingFormatterOp):
     def __init__(self, indent: int = 2, with_meta: bool = False):
         super().__init__()
         self.indent = indent
         self.with_meta = with_meta
 
-    def format(
+    def write(
         self,
         context: FormatterContext,
         results: Iterable[Result],
-    ) -> str:
-        results = list(results)  # get them all
+        stream: TextIO,
+    ) -> None:
+        # Write the same text as json.dumps() would do for the entire
+        # results object, but one result after the other
+        if self.indent is None:
+            newline, item_sep, item_indent = "", ", ", ""
+        else:
+            newline, item_sep = "\n", ",\n"
+            item_indent = 2 * self.indent * " "
+        key_indent = item_indent[: len(item_indent) // 2]
 
         omitted_props = {"config"}
-        results_json = {
-            "results": [
-                {k: v for k, v in r.to_json().items() if k not in omitted_props}
-                for r in results
-            ],
-        }
+        rules_meta = {}
+        result_count = 0
+        stream.write(f'{{{newline}{key_indent}"results": [')
+        for result in results:
+            result_json = {
+                k: v for k, v in result.to_json().items() if k not in omitted_props
+            }
+            stream.write((item_sep if result_count else newline) + item_indent)
+            stream.write(self._dumps(result_json, item_indent))
+            if self.with_meta:
+                rules_meta.update(get_rules_meta_for_results([result]))
+            result_count += 1
+        if result_count:
+            stream.write(f"{newline}{key_indent}")
+        stream.write("]")
         if self.with_meta:
-            rules_meta = get_rules_meta_for_results(results)
-            results_json.update(
-                {
-                    "rules_meta": [rm.to_json() for rm in rules_meta.values()],
-                }
-            )
-        return json.dumps(results_json, indent=self.indent)
+            rules_meta_json = [rm.to_json() for rm in rules_meta.values()]
+            stream.write(f',{newline or " "}{key_indent}"rules_meta": ')
+            stream.write(self._dumps(rules_meta_json, key_indent))
+        timing_profile = context.timing_profile
+        if timing_profile is not None:
+            stream.write(f',{newline or " "}{key_indent}"timing": ')
+            stream.write(self._dumps(timing_profile.to_json(), key_indent))
+        stream.write(f"{newline}}}")
+
+    def _dumps(self, value: JsonValue, prefix: str) -> str:
+        text = json.dumps(value, indent=self.indent)
+        return text.replace("\n", "\n" + prefix) if prefix else text
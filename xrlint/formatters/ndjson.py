@@ -0,0 +1,44 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
+
+from xrlint.formatter import FormatterContext, StreamingFormatterOp
+from xrlint.formatters import registry
+from xrlint.result import Result
+
+
+@registry.define_formatter("ndjson", version="1.0.0")
+class NdJson(StreamingFormatterOp):
+    """Newline-delimited JSON formatter.
+    Writes one JSON object per line for every message.
+    Every object comprises the keys `file_path`, `node_path`, `rule_id`,
+    `severity`, `fatal`, and `message`, which are `null` if not given.
+    Results without messages produce no output.
+    """
+
+    def write(
+        self,
+        context: FormatterContext,
+        results: Iterable[Result],
+        stream: TextIO,
+    ) -> None:
+        for result in results:
+            for record in get_message_records(result):
+                stream.write(json.dumps(record) + "\n")
+
+
+def get_message_records(result: Result) -> Iterator[dict[str, Any]]:
+    """Flatten the messages of the given result into records."""
+    for message in result.messages:
+        yield {
+            "file_path": result.file_path,
+            "node_path": message.node_path,
+            "rule_id": message.rule_id,
+            "severity": message.severity,
+            "fatal": message.fatal,
+            "message": message.message,
+        }
@@ -0,0 +1,90 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+from collections.abc import Iterable
+from typing import Any, BinaryIO
+
+from xrlint.formatter import FormatterContext, StreamingFormatterOp
+from xrlint.formatters import registry
+from xrlint.formatters.ndjson import get_message_records
+from xrlint.result import Result
+from xrlint.util.schema import schema
+
+COLUMN_NAMES = ("file_path", "node_path", "rule_id", "severity", "fatal", "message")
+
+
+@registry.define_formatter(
+    "parquet",
+    version="1.0.0",
+    schema=schema(
+        "object",
+        properties=dict(
+            batch_size=schema("integer", minimum=1, default=10000),
+        ),
+    ),
+)
+class Parquet(StreamingFormatterOp):
+    """Apache Parquet formatter.
+    Writes a table with a row for every message and the columns
+    of the `ndjson` formatter. The columns `file_path` and `rule_id`
+    are dictionary-encoded. Messages are written in row groups of
+    `batch_size` rows, so that at most one batch is kept in memory.
+
+    Requires the `pyarrow` package.
+    """
+
+    binary = True
+
+    def __init__(self, batch_size: int = 10000):
+        # Fail before any file is validated
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ValueError(
+                "the 'parquet' format requires the 'pyarrow' package,"
+                " install it using 'pip install pyarrow'"
+                " or 'conda install -c conda-forge pyarrow'."
+            ) from e
+        self.batch_size = batch_size
+
+    def write(
+        self,
+        context: FormatterContext,
+        results: Iterable[Result],
+        stream: BinaryIO,
+    ) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        dict_type = pa.dictionary(pa.int32(), pa.string())
+        arrow_schema = pa.schema(
+            [
+                ("file_path", dict_type),
+                ("node_path", pa.string()),
+                ("rule_id", dict_type),
+                ("severity", pa.int8()),
+                ("fatal", pa.bool_()),
+                ("message", pa.string()),
+            ]
+        )
+        columns: dict[str, list[Any]] = {name: [] for name in COLUMN_NAMES}
+
+        def flush():
+            writer.write_batch(
+                pa.record_batch(
+                    [columns[name] for name in COLUMN_NAMES], schema=arrow_schema
+                )
+            )
+            for values in columns.values():
+                values.clear()
+
+        with pq.ParquetWriter(stream, arrow_schema) as writer:
+            for result in results:
+                for record in get_message_records(result):
+                    for name in COLUMN_NAMES:
+                        columns[name].append(record[name])
+                    if len(columns["message"]) >= self.batch_size:
+                        flush()
+            if columns["message"]:
+                flush()
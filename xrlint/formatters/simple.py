@@ -3,11 +3,12 @@
 #  MIT license (https://mit-license.org/).
 
 from collections.abc import Iterable
+from typing import TextIO
 
 from tabulate import tabulate
 
 from xrlint.constants import SEVERITY_CODE_TO_COLOR, SEVERITY_CODE_TO_NAME
-from xrlint.formatter import FormatterContext, FormatterOp
+from xrlint.formatter import FormatterContext, StreamingFormatterOp
 from xrlint.formatters import registry
 from xrlint.result import Message, Result
 from xrlint.util.formatting import format_problems, format_styled
@@ -25,7 +26,7 @@ from xrlint.util.schema import schema
         ),
     ),
 )
-class Simple(FormatterOp):
+class Simple(StreamingFormatterOp):
     """Simple output formatter.
     Produces either ANSI-styled (default) or plain text reports.
     It incrementally outputs results to console (stdout) by default.
@@ -35,29 +36,26 @@ class Simple(FormatterOp):
         self.styled = styled
         self.output = output
 
-    def format(
+    def write(
         self,
         context: FormatterContext,
         results: Iterable[Result],
-    ) -> str:
-        text_parts = []
-
+        stream: TextIO,
+    ) -> None:
         error_count = 0
         warning_count = 0
         for result in results:
             result_text = self.format_result(result)
             if self.output:
                 print(result_text, flush=True, end="")
-            text_parts.append(result_text)
+            stream.write(result_text)
             error_count += result.error_count
             warning_count += result.warning_count
 
         summary_text = self._format_summary(error_count, warning_count)
         if self.output:
             print(summary_text, flush=True, end="")
-        text_parts.append(summary_text)
-
-        return "".join(text_parts)
+        stream.write(summary_text)
 
     def format_result(
         self,
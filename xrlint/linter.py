@@ -11,7 +11,8 @@ import xarray as xr
 from xrlint.config import Config, ConfigLike, get_core_config_object
 from xrlint.result import Result
 
-from ._linter.validate import new_fatal_message, validate_dataset
+from ._linter.apply import RuleOpCache
+from ._linter.validate import OpenedDatasets, new_fatal_message, validate_dataset
 from .constants import MISSING_DATASET_FILE_PATH, MISSING_DATATREE_FILE_PATH
 
 
@@ -53,6 +54,9 @@ class Linter:
 
     def __init__(self, *configs: ConfigLike, **config_props: Any):
         self._config = Config.from_config(*configs, config_props)
+        # Instances of stateless rule operations,
+        # reused across calls of `validate()`
+        self._rule_op_cache: RuleOpCache = {}
 
     @property
     def config(self) -> Config:
@@ -95,6 +99,9 @@ class Linter:
         config = Config.from_config(self._config, config, config_props)
         config_obj = config.compute_config_object(file_path)
         if config_obj is None or not config_obj.rules:
+            if isinstance(dataset, OpenedDatasets):
+                # Not validated, hence not closed otherwise
+                dataset.close()
             return Result(
                 file_path=file_path,
                 messages=[
@@ -104,7 +111,7 @@ class Linter:
                 ],
             )
 
-        return validate_dataset(config_obj, dataset, file_path)
+        return validate_dataset(config_obj, dataset, file_path, self._rule_op_cache)
 
 
 def _get_file_path_for_dataset(dataset: xr.Dataset | xr.DataTree) -> str:
@@ -3,42 +3,124 @@
 #  MIT license (https://mit-license.org/).
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any, Hashable, Union
 
 import xarray as xr
 
 
-@dataclass(frozen=True, kw_only=True)
+class NodeKind(Enum):
+    """The kind of a node's location relative to its parent."""
+
+    ROOT = "root"
+    """A root node, its path is its name."""
+
+    CHILD = "child"
+    """A datatree child, path `<parent>/<name>`."""
+
+    COORD = "coord"
+    """A coordinate variable, path `<parent>.coords[<name>]`."""
+
+    DATA_VAR = "data_var"
+    """A data variable, path `<parent>.data_vars[<name>]`."""
+
+    ATTRS = "attrs"
+    """An attributes dictionary, path `<parent>.attrs`."""
+
+    ATTR = "attr"
+    """An attribute, path `<parent>[<name>]`."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Node(ABC):
     """Abstract base class for nodes passed to the methods of a
     rule operation [xrlint.rule.RuleOp][]."""
 
-    path: str
-    """Node path. So users find where in the tree the issue occurred."""
-
     parent: Union["Node", None]
     """Node parent. `None` for root nodes."""
 
+    kind: NodeKind = NodeKind.ROOT
+    """The kind of the node's location relative to its `parent`."""
+
+    _path: str | None = field(default=None, repr=False, compare=False)
+    """The node's path, if given or already computed.
+    Not compared, because the path is derived from the node's
+    `parent`, `kind`, and `name`, which are compared, and
+    otherwise would depend on whether it has been computed yet.
+    """
 
-@dataclass(frozen=True, kw_only=True)
+    @property
+    def path(self) -> str:
+        """Node path. So users find where in the tree the issue occurred.
+        The path is computed from the node's `kind` and `parent`
+        on first access.
+        """
+        path = self._path
+        if path is None:
+            path = self._render_path()
+            object.__setattr__(self, "_path", path)
+        return path
+
+    def _render_path(self) -> str:
+        kind = self.kind
+        name = getattr(self, "name", None)
+        if kind is NodeKind.ROOT or self.parent is None:
+            return str(name)
+        parent_path = self.parent.path
+        if kind is NodeKind.CHILD:
+            return f"{parent_path}/{name}"
+        if kind is NodeKind.COORD:
+            return f"{parent_path}.coords[{name!r}]"
+        if kind is NodeKind.DATA_VAR:
+            return f"{parent_path}.data_vars[{name!r}]"
+        if kind is NodeKind.ATTRS:
+            return f"{parent_path}.attrs"
+        return f"{parent_path}[{name!r}]"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XarrayNode(Node):
     """Base class for `xr.Dataset` nodes."""
 
     def in_coords(self) -> bool:
         """Return `True` if this node is in `xr.Dataset.coords`."""
-        return ".coords[" in self.path
+        return self._get_variable_kind() is NodeKind.COORD
 
     def in_data_vars(self) -> bool:
         """Return `True` if this node is a `xr.Dataset.data_vars`."""
-        return ".data_vars[" in self.path
+        return self._get_variable_kind() is NodeKind.DATA_VAR
 
     def in_root(self) -> bool:
         """Return `True` if this node is a direct child of the dataset."""
-        return not self.in_coords() and not self.in_data_vars()
-
-
-@dataclass(frozen=True, kw_only=True)
+        return self._get_variable_kind() is None
+
+    def _get_variable_kind(self) -> NodeKind | None:
+        # Variables have at most two descendant levels: attrs and attr
+        node = self
+        while node is not None:
+            kind = node.kind
+            if kind is NodeKind.COORD or kind is NodeKind.DATA_VAR:
+                return kind
+            if kind is NodeKind.ROOT and node._path is not None:
+                # Nodes created with a path only, as before nodes
+                # knew their kind
+                return _get_variable_kind_from_path(node._path)
+            if kind is not NodeKind.ATTR and kind is not NodeKind.ATTRS:
+                return None
+            node = node.parent
+        return None
+
+
+def _get_variable_kind_from_path(path: str) -> NodeKind | None:
+    if ".coords[" in path:
+        return NodeKind.COORD
+    if ".data_vars[" in path:
+        return NodeKind.DATA_VAR
+    return None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataTreeNode(XarrayNode):
     """DataTree node."""
 
@@ -49,7 +131,7 @@ class DataTreeNode(XarrayNode):
     """The `xarray.DataTree` instance."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DatasetNode(XarrayNode):
     """Dataset node."""
 
@@ -60,12 +142,12 @@ class DatasetNode(XarrayNode):
     """The `xarray.Dataset` instance."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VariableNode(XarrayNode):
     """Variable node.
     Could be a coordinate or data variable.
-    If you need to distinguish, you can use expression
-    `node.name in ctx.dataset.coords`.
+    If you need to distinguish, you can use the node's
+    `kind` or its methods `in_coords()` and `in_data_vars()`.
     """
 
     name: Hashable
@@ -75,18 +157,22 @@ class VariableNode(XarrayNode):
     """The `xarray.DataArray` instance."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AttrsNode(XarrayNode):
     """Attributes node."""
 
+    kind: NodeKind = NodeKind.ATTRS
+
     attrs: dict[str, Any]
     """Attributes dictionary."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AttrNode(XarrayNode):
     """Attribute node."""
 
+    kind: NodeKind = NodeKind.ATTR
+
     name: str
     """Attribute name."""
 
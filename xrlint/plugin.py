@@ -2,12 +2,13 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Callable, Literal, Type
 
 from xrlint.config import Config, ConfigLike, ConfigObject
 from xrlint.processor import Processor, ProcessorOp, define_processor
-from xrlint.rule import Rule, RuleOp, define_rule
+from xrlint.rule import LazyRule, Rule, RuleMeta, RuleOp, define_rule
 from xrlint.util.constructible import MappingConstructible
 from xrlint.util.importutil import import_value
 from xrlint.util.serializable import JsonSerializable, JsonValue
@@ -72,6 +73,8 @@ class Plugin(MappingConstructible, JsonSerializable):
         type: Literal["problem", "suggestion", "layout"] = "problem",
         description: str | None = None,
         docs_url: str | None = None,
+        needs_data: bool = False,
+        stateful: bool = False,
         op_class: Type[RuleOp] | None = None,
     ) -> Callable[[Any], Type[RuleOp]] | None:
         """Decorator to define a plugin rule.
@@ -87,10 +90,27 @@ class Plugin(MappingConstructible, JsonSerializable):
             type=type,
             description=description,
             docs_url=docs_url,
+            needs_data=needs_data,
+            stateful=stateful,
             op_class=op_class,
             registry=self.rules,
         )
 
+    def define_lazy_rules(self, manifest: Mapping[str, tuple[str, RuleMeta]]):
+        """Define rules whose modules are imported only when
+        the rules are first used.
+
+        Rules already defined are not changed.
+
+        Args:
+            manifest: A mapping from rule names to pairs comprising
+                the fully qualified name of the module that defines
+                the rule and the rule's metadata.
+        """
+        for name, (module_name, meta) in manifest.items():
+            if name not in self.rules:
+                self.rules[name] = LazyRule(meta, module_name, self.rules)
+
     def define_processor(
         self,
         name: str | None = None,
@@ -3,13 +3,14 @@
 #  MIT license (https://mit-license.org/).
 
 from xrlint.plugin import Plugin
-from xrlint.util.importutil import import_submodules
 
 
 def export_plugin() -> Plugin:
+    from .manifest import RULE_MANIFEST
     from .plugin import plugin
 
-    import_submodules("xrlint.plugins.core.rules")
+    # Rule modules are imported when the rules are first used
+    plugin.define_lazy_rules(RULE_MANIFEST)
 
     plugin.define_config(
         "recommended",
@@ -0,0 +1,198 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+# This module is auto-generated by `python -m mkrulemanifest`,
+# do not edit. Recreate it after changing or adding a rule.
+
+from typing import Final
+
+from xrlint.rule import RuleMeta
+
+RULE_MANIFEST: Final[dict[str, tuple[str, RuleMeta]]] = {
+    "content-desc": (
+        "xrlint.plugins.core.rules.content_desc",
+        RuleMeta(
+            name="content-desc",
+            version="1.0.0",
+            description="A dataset should provide information about where the data came from and what has been done to it. This information is mainly for the benefit of human readers. The rule accepts the following configuration parameters:\n\n- `globals`: list of names of required global attributes. Defaults to `['title', 'history']`.\n- `commons`: list of names of required variable attributes that can also be defined globally. Defaults to `['institution', 'source', 'references', 'comment']`.\n- `no_vars`: do not check variables at all. Defaults to `False`.\n- `ignored_vars`: list of ignored variables (regex patterns). Defaults to `['crs', 'spatial_ref']`.\n",
+            schema={
+                "type": "object",
+                "properties": {
+                    "globals": {
+                        "type": "array",
+                        "default": ["title", "history"],
+                        "items": {"type": "string"},
+                        "title": "Global attribute names",
+                    },
+                    "commons": {
+                        "type": "array",
+                        "default": ["institution", "source", "references", "comment"],
+                        "items": {"type": "string"},
+                        "title": "Common attribute names",
+                    },
+                    "skip_vars": {
+                        "type": "boolean",
+                        "default": False,
+                        "title": "Do not check variables",
+                    },
+                    "ignored_vars": {
+                        "type": "array",
+                        "default": ["crs", "spatial_ref"],
+                        "items": {"type": "string"},
+                        "title": "Ignored variables (regex name patterns)",
+                    },
+                },
+            },
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#description-of-file-contents",
+            type="suggestion",
+        ),
+    ),
+    "no-empty-attrs": (
+        "xrlint.plugins.core.rules.no_empty_attrs",
+        RuleMeta(
+            name="no-empty-attrs",
+            version="1.0.0",
+            description="Every dataset element should have metadata that describes it.",
+            type="suggestion",
+        ),
+    ),
+    "grid-mappings": (
+        "xrlint.plugins.core.rules.grid_mappings",
+        RuleMeta(
+            name="grid-mappings",
+            version="1.0.0",
+            description="Grid mappings, if any, shall have valid grid mapping coordinate variables.",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#grid-mappings-and-projections",
+        ),
+    ),
+    "no-empty-chunks": (
+        "xrlint.plugins.core.rules.no_empty_chunks",
+        RuleMeta(
+            name="no-empty-chunks",
+            version="1.0.0",
+            description="Empty chunks should not be encoded and written. The rule currently applies to Zarr format only.",
+            docs_url="https://docs.xarray.dev/en/stable/generated/xarray.Dataset.to_zarr.html#xarray-dataset-to-zarr",
+            type="suggestion",
+        ),
+    ),
+    "lat-coordinate": (
+        "xrlint.plugins.core.rules.lat_lon_coordinate",
+        RuleMeta(
+            name="lat-coordinate",
+            version="1.0.0",
+            description="Latitude coordinate should have standard units and standard names.",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#latitude-coordinate",
+        ),
+    ),
+    "lon-coordinate": (
+        "xrlint.plugins.core.rules.lat_lon_coordinate",
+        RuleMeta(
+            name="lon-coordinate",
+            version="1.0.0",
+            description="Longitude coordinate should have standard units and standard names.",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#longitude-coordinate",
+        ),
+    ),
+    "access-latency": (
+        "xrlint.plugins.core.rules.access_latency",
+        RuleMeta(
+            name="access-latency",
+            version="1.0.0",
+            description="Ensure that the time it takes to open a dataset from its source does a exceed a given `threshold` in seconds. The default threshold is `2.5`.",
+            schema={
+                "type": "object",
+                "properties": {
+                    "threshold": {
+                        "type": "number",
+                        "default": 2.5,
+                        "exclusiveMinimum": 0,
+                        "title": "Threshold time in seconds",
+                    }
+                },
+            },
+        ),
+    ),
+    "var-missing-data": (
+        "xrlint.plugins.core.rules.var_missing_data",
+        RuleMeta(
+            name="var-missing-data",
+            version="1.0.0",
+            description="Checks the recommended use of missing data, i.e., coordinate variables should not define missing data, but packed data should. Notifies about the use of valid ranges to indicate missing data, which is currently not supported by xarray.",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#units",
+            type="suggestion",
+        ),
+    ),
+    "conventions": (
+        "xrlint.plugins.core.rules.conventions",
+        RuleMeta(
+            name="conventions",
+            version="1.0.0",
+            description="Datasets should identify the applicable conventions using the `Conventions` attribute.\n The rule has an optional configuration parameter `match` which is a regex pattern that the value of the `Conventions` attribute must match, if any. If not provided, the rule just verifies that the attribute exists and whether it is a character string.",
+            schema={
+                "type": "object",
+                "properties": {"match": {"type": "string", "title": "Regex pattern"}},
+            },
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#identification-of-conventions",
+            type="suggestion",
+        ),
+    ),
+    "var-flags": (
+        "xrlint.plugins.core.rules.var_flags",
+        RuleMeta(
+            name="var-flags",
+            version="1.0.0",
+            description="Validate attributes 'flag_values', 'flag_masks' and 'flag_meanings' that make variables that contain flag values self describing. ",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#flags",
+            type="suggestion",
+        ),
+    ),
+    "var-units": (
+        "xrlint.plugins.core.rules.var_units",
+        RuleMeta(
+            name="var-units",
+            version="1.0.0",
+            description="Every variable should provide a description of its units.",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#units",
+            type="suggestion",
+        ),
+    ),
+    "var-desc": (
+        "xrlint.plugins.core.rules.var_desc",
+        RuleMeta(
+            name="var-desc",
+            version="1.0.0",
+            description="Check that each data variable provides an identification and description of the content. The rule can be configured by parameter `attrs` which is a list of names of attributes that provides descriptive information. It defaults to `['standard_name', 'long_name']`.",
+            schema={
+                "type": "object",
+                "properties": {
+                    "attrs": {
+                        "type": "array",
+                        "default": ["standard_name", "long_name"],
+                        "items": {"type": "string"},
+                        "title": "Attribute names to check",
+                    }
+                },
+            },
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#standard-name",
+            type="suggestion",
+        ),
+    ),
+    "time-coordinate": (
+        "xrlint.plugins.core.rules.time_coordinate",
+        RuleMeta(
+            name="time-coordinate",
+            version="1.0.0",
+            description="Time coordinates should have valid and unambiguous time units encoding.",
+            docs_url="https://cfconventions.org/cf-conventions/cf-conventions.html#time-coordinate",
+        ),
+    ),
+    "coords-for-dims": (
+        "xrlint.plugins.core.rules.coords_for_dims",
+        RuleMeta(
+            name="coords-for-dims",
+            version="1.0.0",
+            description="Dimensions of data variables should have corresponding coordinates.",
+        ),
+    ),
+}
@@ -8,9 +8,11 @@ from xrlint.util.importutil import import_submodules
 
 
 def export_plugin() -> Plugin:
+    from .manifest import RULE_MANIFEST
     from .plugin import plugin
 
-    import_submodules("xrlint.plugins.xcube.rules")
+    # Rule modules are imported when the rules are first used
+    plugin.define_lazy_rules(RULE_MANIFEST)
     import_submodules("xrlint.plugins.xcube.processors")
 
     common_configs = [
@@ -36,7 +38,9 @@ def export_plugin() -> Plugin:
             *common_configs,
             {
                 "rules": {
+                    "xcube/aligned-chunks": "warn",
                     "xcube/any-spatial-data-var": "error",
+                    "xcube/chunk-size": "warn",
                     "xcube/cube-dims-order": "error",
                     "xcube/data-var-colors": "warn",
                     "xcube/dataset-title": "error",
@@ -0,0 +1,188 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+# This module is auto-generated by `python -m mkrulemanifest`,
+# do not edit. Recreate it after changing or adding a rule.
+
+from typing import Final
+
+from xrlint.rule import RuleMeta
+
+RULE_MANIFEST: Final[dict[str, tuple[str, RuleMeta]]] = {
+    "data-var-colors": (
+        "xrlint.plugins.xcube.rules.data_var_colors",
+        RuleMeta(
+            name="data-var-colors",
+            version="1.0.0",
+            description="Spatial data variables should encode xcube color mappings in their metadata.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#encoding-of-colors",
+            type="suggestion",
+        ),
+    ),
+    "cube-dims-order": (
+        "xrlint.plugins.xcube.rules.cube_dims_order",
+        RuleMeta(
+            name="cube-dims-order",
+            version="1.0.0",
+            description="Order of dimensions in spatio-temporal datacube variables should be [time, ..., y, x].",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#data-model-and-format",
+        ),
+    ),
+    "any-spatial-data-var": (
+        "xrlint.plugins.xcube.rules.any_spatial_data_var",
+        RuleMeta(
+            name="any-spatial-data-var",
+            version="1.0.0",
+            description="A datacube should have spatial data variables.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#data-model-and-format",
+        ),
+    ),
+    "no-chunked-coords": (
+        "xrlint.plugins.xcube.rules.no_chunked_coords",
+        RuleMeta(
+            name="no-chunked-coords",
+            version="1.0.0",
+            description="Coordinate variables should not be chunked. Can be used to identify performance issues, where chunked coordinates can cause slow opening if datasets due to the many chunk-fetching requests made to (remote) filesystems with low bandwidth. You can use the `limit` parameter to specify an acceptable number  of chunks. Its default is 5.",
+            schema={
+                "type": "object",
+                "properties": {
+                    "limit": {
+                        "type": "integer",
+                        "default": 5,
+                        "minimum": 0,
+                        "title": "Acceptable number of chunks",
+                    }
+                },
+            },
+        ),
+    ),
+    "ml-dataset-time": (
+        "xrlint.plugins.xcube.rules.ml_dataset_time",
+        RuleMeta(
+            name="ml-dataset-time",
+            version="1.0.0",
+            description="The `time` dimension of multi-level datasets should use a chunk size of 1. This allows for faster image tile generation for visualisation.",
+            docs_url="https://xcube.readthedocs.io/en/latest/mldatasets.html#definition",
+        ),
+    ),
+    "ml-dataset-xy": (
+        "xrlint.plugins.xcube.rules.ml_dataset_xy",
+        RuleMeta(
+            name="ml-dataset-xy",
+            version="1.0.0",
+            description="Multi-level dataset levels should provide spatial resolutions decreasing by powers of two.",
+            docs_url="https://xcube.readthedocs.io/en/latest/mldatasets.html#definition",
+        ),
+    ),
+    "dataset-title": (
+        "xrlint.plugins.xcube.rules.dataset_title",
+        RuleMeta(
+            name="dataset-title",
+            version="1.0.0",
+            description="Datasets should be given a non-empty title.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#metadata",
+        ),
+    ),
+    "aligned-chunks": (
+        "xrlint.plugins.xcube.rules.aligned_chunks",
+        RuleMeta(
+            name="aligned-chunks",
+            version="1.0.0",
+            description="The dask chunks of variables should be aligned with their storage chunks. Can be used to identify performance issues, where dask chunks that split or straddle storage chunks cause the same storage chunks to be fetched repeatedly, e.g., if a dataset is opened with `chunks` given by the opener options. The rule estimates the read amplification, that is, the number of bytes fetched per byte used. You can use the `limit` parameter to specify an acceptable read amplification. Its default is 1.0.",
+            schema={
+                "type": "object",
+                "properties": {
+                    "limit": {
+                        "type": "number",
+                        "default": 1.0,
+                        "minimum": 1,
+                        "title": "Acceptable read amplification",
+                    }
+                },
+            },
+        ),
+    ),
+    "chunk-size": (
+        "xrlint.plugins.xcube.rules.chunk_size",
+        RuleMeta(
+            name="chunk-size",
+            version="1.0.0",
+            description="The chunks of data variables should have a size in bytes within given limits. Can be used to identify performance issues, where too small chunks cause many chunk-fetching requests and too large chunks cause fetching more data than needed. The chunk size is computed from the variable's storage chunks, or its dask chunks, and its data type; no data is read. You can use the `min_size` and `max_size` parameters to specify the limits in bytes. Their defaults are 1048576 (1 MiB) and 104857600 (100 MiB).",
+            schema={
+                "type": "object",
+                "properties": {
+                    "min_size": {
+                        "type": "integer",
+                        "default": 1048576,
+                        "minimum": 0,
+                        "title": "Minimum chunk size in bytes",
+                    },
+                    "max_size": {
+                        "type": "integer",
+                        "default": 104857600,
+                        "minimum": 1,
+                        "title": "Maximum chunk size in bytes",
+                    },
+                },
+            },
+        ),
+    ),
+    "single-grid-mapping": (
+        "xrlint.plugins.xcube.rules.single_grid_mapping",
+        RuleMeta(
+            name="single-grid-mapping",
+            version="1.0.0",
+            description="A single grid mapping shall be used for all spatial data variables of a datacube.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#spatial-reference",
+        ),
+    ),
+    "time-naming": (
+        "xrlint.plugins.xcube.rules.time_naming",
+        RuleMeta(
+            name="time-naming",
+            version="1.0.0",
+            description="Time coordinate and dimension should be called 'time'.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#temporal-reference",
+        ),
+    ),
+    "ml-dataset-meta": (
+        "xrlint.plugins.xcube.rules.ml_dataset_meta",
+        RuleMeta(
+            name="ml-dataset-meta",
+            version="1.0.0",
+            description="Multi-level datasets should provide a '.zlevels' meta-info file, and if so, it should be consistent. Without the meta-info file the multi-level dataset cannot be reliably extended by new time slices as the aggregation method used for each variable must be specified.",
+            docs_url="https://xcube.readthedocs.io/en/latest/mldatasets.html#the-xcube-levels-format",
+            type="suggestion",
+        ),
+    ),
+    "lat-lon-naming": (
+        "xrlint.plugins.xcube.rules.lat_lon_naming",
+        RuleMeta(
+            name="lat-lon-naming",
+            version="1.0.0",
+            description="Latitude and longitude coordinates and dimensions should be called 'lat' and 'lon'.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#spatial-reference",
+        ),
+    ),
+    "increasing-time": (
+        "xrlint.plugins.xcube.rules.increasing_time",
+        RuleMeta(
+            name="increasing-time",
+            version="1.0.0",
+            description="Time coordinate labels should be monotonically increasing.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#temporal-reference",
+            needs_data=True,
+        ),
+    ),
+    "grid-mapping-naming": (
+        "xrlint.plugins.xcube.rules.grid_mapping_naming",
+        RuleMeta(
+            name="grid-mapping-naming",
+            version="1.0.0",
+            description="Grid mapping variables should be called 'spatial_ref' or 'crs' for compatibility with rioxarray and other packages.",
+            docs_url="https://xcube.readthedocs.io/en/latest/cubespec.html#spatial-reference",
+            type="suggestion",
+        ),
+    ),
+}
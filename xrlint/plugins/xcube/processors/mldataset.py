@@ -19,6 +19,7 @@ from xrlint.plugins.xcube.util import (
 )
 from xrlint.processor import ProcessorOp
 from xrlint.result import Message
+from xrlint.util.fspool import get_fs_pool
 
 level_pattern = re.compile(r"^(\d+)(?:\.zarr)?$")
 link_pattern = re.compile(r"^(\d+)(?:\.link)?$")
@@ -77,7 +78,7 @@ def get_filesystem(file_path: str, opener_options: dict[str, Any]):
         )
         or {}
     )
-    _fs, fs_path = fsspec.core.url_to_fs(file_path, **storage_options)
+    _fs, fs_path = get_fs_pool().get_filesystem(file_path, storage_options)
     fs: fsspec.AbstractFileSystem = _fs
     fs_path: str = fs_path.replace("\\", "/")
     return fs, fs_path
@@ -0,0 +1,103 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import math
+from typing import Final
+
+from xrlint.node import VariableNode
+from xrlint.plugins.xcube.plugin import plugin
+from xrlint.plugins.xcube.util import format_chunk_shape, get_storage_chunks
+from xrlint.rule import RuleContext, RuleOp
+from xrlint.util.schema import schema
+
+DEFAULT_LIMIT: Final = 1.0
+
+
+@plugin.define_rule(
+    "aligned-chunks",
+    version="1.0.0",
+    type="problem",
+    description=(
+        "The dask chunks of variables should be aligned with their storage chunks."
+        " Can be used to identify performance issues, where dask chunks that split"
+        " or straddle storage chunks cause the same storage chunks to be fetched"
+        " repeatedly, e.g., if a dataset is opened with `chunks` given by the"
+        " opener options. The rule estimates the read amplification,"
+        " that is, the number of bytes fetched per byte used."
+        " You can use the `limit` parameter to specify an acceptable"
+        f" read amplification. Its default is {DEFAULT_LIMIT}."
+    ),
+    schema=schema(
+        "object",
+        properties=dict(
+            limit=schema(
+                "number",
+                minimum=1,
+                default=DEFAULT_LIMIT,
+                title="Acceptable read amplification",
+            )
+        ),
+    ),
+)
+class AlignedChunks(RuleOp):
+    def __init__(self, limit: float = DEFAULT_LIMIT):
+        self.limit = limit
+
+    def validate_variable(self, ctx: RuleContext, node: VariableNode):
+        var = node.array
+        if var.chunks is None or var.size == 0:
+            # ok, no dask chunks or no data
+            return
+
+        storage_chunks = get_storage_chunks(var)
+        if storage_chunks is None:
+            # ok, storage chunks unknown
+            return
+
+        # Storage chunks may exceed the variable's shape
+        storage_chunks = tuple(min(c, s) for c, s in zip(storage_chunks, var.shape))
+        read_amplification = math.prod(
+            _get_read_amplification(dim_chunks, storage_chunk)
+            for dim_chunks, storage_chunk in zip(var.chunks, storage_chunks)
+        )
+        if read_amplification > self.limit:
+            dask_chunks = tuple(max(dim_chunks) for dim_chunks in var.chunks)
+            aligned_chunks = tuple(
+                max(1, round(d / s)) * s for d, s in zip(dask_chunks, storage_chunks)
+            )
+            ctx.report(
+                f"Read amplification exceeds limit:"
+                f" {read_amplification:.2f} > {self.limit},"
+                f" dask chunks of shape {format_chunk_shape(var.dims, dask_chunks)}"
+                " are not aligned with storage chunks of shape"
+                f" {format_chunk_shape(var.dims, storage_chunks)}.",
+                suggestions=[
+                    (
+                        "Open the dataset with dask chunks that are multiples of"
+                        " the storage chunks, e.g.,"
+                        f" {format_chunk_shape(var.dims, aligned_chunks)},"
+                        " or use `chunks={}` to open it with its storage chunks."
+                    )
+                ],
+            )
+
+
+def _get_read_amplification(dim_chunks: tuple[int, ...], storage_chunk: int) -> float:
+    """Estimate the number of elements fetched per element used
+    along a dimension, if every dask chunk given by `dim_chunks`
+    fetches all storage chunks of size `storage_chunk` it intersects.
+    """
+    size = sum(dim_chunks)
+    fetched = 0
+    start = 0
+    for chunk in dim_chunks:
+        if chunk == 0:
+            continue
+        end = start + chunk
+        first = start // storage_chunk
+        last = (end - 1) // storage_chunk
+        # The last storage chunk may be smaller
+        fetched += min((last + 1) * storage_chunk, size) - first * storage_chunk
+        start = end
+    return fetched / size if size else 1.0
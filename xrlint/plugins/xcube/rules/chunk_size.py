@@ -0,0 +1,142 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import math
+from typing import Final
+
+from xrlint.node import VariableNode
+from xrlint.plugins.xcube.plugin import plugin
+from xrlint.plugins.xcube.util import format_chunk_shape, get_chunk_shape
+from xrlint.rule import RuleContext, RuleOp
+from xrlint.util.formatting import format_byte_size, format_count
+from xrlint.util.schema import schema
+
+DEFAULT_MIN_SIZE: Final = 1024 * 1024  # 1 MiB
+DEFAULT_MAX_SIZE: Final = 100 * 1024 * 1024  # 100 MiB
+
+
+@plugin.define_rule(
+    "chunk-size",
+    version="1.0.0",
+    type="problem",
+    description=(
+        "The chunks of data variables should have a size in bytes"
+        " within given limits. Can be used to identify performance issues,"
+        " where too small chunks cause many chunk-fetching requests"
+        " and too large chunks cause fetching more data than needed."
+        " The chunk size is computed from the variable's storage chunks,"
+        " or its dask chunks, and its data type; no data is read."
+        " You can use the `min_size` and `max_size` parameters to specify"
+        f" the limits in bytes. Their defaults are {DEFAULT_MIN_SIZE}"
+        f" (1 MiB) and {DEFAULT_MAX_SIZE} (100 MiB)."
+    ),
+    schema=schema(
+        "object",
+        properties=dict(
+            min_size=schema(
+                "integer",
+                minimum=0,
+                default=DEFAULT_MIN_SIZE,
+                title="Minimum chunk size in bytes",
+            ),
+            max_size=schema(
+                "integer",
+                minimum=1,
+                default=DEFAULT_MAX_SIZE,
+                title="Maximum chunk size in bytes",
+            ),
+        ),
+    ),
+)
+class ChunkSize(RuleOp):
+    def __init__(
+        self, min_size: int = DEFAULT_MIN_SIZE, max_size: int = DEFAULT_MAX_SIZE
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def validate_variable(self, ctx: RuleContext, node: VariableNode):
+        if not node.in_data_vars():
+            return
+
+        var = node.array
+        if var.size == 0 or var.dtype.kind == "O":
+            # ok, no data or size of items unknown
+            return
+
+        chunk_shape = get_chunk_shape(var)
+        if chunk_shape is None:
+            # ok, not chunked
+            return
+
+        chunk_size = math.prod(chunk_shape) * var.dtype.itemsize
+        num_chunks = _get_num_chunks(var.shape, chunk_shape)
+        if chunk_size < self.min_size and num_chunks > 1:
+            problem = (
+                f"Chunk size is below minimum: {format_byte_size(chunk_size)}"
+                f" < {format_byte_size(self.min_size)}"
+            )
+        elif chunk_size > self.max_size:
+            problem = (
+                f"Chunk size exceeds maximum: {format_byte_size(chunk_size)}"
+                f" > {format_byte_size(self.max_size)}"
+            )
+        else:
+            return
+
+        suggested_shape = _suggest_chunk_shape(
+            var.shape,
+            chunk_shape,
+            var.dtype.itemsize,
+            # Geometric mean, as the limits usually differ by magnitudes
+            math.sqrt(max(self.min_size, 1) * self.max_size),
+        )
+        suggested_size = math.prod(suggested_shape) * var.dtype.itemsize
+        suggested_num_chunks = _get_num_chunks(var.shape, suggested_shape)
+        ctx.report(
+            f"{problem}, variable has"
+            f" {format_count(num_chunks, 'chunk')}"
+            f" of shape {format_chunk_shape(var.dims, chunk_shape)}.",
+            suggestions=[
+                (
+                    "Use chunks of shape"
+                    f" {format_chunk_shape(var.dims, suggested_shape)},"
+                    f" which results in {format_count(suggested_num_chunks, 'chunk')}"
+                    f" of {format_byte_size(suggested_size)}."
+                )
+            ],
+        )
+
+
+def _get_num_chunks(shape: tuple[int, ...], chunk_shape: tuple[int, ...]) -> int:
+    return math.prod(math.ceil(s / c) for s, c in zip(shape, chunk_shape))
+
+
+def _suggest_chunk_shape(
+    shape: tuple[int, ...],
+    chunk_shape: tuple[int, ...],
+    itemsize: int,
+    target_size: float,
+) -> tuple[int, ...]:
+    """Scale `chunk_shape` so that the chunk size approaches
+    `target_size`. Chunks are enlarged in their innermost dimensions
+    first and reduced in their outermost dimensions first, that is,
+    spatial chunks are kept large, and time chunks small.
+    Enlarged chunks are multiples of the given ones, so that they
+    remain aligned with the existing chunks.
+    """
+    new_shape = list(chunk_shape)
+    size = math.prod(chunk_shape) * itemsize
+    grow = size < target_size
+    dims = range(len(shape))
+    for i in reversed(dims) if grow else dims:
+        chunk = new_shape[i]
+        if grow:
+            new_chunk = max(1, round(target_size / size)) * chunk
+        else:
+            new_chunk = round(chunk * target_size / size)
+        new_chunk = max(1, min(shape[i], new_chunk))
+        size = size / chunk * new_chunk
+        new_shape[i] = new_chunk
+    return tuple(new_shape)
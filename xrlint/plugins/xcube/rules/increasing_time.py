@@ -18,6 +18,7 @@ from xrlint.util.formatting import format_count, format_seq
     docs_url=(
         "https://xcube.readthedocs.io/en/latest/cubespec.html#temporal-reference"
     ),
+    needs_data=True,
 )
 class IncreasingTime(RuleOp):
     def validate_variable(self, ctx: RuleContext, node: VariableNode):
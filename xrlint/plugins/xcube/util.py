@@ -95,6 +95,43 @@ def get_spatial_size(
     return None
 
 
+def get_storage_chunks(var: xr.DataArray) -> tuple[int, ...] | None:
+    """Return the shape of the chunks in which `var` is stored,
+    as given by its encoding, or `None` if unknown.
+    """
+    # The netCDF4 and h5netcdf backends use "chunksizes"
+    chunks = var.encoding.get("chunks") or var.encoding.get("chunksizes")
+    if (
+        isinstance(chunks, (list, tuple))
+        and len(chunks) == var.ndim
+        and all(isinstance(c, int) and c > 0 for c in chunks)
+    ):
+        return tuple(chunks)
+    return None
+
+
+def get_chunk_shape(var: xr.DataArray) -> tuple[int, ...] | None:
+    """Return the shape of the chunks of `var`, that is, its storage
+    chunks if known, otherwise the largest of its dask chunks
+    per dimension. Returns `None` if `var` is not chunked.
+    Does not read any data.
+    """
+    chunks = get_storage_chunks(var)
+    if chunks is None and var.chunks is not None:
+        chunks = tuple(max(dim_chunks, default=0) for dim_chunks in var.chunks)
+    if chunks is None:
+        return None
+    # Storage chunks may exceed the variable's shape
+    return tuple(min(c, s) for c, s in zip(chunks, var.shape))
+
+
+def format_chunk_shape(dims: tuple[Hashable, ...], shape: tuple[int, ...]) -> str:
+    """Format a chunk shape together with its dimension names,
+    e.g., "{time: 1, lat: 90, lon: 90}".
+    """
+    return "{" + ", ".join(f"{d}: {s}" for d, s in zip(dims, shape)) + "}"
+
+
 def resolve_path(path: str, root_path: str | None = None) -> str:
     abs_level_path = path
     if root_path is not None and not is_absolute_path(path):
@@ -14,6 +14,7 @@ from xrlint.constants import (
     SEVERITY_WARN,
 )
 from xrlint.util.constructible import ValueConstructible
+from xrlint.util.iostats import IOStats
 from xrlint.util.serializable import JsonSerializable
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -105,6 +106,11 @@ class Result(JsonSerializable):
     messages: list[Message] = field(default_factory=list)
     """The array of message objects."""
 
+    io_stats: IOStats | None = None
+    """The requests made to the filesystem for opening and
+    validating the dataset, if they have been recorded.
+    """
+
     @cached_property
     def warning_count(self) -> int:
         """The number of warnings. This includes fixable warnings."""
@@ -2,9 +2,11 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import importlib
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping, Sequence
 from dataclasses import dataclass, field
+from inspect import isclass
 from typing import Any, Callable, Literal, Type
 
 import xarray as xr
@@ -15,6 +17,7 @@ from xrlint.operation import Operation, OperationMeta
 from xrlint.result import Suggestion
 from xrlint.util.constructible import ValueConstructible
 from xrlint.util.formatting import format_message_one_of
+from xrlint.util.iostats import IOStats
 from xrlint.util.serializable import JsonSerializable
 
 
@@ -49,6 +52,16 @@ class RuleContext(ABC):
         `None` if the dataset has not been opened from `file_path`.
         """
 
+    @property
+    @abstractmethod
+    def io_stats(self) -> IOStats | None:
+        """The requests made to the filesystem for opening the dataset,
+        such as their number, the bytes read, and their latencies.
+        `None` if the dataset has not been opened from `file_path`
+        or if its requests are not recorded. Currently, requests are
+        recorded for Zarr datasets opened without a processor.
+        """
+
     @abstractmethod
     def report(
         self,
@@ -84,7 +97,12 @@ class RuleExit(Exception):
 
 
 class RuleOp(ABC):
-    """Define the specific rule validation operations."""
+    """Define the specific rule validation operations.
+
+    Only the validation methods overridden by a rule operation class
+    are called. Nodes of a dataset are not visited at all if no
+    configured rule overrides the methods that validate them.
+    """
 
     def validate_datatree(self, ctx: RuleContext, node: DataTreeNode) -> None:
         """Validate the given datatree node.
@@ -198,6 +216,25 @@ class RuleMeta(OperationMeta):
     by the rule’s implementation and its configured severity.
     """
 
+    needs_data: bool = False
+    """Whether the rule operation reads the data values of variables,
+    e.g., the labels of a coordinate variable. Defaults to `False`.
+
+    Rules that need data are not applied if the linter option
+    `metadata_only` is set.
+    """
+
+    stateful: bool = False
+    """Whether the rule operation keeps state across validations.
+    Defaults to `False`.
+
+    Instances of stateless rule operations are created only once for
+    a given rule configuration and are then reused for all datasets
+    validated by a linter. Set to `True` if your rule operation
+    modifies its instance attributes while validating a dataset,
+    so that a new instance is created for every dataset.
+    """
+
     @classmethod
     def value_name(cls) -> str:
         return "rule_meta"
@@ -240,6 +277,103 @@ class Rule(Operation):
     def value_name(cls) -> str:
         return "rule"
 
+    def __hash__(self) -> int:
+        # Rule metadata is mutable, therefore rules are hashed by
+        # their module and name, like lazy rules.
+        return hash(_get_rule_key(self))
+
+
+class LazyRule(Rule):
+    """A rule whose operation class is imported from its module
+    only when it is first used.
+
+    The module is expected to define the rule using
+    `define_rule()` with the given `registry`, which replaces
+    this lazy rule in the registry by the actual rule.
+    Without a registry, the rule's operation class is looked
+    up in the module by the rule's name.
+
+    Lazy rules are compared and hashed by their module name and
+    rule name, so that neither imports the rule's module.
+
+    Args:
+        meta: the rule's metadata
+        module_name: the fully qualified name of the module
+            that defines the rule
+        registry: the rule registry the rule is defined in
+    """
+
+    # noinspection PyMissingConstructor
+    def __init__(
+        self,
+        meta: RuleMeta,
+        module_name: str,
+        registry: MutableMapping[str, Rule] | None = None,
+    ):
+        # Rule is a frozen dataclass
+        object.__setattr__(self, "meta", meta)
+        object.__setattr__(self, "module_name", module_name)
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_op_class", None)
+
+    @property
+    def op_class(self) -> Type[RuleOp]:
+        """The class the implements the rule's validation operation.
+        Imports the rule's module on first access.
+        """
+        if self._op_class is None:
+            module = importlib.import_module(self.module_name)
+            if self._registry is not None:
+                rule = self._registry.get(self.meta.name)
+                op_class = None if rule is None or rule is self else rule.op_class
+            else:
+                op_class = _find_rule_op_class(module, self.meta.name)
+            if op_class is None:
+                raise ValueError(
+                    f"module {self.module_name!r} does not define"
+                    f" rule {self.meta.name!r}"
+                )
+            object.__setattr__(self, "_op_class", op_class)
+        return self._op_class
+
+    def __reduce__(self):
+        # Pickled, e.g., when passed to worker processes, as the
+        # unresolved manifest entry. The unpickled rule has no
+        # registry, because the rule's module would register the
+        # rule with the worker's registry, not with the unpickled
+        # copy of this rule's registry.
+        return LazyRule, (self.meta, self.module_name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Rule):
+            return _get_rule_key(self) == _get_rule_key(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(_get_rule_key(self))
+
+    def __repr__(self) -> str:
+        return f"LazyRule(meta={self.meta!r}, module_name={self.module_name!r})"
+
+
+def _get_rule_key(rule: Rule) -> tuple[str, str]:
+    if isinstance(rule, LazyRule):
+        return rule.module_name, rule.meta.name
+    return rule.op_class.__module__, rule.meta.name
+
+
+def _find_rule_op_class(module: Any, rule_name: str) -> Type[RuleOp] | None:
+    for value in vars(module).values():
+        if (
+            isclass(value)
+            and issubclass(value, RuleOp)
+            and value.__module__ == module.__name__
+            and getattr(value, "meta", None) is not None
+            and value.meta.name == rule_name
+        ):
+            return value
+    return None
+
 
 @dataclass(frozen=True)
 class RuleConfig(ValueConstructible, JsonSerializable):
@@ -336,6 +470,8 @@ def define_rule(
     description: str | None = None,
     docs_url: str | None = None,
     schema: dict[str, Any] | list[dict[str, Any]] | bool | None = None,
+    needs_data: bool = False,
+    stateful: bool = False,
     registry: MutableMapping[str, Rule] | None = None,
     op_class: Type[RuleOp] | None = None,
 ) -> Callable[[Any], Type[RuleOp]] | Rule:
@@ -357,6 +493,10 @@ def define_rule(
             see [RuleMeta][xrlint.rule.RuleMeta].
         schema: Rule operation arguments schema,
             see [RuleMeta][xrlint.rule.RuleMeta].
+        needs_data: Whether the rule operation reads data values,
+            see [RuleMeta][xrlint.rule.RuleMeta].
+        stateful: Whether the rule operation keeps state across
+            validations, see [RuleMeta][xrlint.rule.RuleMeta].
         registry: Rule registry. Can be provided to register the
             defined rule using its `name`.
         op_class: Rule operation class. Must not be provided
@@ -380,5 +520,7 @@ def define_rule(
             docs_url=docs_url,
             type=type if type else "problem",
             schema=schema,
+            needs_data=needs_data,
+            stateful=stateful,
         ),
     )
@@ -0,0 +1,86 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import collections
+import concurrent.futures
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def map_bounded(
+    executor: concurrent.futures.Executor,
+    function: Callable[..., T],
+    args_iterable: Iterable[tuple[Any, ...]],
+    max_pending: int,
+    ordered: bool = True,
+    discard: Callable[[T], Any] | None = None,
+) -> Iterator[T]:
+    """Apply `function` to each argument tuple of `args_iterable` using
+    `executor` while keeping at most `max_pending` calls in flight.
+
+    In contrast to `Executor.map()`, the argument iterable is consumed
+    lazily, so that memory use is bounded even for very large inputs.
+
+    Args:
+        executor: The executor used to run `function`.
+        function: The function to be applied.
+        args_iterable: Iterable of positional argument tuples.
+        max_pending: Maximum number of submitted but not yet
+            yielded calls. Must be greater than zero.
+        ordered: If `True`, the default, results are yielded in the
+            order of `args_iterable`. Otherwise, results are yielded
+            as soon as they are available.
+        discard: Optional function that is called with the result
+            of every call that has been submitted but whose result
+            is not yielded, because the returned iterator has been
+            closed early or a call failed. Allows for releasing
+            resources held by the results. Calls that are still
+            running are discarded once they complete.
+
+    Returns:
+        An iterator of the function results.
+    """
+    assert max_pending > 0
+    pending: collections.deque[concurrent.futures.Future] = collections.deque()
+    try:
+        for args in args_iterable:
+            pending.append(executor.submit(function, *args))
+            if len(pending) >= max_pending:
+                yield from _drain(pending, ordered, all_pending=False)
+        yield from _drain(pending, ordered, all_pending=True)
+    finally:
+        for future in pending:
+            if not future.cancel() and discard is not None:
+                future.add_done_callback(_discard_callback(discard))
+
+
+def _discard_callback(
+    discard: Callable[[Any], Any],
+) -> Callable[[concurrent.futures.Future], None]:
+    def callback(future: concurrent.futures.Future):
+        if not future.cancelled() and future.exception() is None:
+            discard(future.result())
+
+    return callback
+
+
+def _drain(
+    pending: collections.deque[concurrent.futures.Future],
+    ordered: bool,
+    all_pending: bool,
+) -> Iterator[Any]:
+    while pending:
+        if ordered:
+            yield pending.popleft().result()
+        else:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in [f for f in pending if f in done]:
+                pending.remove(future)
+                yield future.result()
+        if not all_pending:
+            break
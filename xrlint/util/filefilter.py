@@ -2,9 +2,11 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cached_property
 
-from xrlint.util.filepattern import FilePattern
+from xrlint.util.filepattern import FilePattern, FilePatternSet
 
 
 @dataclass(frozen=True)
@@ -46,25 +48,192 @@ class FileFilter:
         )
 
     def accept(self, file_path) -> bool:
-        if self.files:
-            included = False
-            for p in self.files:
-                if p.match(file_path):
-                    included = True
-                    break
-            if not included:
+        return self._matcher.accept(file_path)
+
+    def may_accept_below(self, dir_path: str) -> bool:
+        """Check whether paths below the given directory
+        may be accepted by this filter.
+
+        Args:
+            dir_path: Directory path or URI.
+
+        Returns:
+            `False` if no path below `dir_path` can be accepted,
+                `True` otherwise.
+        """
+        return self._matcher.may_accept_below(dir_path)
+
+    def get_start_dirs(self, dir_path: str) -> list[str]:
+        """Get the directories that contain all paths below
+        the given directory that may be accepted by this filter.
+
+        The result is `[dir_path]` unless the `files` patterns have
+        literal directory prefixes located below `dir_path`.
+
+        Args:
+            dir_path: Directory path or URI.
+
+        Returns:
+            A list of directory paths, which is empty, if no path
+                below `dir_path` can be accepted.
+        """
+        if not self.files:
+            return [dir_path]
+        base_path = dir_path.rstrip("/")
+        start_dirs: set[str] = set()
+        for p in self.files:
+            prefix = p.dir_prefix
+            if prefix.startswith(base_path + "/"):
+                start_dirs.add(prefix)
+            elif (
+                not prefix or base_path == prefix or base_path.startswith(prefix + "/")
+            ):
+                return [dir_path]
+            # else: pattern cannot match below dir_path
+        # Omit directories contained in other directories
+        return [
+            d
+            for d in sorted(start_dirs)
+            if not any(d.startswith(o + "/") for o in start_dirs)
+        ]
+
+    @cached_property
+    def _matcher(self) -> "_FileFilterMatcher":
+        return _FileFilterMatcher(self)
+
+
+class _FileFilterMatcher:
+    """The compiled form of a file filter.
+
+    An ignore pattern excludes a path only if none of the negated
+    ignore patterns that immediately follow it re-includes the path.
+    Therefore, the ignore patterns are split into groups, each comprising
+    a non-negated pattern followed by its negated patterns.
+    The non-negated patterns of all groups without negated patterns
+    are matched in a single pass.
+    """
+
+    def __init__(self, file_filter: FileFilter):
+        self.files = FilePatternSet(file_filter.files) if file_filter.files else None
+        groups = _group_ignores(file_filter.ignores)
+        self.ignores = FilePatternSet(p for p, negated in groups if not negated)
+        self.negated_ignores = tuple(
+            (FilePatternSet((p,)), FilePatternSet(negated))
+            for p, negated in groups
+            if negated
+        )
+
+    def may_accept_below(self, dir_path: str) -> bool:
+        if self.files is not None and not any(
+            p.may_match_below(dir_path) for p in self.files.patterns
+        ):
+            return False
+        return not any(p.match_all_below(dir_path) for p in self.ignores.patterns)
+
+    def accept(self, file_path: str) -> bool:
+        if self.files is not None and not self.files.match(file_path):
+            return False
+        if self.ignores.match(file_path):
+            return False
+        for ignore, negated in self.negated_ignores:
+            if ignore.match(file_path) and not negated.match(file_path):
                 return False
+        return True
+
+
+class FileFilterSet:
+    """A sequence of file filters that is matched in a single pass.
+
+    The distinct patterns of all filters are matched against a path
+    at once using a `FilePatternSet`. The filters that accept the path
+    are then derived from the matching patterns using bit masks
+    that record which filters use a pattern.
+
+    Args:
+        file_filters: The file filters.
+    """
+
+    def __init__(self, file_filters: Iterable[FileFilter]):
+        self.file_filters = tuple(file_filters)
+        files_indices: dict[FilePattern, int] = {}
+        ignores_indices: dict[FilePattern, int] = {}
+        for f in self.file_filters:
+            for p in f.files:
+                files_indices.setdefault(p, len(files_indices))
+            for p in f.ignores:
+                ignores_indices.setdefault(p, len(ignores_indices))
+        # Files patterns come first, followed by the ignore patterns
+        offset = len(files_indices)
+        num_patterns = offset + len(ignores_indices)
+        self._pattern_set = FilePatternSet((*files_indices, *ignores_indices))
+        # Bit i is set, if filter i has no patterns
+        self._empty_bits = 0
+        # Bit i is set, if filter i has no files patterns
+        self._no_files_bits = 0
+        # By pattern index, bit i is set, if filter i includes
+        # files matching the pattern
+        self._files_bits = [0] * num_patterns
+        # By pattern index, bit i is set, if filter i excludes
+        # files matching the pattern
+        self._ignores_bits = [0] * num_patterns
+        # Ignore patterns followed by negated patterns, given as filter bit,
+        # pattern index, and bit mask of the indices of the negated patterns
+        self._negated_ignores: list[tuple[int, int, int]] = []
+        for i, f in enumerate(self.file_filters):
+            bit = 1 << i
+            if f.empty:
+                self._empty_bits |= bit
+                continue
+            if not f.files:
+                self._no_files_bits |= bit
+            for p in f.files:
+                self._files_bits[files_indices[p]] |= bit
+            for p, negated in _group_ignores(f.ignores):
+                index = offset + ignores_indices[p]
+                if not negated:
+                    self._ignores_bits[index] |= bit
+                else:
+                    negated_mask = 0
+                    for n in negated:
+                        negated_mask |= 1 << (offset + ignores_indices[n])
+                    self._negated_ignores.append((bit, index, negated_mask))
+
+    def accept(self, file_path: str) -> int:
+        """Get the filters that accept the given file path.
+
+        Args:
+            file_path: File path or URI.
 
-        excluded = False
-        for p in self.ignores:
-            if not p.negate:
-                if excluded:
-                    # Already excluded, no need to check further
-                    return False
-                excluded = p.match(file_path)
-            else:
-                if excluded and p.match(file_path):
-                    # Negate the old excluded status on match
-                    excluded = False
-
-        return not excluded
+        Returns:
+            An integer in which bit i is set, if filter i accepts `file_path`.
+        """
+        indices = self._pattern_set.match_indices(file_path)
+        files_bits = self._no_files_bits
+        ignores_bits = 0
+        for index in indices:
+            files_bits |= self._files_bits[index]
+            ignores_bits |= self._ignores_bits[index]
+        if self._negated_ignores:
+            matched = 0
+            for index in indices:
+                matched |= 1 << index
+            for bit, index, negated_mask in self._negated_ignores:
+                if matched & (1 << index) and not matched & negated_mask:
+                    ignores_bits |= bit
+        return self._empty_bits | (files_bits & ~ignores_bits)
+
+
+def _group_ignores(
+    ignores: Iterable[FilePattern],
+) -> list[tuple[FilePattern, list[FilePattern]]]:
+    """Split ignore patterns into groups, each comprising a non-negated
+    pattern followed by its negated patterns.
+    """
+    groups: list[tuple[FilePattern, list[FilePattern]]] = []
+    for p in ignores:
+        if not p.negate:
+            groups.append((p, []))
+        elif groups:
+            groups[-1][1].append(p)
+        # else: leading negated patterns cannot re-include anything
+    return groups
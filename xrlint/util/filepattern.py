@@ -2,8 +2,10 @@
 #  This software is distributed under the terms and conditions of the
 #  MIT license (https://mit-license.org/).
 
+import functools
 import platform
 import re
+from collections.abc import Iterable
 from functools import cached_property
 from typing import Literal
 
@@ -84,10 +86,50 @@ class FilePattern:
         """`True` if this matcher's pattern denotes a directory."""
         return self._dir
 
+    @cached_property
+    def dir_prefix(self) -> str:
+        """The literal directory path that precedes the first wildcard
+        of this pattern. All paths matched by this pattern are located
+        below this directory. Empty, if there is no such directory.
+        """
+        if self._empty or self._comment or (self._negate and not self._flip_negate):
+            return ""
+        pattern = self.__pattern
+        index = min(
+            (i for i in (pattern.find("*"), pattern.find("?")) if i >= 0),
+            default=len(pattern),
+        )
+        return pattern[: max(0, pattern.rfind("/", 0, index))]
+
     @cached_property
     def _regex(self) -> re.Pattern:
         return _translate_to_regex(self.__pattern)
 
+    @cached_property
+    def _names(self) -> list[str]:
+        return self.__pattern.split("/")
+
+    @cached_property
+    def _dir_regex(self) -> re.Pattern | None:
+        pattern = self.__pattern
+        if pattern == "**":
+            return re.compile(".*")
+        if pattern.endswith("/**"):
+            return _translate_to_regex(pattern[:-3])
+        return None
+
+    @cached_property
+    def _literal_suffix(self) -> str:
+        """The literal text that every path matched by
+        the regex must end with. May be empty."""
+        pattern = self.__pattern
+        index = max(pattern.rfind("*"), pattern.rfind("?"))
+        suffix = pattern[index + 1 :]
+        if suffix.startswith("/") and pattern[max(0, index - 1) : index + 1] == "**":
+            # The slash following a glob-star is optional
+            suffix = suffix[1:]
+        return suffix
+
     def __str__(self):
         return self.pattern
 
@@ -121,16 +163,160 @@ class FilePattern:
         if self._comment:
             return False
 
-        path = path if not _WIN_OS else path.replace("\\", "")
-        while path and path[-1] == "/":
-            path = path[:-1]
-
-        match_result = self._regex.match(path)
+        match_result = self._regex.match(_normalize_path(path))
         if self._negate and not self._flip_negate:
             return match_result is None
         else:
             return match_result is not None
 
+    def may_match_below(self, dir_path: str) -> bool:
+        """Check whether paths below the given directory may match
+        this pattern.
+
+        Args:
+            dir_path: Directory path or URI
+
+        Returns:
+            `False` if no path below `dir_path` can match,
+                `True` otherwise.
+        """
+        if self._empty or (self._negate and not self._flip_negate):
+            return True
+        if self._comment:
+            return False
+        names = self._names
+        dir_names = _normalize_path(dir_path).split("/")
+        for i, dir_name in enumerate(dir_names):
+            if i >= len(names):
+                return False
+            name = names[i]
+            if "**" in name or "?" in name:
+                # May match any number of path segments
+                return True
+            if not _translate_name_to_regex(name).fullmatch(dir_name):
+                return False
+        return len(names) > len(dir_names)
+
+    def match_all_below(self, dir_path: str) -> bool:
+        """Check whether all paths below the given directory
+        match this pattern.
+
+        Args:
+            dir_path: Directory path or URI
+
+        Returns:
+            `True` if all paths below `dir_path` match,
+                `False` if not or if it cannot be decided.
+        """
+        if self._empty:
+            return True
+        if self._comment or (self._negate and not self._flip_negate):
+            return False
+        dir_regex = self._dir_regex
+        return dir_regex is not None and (
+            dir_regex.match(_normalize_path(dir_path)) is not None
+        )
+
+
+class FilePatternSet:
+    """A set of file patterns that is matched in a single pass.
+
+    The regular expressions of the patterns are combined into
+    alternations, one for every distinct literal suffix of the
+    patterns. A path is then only matched against the alternations
+    whose suffix it ends with.
+
+    Args:
+        patterns: The file patterns.
+    """
+
+    def __init__(self, patterns: Iterable[FilePattern]):
+        self._patterns = tuple(patterns)
+        combined: dict[str, list[tuple[int, FilePattern]]] = {}
+        # Patterns that do not match if their regex matches
+        self._others: tuple[tuple[int, FilePattern], ...] = ()
+        for i, p in enumerate(self._patterns):
+            if p.comment:
+                continue
+            if p.empty or (p.negate and not p._flip_negate):
+                self._others += ((i, p),)
+            else:
+                combined.setdefault(p._literal_suffix, []).append((i, p))
+        self._regexes = tuple(
+            (
+                suffix,
+                re.compile("|".join(f"(?:{p._regex.pattern})" for _, p in members)),
+                # Captures an empty group for every matching pattern
+                re.compile(
+                    "".join(f"(?:(?={p._regex.pattern}()))?" for _, p in members)
+                ),
+                tuple(i for i, _ in members),
+            )
+            for suffix, members in combined.items()
+        )
+
+    @property
+    def patterns(self) -> tuple[FilePattern, ...]:
+        """The file patterns."""
+        return self._patterns
+
+    def match(self, path: str) -> bool:
+        """Match a file system path or URI against the patterns.
+
+        Args:
+            path: File system path or URI
+
+        Returns:
+            `True` if any of the patterns matches `path`.
+        """
+        if self._regexes:
+            normalized_path = _normalize_path(path)
+            for suffix, regex, _, _ in self._regexes:
+                if normalized_path.endswith(suffix) and regex.match(normalized_path):
+                    return True
+        return any(p.match(path) for _, p in self._others)
+
+    def match_indices(self, path: str) -> list[int]:
+        """Match a file system path or URI against the patterns
+        and return the indices of all matching patterns.
+
+        The patterns of every distinct literal suffix `path` ends with
+        are matched using a single regular expression that comprises
+        an optional lookahead with an empty capturing group per pattern.
+
+        Args:
+            path: File system path or URI
+
+        Returns:
+            The indices of the patterns in `patterns` that match `path`.
+        """
+        indices = []
+        if self._regexes:
+            normalized_path = _normalize_path(path)
+            for suffix, _, all_regex, members in self._regexes:
+                if normalized_path.endswith(suffix):
+                    groups = all_regex.match(normalized_path).groups()
+                    indices.extend(
+                        i for i, group in zip(members, groups) if group is not None
+                    )
+        indices.extend(i for i, p in self._others if p.match(path))
+        return indices
+
+
+def _normalize_path(path: str) -> str:
+    path = path if not _WIN_OS else path.replace("\\", "")
+    while path and path[-1] == "/":
+        path = path[:-1]
+    return path
+
+
+@functools.lru_cache(maxsize=1024)
+def _translate_name_to_regex(name: str) -> re.Pattern:
+    """Translate a single path segment of a pattern that
+    contains no glob-stars and no `?` into a regex pattern.
+    """
+    return re.compile(re.escape(name).replace(r"\*", "[^/]*"))
+
 
 def _translate_to_regex(pattern: str) -> re.Pattern:
     """Translate the given
@@ -85,6 +85,17 @@ def format_type_of(value: Any) -> str:
     return value.__name__
 
 
+def format_byte_size(size: int | float) -> str:
+    """Format `size` given in bytes using binary units, e.g., "1.5 MiB"."""
+    if abs(size) < 1024:
+        return f"{size} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} TiB"
+
+
 def format_seq(seq: Sequence, max_count: int = 6) -> str:
     if len(seq) == 0:
         return ""
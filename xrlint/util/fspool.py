@@ -0,0 +1,132 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import contextlib
+import json
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from os import PathLike
+from typing import Any
+
+import fsspec
+import fsspec.core
+
+
+@dataclass(frozen=True)
+class FileSystemPoolStats:
+    """Usage statistics of a filesystem pool."""
+
+    hits: int = 0
+    """Number of requests served by a pooled filesystem instance."""
+
+    misses: int = 0
+    """Number of requests that created a new filesystem instance."""
+
+    size: int = 0
+    """Number of pooled filesystem instances."""
+
+    def __add__(self, other: "FileSystemPoolStats") -> "FileSystemPoolStats":
+        return FileSystemPoolStats(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            size=self.size + other.size,
+        )
+
+    def __sub__(self, other: "FileSystemPoolStats") -> "FileSystemPoolStats":
+        return FileSystemPoolStats(
+            hits=self.hits - other.hits,
+            misses=self.misses - other.misses,
+            size=self.size - other.size,
+        )
+
+
+class FileSystemPool:
+    """A thread-safe pool of filesystem instances keyed by protocol
+    and storage options.
+
+    In contrast to `fsspec.url_to_fs()`, which caches instances of
+    synchronous filesystems per thread, the pool shares a single
+    instance, and hence its sessions and connections, among all
+    threads of a process.
+    """
+
+    def __init__(self):
+        self._filesystems: dict[tuple[str, str], fsspec.AbstractFileSystem] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> FileSystemPoolStats:
+        """The current usage statistics of this pool."""
+        with self._lock:
+            return FileSystemPoolStats(
+                hits=self._hits, misses=self._misses, size=len(self._filesystems)
+            )
+
+    def get_filesystem(
+        self,
+        url: str | PathLike,
+        storage_options: dict[str, Any] | None = None,
+    ) -> tuple[fsspec.AbstractFileSystem, str]:
+        """Get the filesystem for the given URL and storage options.
+
+        Args:
+            url: A file path or URL.
+            storage_options: Options for the filesystem, if any.
+
+        Returns:
+            A pair comprising the filesystem instance and the path
+                of `url` within the filesystem, as returned
+                by `fsspec.url_to_fs()`.
+        """
+        url = str(url)
+        storage_options = storage_options or {}
+        if "::" in url:
+            # Chained URLs comprise multiple filesystems, don't pool them
+            return fsspec.url_to_fs(url, **storage_options)
+        protocol = fsspec.core.split_protocol(url)[0] or "file"
+        fs_class = fsspec.get_filesystem_class(protocol)
+        options = fs_class._get_kwargs_from_urls(url) | storage_options
+        key = (protocol, json.dumps(options, sort_keys=True, default=repr))
+        with self._lock:
+            fs = self._filesystems.get(key)
+            if fs is None:
+                self._misses += 1
+                fs = fs_class(**options)
+                self._filesystems[key] = fs
+            else:
+                self._hits += 1
+        return fs, fs._strip_protocol(url)
+
+    def clear(self):
+        """Remove all filesystem instances and reset the statistics."""
+        with self._lock:
+            self._filesystems.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_fs_pool = FileSystemPool()
+
+
+def get_fs_pool() -> FileSystemPool:
+    """Get the filesystem pool currently in use."""
+    return _fs_pool
+
+
+@contextlib.contextmanager
+def use_fs_pool(fs_pool: FileSystemPool) -> Iterator[FileSystemPool]:
+    """Use the given filesystem pool, e.g., for the duration of a run.
+    As the pool is shared by all threads, this context manager should
+    be used by the main thread only.
+    """
+    global _fs_pool
+    prev_fs_pool = _fs_pool
+    _fs_pool = fs_pool
+    try:
+        yield fs_pool
+    finally:
+        _fs_pool = prev_fs_pool
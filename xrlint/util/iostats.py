@@ -0,0 +1,172 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import fsspec
+from fsspec.asyn import AsyncFileSystem
+
+from xrlint.util.serializable import JsonSerializable
+
+
+@dataclass(frozen=True)
+class IOStats(JsonSerializable):
+    """Statistics of the requests made to a filesystem
+    for a single dataset.
+    """
+
+    get_count: int = 0
+    """Number of read requests, e.g., GET requests for object stores."""
+
+    head_count: int = 0
+    """Number of requests for file information,
+    e.g., HEAD requests for object stores.
+    """
+
+    list_count: int = 0
+    """Number of directory listings, e.g., LIST requests for object stores."""
+
+    bytes_read: int = 0
+    """Number of bytes read by read requests."""
+
+    total_latency: float = 0.0
+    """The sum of the durations of all requests in seconds."""
+
+    max_latency: float = 0.0
+    """The duration of the slowest request in seconds."""
+
+    @property
+    def request_count(self) -> int:
+        """The total number of requests."""
+        return self.get_count + self.head_count + self.list_count
+
+
+class InstrumentedFileSystem(AsyncFileSystem):
+    """A filesystem that delegates to another filesystem and
+    records the requests made, see `io_stats`.
+
+    Only the basic operations are delegated, namely reading files,
+    getting file information, and listing directories.
+    All other operations are derived from them by
+    `fsspec.asyn.AsyncFileSystem`, so that every request
+    is accounted for. Reading many files or byte ranges at once,
+    e.g., using `cat()` or `cat_ranges()`, reads them concurrently,
+    so that asynchronous filesystems such as S3 keep their concurrency.
+
+    Args:
+        fs: The filesystem to delegate to. Operations of asynchronous
+            filesystems are run in their event loop, operations of
+            other filesystems are run in worker threads.
+        known_files: Optional contents of files that have already been
+            fetched, e.g., metadata documents, mapping file paths to
+            their contents, or to `None` for files known not to exist.
+            Reading these files makes no requests.
+        asynchronous: Whether the filesystem is used from within
+            a coroutine, e.g., by a Zarr store.
+    """
+
+    cachable = False
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        known_files: Mapping[str, bytes | None] | None = None,
+        asynchronous: bool = False,
+    ):
+        super().__init__(asynchronous=asynchronous)
+        self.fs = fs
+        self.known_files = known_files or {}
+        self.protocol = fs.protocol
+        # Paths must be normalized the way the wrapped filesystem does it
+        self.root_marker = fs.root_marker
+        self._strip_protocol = fs._strip_protocol
+        self._lock = threading.Lock()
+        self._get_count = 0
+        self._head_count = 0
+        self._list_count = 0
+        self._bytes_read = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def io_stats(self) -> IOStats:
+        """The statistics of the requests made so far."""
+        with self._lock:
+            return IOStats(
+                get_count=self._get_count,
+                head_count=self._head_count,
+                list_count=self._list_count,
+                bytes_read=self._bytes_read,
+                total_latency=self._total_latency,
+                max_latency=self._max_latency,
+            )
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        if path in self.known_files:
+            content = self.known_files[path]
+            if content is None:
+                raise FileNotFoundError(path)
+            return content[start:end]
+        t0 = time.perf_counter()
+        try:
+            data = await self._delegate(
+                "cat_file", path, start=start, end=end, **kwargs
+            )
+        finally:
+            self._record("get", time.perf_counter() - t0)
+        with self._lock:
+            self._bytes_read += len(data)
+        return data
+
+    async def _info(self, path, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await self._delegate("info", path, **kwargs)
+        finally:
+            self._record("head", time.perf_counter() - t0)
+
+    async def _ls(self, path, detail=True, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await self._delegate("ls", path, detail=detail, **kwargs)
+        finally:
+            self._record("list", time.perf_counter() - t0)
+
+    def _open(self, path, mode="rb", **kwargs) -> Any:
+        # Reads from file objects are not accounted for, but
+        # opening files is done by HEAD requests in most cases
+        t0 = time.perf_counter()
+        try:
+            return self.fs.open(path, mode=mode, **kwargs)
+        finally:
+            self._record("head", time.perf_counter() - t0)
+
+    async def _delegate(self, method_name: str, *args, **kwargs) -> Any:
+        fs = self.fs
+        if not fs.async_impl:
+            method = getattr(fs, method_name)
+            return await asyncio.to_thread(method, *args, **kwargs)
+        coroutine = getattr(fs, f"_{method_name}")(*args, **kwargs)
+        loop = None if fs.asynchronous else fs.loop
+        if loop is None or loop is asyncio.get_running_loop():
+            return await coroutine
+        # Sessions of asynchronous filesystems are bound to their loop
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        return await asyncio.wrap_future(future)
+
+    def _record(self, kind: str, latency: float):
+        with self._lock:
+            if kind == "get":
+                self._get_count += 1
+            elif kind == "head":
+                self._head_count += 1
+            else:
+                self._list_count += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
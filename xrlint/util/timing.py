@@ -0,0 +1,193 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import contextlib
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from tabulate import tabulate
+
+from xrlint.util.serializable import JsonValue
+
+PHASE_OPEN = "open"
+PHASE_PREPROCESS = "preprocess"
+PHASE_POSTPROCESS = "postprocess"
+
+
+@dataclass
+class TimingEntry:
+    """Accumulated wall time of a measured operation."""
+
+    count: int = 0
+    """Number of calls."""
+
+    time: float = 0.0
+    """Total wall time of all calls in seconds."""
+
+    def add(self, count: int, time: float):
+        self.count += count
+        self.time += time
+
+    def to_json(self) -> JsonValue:
+        return {"count": self.count, "time": self.time}
+
+
+class TimingProfile:
+    """A thread-safe profile that accumulates the wall time and the
+    number of calls of the rules' validation methods per rule
+    and node kind, as well as the time of the phases of opening,
+    preprocessing, and postprocessing datasets.
+
+    The node kinds are named after the validation methods,
+    that is, `"datatree"`, `"dataset"`, `"variable"`, `"attrs"`,
+    and `"attr"`.
+    """
+
+    def __init__(self):
+        self._rules: dict[str, dict[str, TimingEntry]] = {}
+        self._phases: dict[str, TimingEntry] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Profiles are passed from worker processes, locks cannot be pickled
+        with self._lock:
+            return {"rules": self._rules, "phases": self._phases}
+
+    def __setstate__(self, state):
+        self._rules = state["rules"]
+        self._phases = state["phases"]
+        self._lock = threading.Lock()
+
+    @property
+    def rules(self) -> dict[str, dict[str, TimingEntry]]:
+        """Maps rule identifiers to their timing entries per node kind."""
+        return self._rules
+
+    @property
+    def phases(self) -> dict[str, TimingEntry]:
+        """Maps phase names to their timing entries."""
+        return self._phases
+
+    def add_rule_time(self, rule_id: str, node_kind: str, time: float, count=1):
+        """Add the time of `count` calls of a rule's validation method."""
+        with self._lock:
+            kinds = self._rules.get(rule_id)
+            if kinds is None:
+                kinds = self._rules[rule_id] = {}
+            entry = kinds.get(node_kind)
+            if entry is None:
+                entry = kinds[node_kind] = TimingEntry()
+            entry.add(count, time)
+
+    def add_phase_time(self, phase: str, time: float, count=1):
+        """Add the time of `count` executions of a phase such as
+        `"open"` or `"preprocess"`.
+        """
+        with self._lock:
+            entry = self._phases.get(phase)
+            if entry is None:
+                entry = self._phases[phase] = TimingEntry()
+            entry.add(count, time)
+
+    def merge(self, other: "TimingProfile"):
+        """Add the entries of `other` to this profile."""
+        for rule_id, kinds in other.rules.items():
+            for node_kind, entry in kinds.items():
+                self.add_rule_time(rule_id, node_kind, entry.time, entry.count)
+        for phase, entry in other.phases.items():
+            self.add_phase_time(phase, entry.time, entry.count)
+
+    def get_rule_totals(self) -> list[tuple[str, TimingEntry]]:
+        """Get the total timing entries of all rules,
+        the slowest rule first.
+        """
+        with self._lock:
+            totals = []
+            for rule_id, kinds in self._rules.items():
+                total = TimingEntry()
+                for entry in kinds.values():
+                    total.add(entry.count, entry.time)
+                totals.append((rule_id, total))
+        return sorted(totals, key=lambda item: item[1].time, reverse=True)
+
+    def format_table(self, top_n: int = 10) -> str:
+        """Format the `top_n` slowest rules and the phases
+        as plain text tables.
+        """
+        totals = self.get_rule_totals()
+        total_time = sum(entry.time for _, entry in totals)
+        rows = []
+        for rule_id, entry in totals[:top_n]:
+            kinds = self._rules[rule_id]
+            rows.append(
+                [
+                    rule_id,
+                    f"{1000 * entry.time:.3f}",
+                    f"{100 * entry.time / total_time:.1f}%" if total_time else "-",
+                    entry.count,
+                    ", ".join(
+                        f"{k}: {v.count}"
+                        for k, v in sorted(kinds.items(), key=lambda kv: kv[0])
+                    ),
+                ]
+            )
+        rules_table = tabulate(
+            rows,
+            headers=["Rule", "Time (ms)", "Relative", "Calls", "Calls per node kind"],
+            tablefmt="plain",
+            colalign=("left", "right", "right", "right", "left"),
+            disable_numparse=True,
+        )
+        phases_table = tabulate(
+            [
+                [phase, f"{1000 * entry.time:.3f}", entry.count]
+                for phase, entry in sorted(self._phases.items())
+            ],
+            headers=["Phase", "Time (ms)", "Count"],
+            tablefmt="plain",
+            colalign=("left", "right", "right"),
+            disable_numparse=True,
+        )
+        return f"{rules_table}\n\n{phases_table}"
+
+    def to_json(self) -> JsonValue:
+        return {
+            "rules": {
+                rule_id: {
+                    node_kind: entry.to_json()
+                    for node_kind, entry in self._rules[rule_id].items()
+                }
+                for rule_id, _ in self.get_rule_totals()
+            },
+            "phases": {phase: entry.to_json() for phase, entry in self._phases.items()},
+        }
+
+
+_timing_profile: TimingProfile | None = None
+
+
+def get_timing_profile() -> TimingProfile | None:
+    """Get the timing profile currently in use,
+    or `None` if timing is disabled.
+    """
+    return _timing_profile
+
+
+@contextlib.contextmanager
+def use_timing_profile(
+    timing_profile: TimingProfile | None,
+) -> Iterator[TimingProfile | None]:
+    """Use the given timing profile, e.g., for the duration of a run.
+    Passing `None` disables timing.
+    As the profile is shared by all threads, this context manager
+    should be used by the main thread only.
+    """
+    global _timing_profile
+    prev_timing_profile = _timing_profile
+    _timing_profile = timing_profile
+    try:
+        yield timing_profile
+    finally:
+        _timing_profile = prev_timing_profile
@@ -0,0 +1,207 @@
+#  Copyright © 2025 Brockmann Consult GmbH.
+#  This software is distributed under the terms and conditions of the
+#  MIT license (https://mit-license.org/).
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, ContextManager, TextIO, TypeVar
+
+T = TypeVar("T")
+
+TraceEvent = dict[str, Any]
+"""An event of the Chrome trace event format."""
+
+DEFAULT_BUFFER_SIZE = 10000
+
+
+class Tracer:
+    """A thread-safe recorder of spans, that is, named periods
+    of time, in the JSON trace event format used by Chrome's
+    `about:tracing` and by the Perfetto UI.
+
+    Spans are recorded as complete events (`"ph": "X"`) whose
+    timestamps are taken from `time.perf_counter()`, so that the
+    spans recorded by different processes on the same host can
+    be combined.
+
+    Args:
+        stream: If given, events are written to this text stream
+            whenever `buffer_size` events have been recorded and
+            when `close()` is called. Otherwise, events are kept
+            in memory, see `pop_events()`.
+        buffer_size: Number of events kept in memory before
+            they are written to `stream`.
+    """
+
+    def __init__(
+        self, stream: TextIO | None = None, buffer_size: int = DEFAULT_BUFFER_SIZE
+    ):
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._events: list[TraceEvent] = []
+        self._event_count = 0
+        self._lock = threading.Lock()
+        if stream is not None:
+            stream.write('{"displayTimeUnit": "ms", "traceEvents": [')
+            self._add_event(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "args": {"name": "xrlint"},
+                }
+            )
+
+    @property
+    def event_count(self) -> int:
+        """Number of events recorded so far."""
+        return self._event_count
+
+    def span(
+        self, name: str, cat: str, args: dict[str, Any] | None = None
+    ) -> ContextManager[None]:
+        """Record a span for the duration of a `with` block.
+
+        Args:
+            name: Span name, e.g., a rule identifier.
+            cat: Span category, e.g., `"rule"`.
+            args: Optional span arguments such as a file path.
+        """
+        return self._span(name, cat, args)
+
+    @contextlib.contextmanager
+    def _span(self, name: str, cat: str, args: dict[str, Any] | None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, cat, start, time.perf_counter(), args)
+
+    def add_span(
+        self,
+        name: str,
+        cat: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ):
+        """Record a span given by its start and end time
+        as returned by `time.perf_counter()`.
+        """
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self._add_event(event)
+
+    def add_events(self, events: Iterable[TraceEvent]):
+        """Add events recorded by another tracer,
+        e.g., in a worker process.
+        """
+        for event in events:
+            self._add_event(event)
+
+    def pop_events(self) -> list[TraceEvent]:
+        """Remove and return the events kept in memory."""
+        with self._lock:
+            events = self._events
+            self._events = []
+        return events
+
+    def close(self):
+        """Write the remaining events to the stream, if any,
+        and complete the trace document.
+        """
+        if self._stream is not None:
+            with self._lock:
+                self._flush()
+                self._stream.write("\n]}\n")
+                self._stream = None
+
+    def _add_event(self, event: TraceEvent):
+        with self._lock:
+            self._events.append(event)
+            self._event_count += 1
+            if self._stream is not None and len(self._events) >= self._buffer_size:
+                self._flush()
+
+    def _flush(self):
+        stream = self._stream
+        written_count = self._event_count - len(self._events)
+        for event in self._events:
+            stream.write(",\n" if written_count else "\n")
+            stream.write(json.dumps(event))
+            written_count += 1
+        self._events = []
+
+
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer | None:
+    """Get the tracer currently in use, or `None` if tracing is disabled."""
+    return _tracer
+
+
+@contextlib.contextmanager
+def use_tracer(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Use the given tracer, e.g., for the duration of a run.
+    Passing `None` disables tracing.
+    As the tracer is shared by all threads, this context manager
+    should be used by the main thread only.
+    """
+    global _tracer
+    prev_tracer = _tracer
+    _tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _tracer = prev_tracer
+
+
+def trace_span(
+    name: str, cat: str, args: dict[str, Any] | None = None
+) -> ContextManager[None]:
+    """Record a span for the duration of a `with` block using the
+    tracer in use. Does nothing if tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, cat, args)
+
+
+def trace_iter(
+    iterable: Iterable[T], name: str, cat: str, args: dict[str, Any] | None = None
+) -> Iterator[T]:
+    """Iterate `iterable` and record a span for the time it takes
+    to produce each item, e.g., for listing directories lazily.
+    Iterates `iterable` directly if tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            tracer.add_span(name, cat, start, time.perf_counter(), args)
+            return
+        tracer.add_span(name, cat, start, time.perf_counter(), args)
+        yield item